@@ -1,10 +1,17 @@
 from collections import defaultdict as _defaultdict
 from copy import deepcopy as _deepcopy
 import enum as _enum
+import hashlib as _hashlib
 import re as _re
 
+from .. import config as _config
 from ..geant4 import Material as _Material
 from ..geant4 import Element as _Element
+from ..geant4 import Isotope as _Isotope
+from ..geant4 import MaterialBase as _MaterialBase
+from ..geant4.solid import SolidBase as _SolidBase
+from ..geant4.LogicalVolume import _meshLogicalVolumes
+from ..geant4.solid.MeshCache import meshCache as _meshCache
 from ..gdml import Units as _Units
 
 
@@ -256,7 +263,143 @@ class ComparisonResult:
             print(" ")  # for a new line  # noqa: T201
 
 
-def gdmlFiles(referenceFile, otherFile, tests=Tests(), includeAllTestResults=False):
+class _TestsDone(set):
+    """
+    Set of the (reference, other) name pairs of the comparisons already done in a
+    recursive comparison, e.g. ("lv_test_a", "lv_test_b"), together with the structural
+    hashes (see structuralHash) computed so far. If meshTests is a list the mesh tests
+    of logical volumes are not done directly but collected there.
+    """
+
+    def __init__(self, done=()):
+        super().__init__(done)
+        self.hashes = {}  # id(obj) : (obj, hash)
+        self.meshTests = None  # deferred [(test name, reference lv, other lv)], see geometry
+
+
+def _testsDone(testsAlreadyDone):
+    """
+    Bookkeeping for a comparison. A list of pairs (as used by earlier versions) or None
+    starts a new set.
+    """
+    if isinstance(testsAlreadyDone, _TestsDone):
+        return testsAlreadyDone
+    return _TestsDone(testsAlreadyDone or ())
+
+
+def structuralHash(obj, hashes=None):
+    """
+    Hash of everything the comparison tests look at in obj and, recursively, in its
+    daughters: names, types, evaluated solid parameters, materials, placements and copy
+    numbers. If two objects have the same hash all tests pass for them so the detailed
+    comparison can be skipped.
+
+    The hash is computed bottom-up and memoised per object in hashes, so shared logical
+    volumes, solids and materials are only hashed once. Returns None if it cannot be
+    determined (e.g. a parameter fails to evaluate), in which case the object is always
+    compared in detail.
+
+    :param obj: logical, physical, assembly or replica volume, solid or material
+    :param hashes: (optional) memo of id(obj) : (obj, hash) to reuse between calls
+    :type  hashes: dict
+    """
+    if hashes is None:
+        hashes = {}
+
+    entry = hashes.get(id(obj))
+    if entry is None:
+        try:
+            data = _structuralHashData(obj, hashes)
+        except Exception:
+            data = None
+        h = None if data is None else _hashlib.sha1(repr(data).encode()).hexdigest()
+        # keep a reference to the object so the id is not reused while memoised
+        entry = (obj, h)
+        hashes[id(obj)] = entry
+    return entry[1]
+
+
+def _structuralHashData(obj, hashes):
+    if isinstance(obj, _SolidBase):
+        key = obj.meshCacheKey()
+        if key is None:
+            return None
+        return ["solid", obj.name, key]
+    elif isinstance(obj, _MaterialBase):
+        return _materialHashData(obj, hashes)
+
+    objType = getattr(obj, "type", None)
+    if objType == "logical":
+        data = [objType, obj.name]
+        children = [obj.solid, obj.material, *obj.daughterVolumes]
+    elif objType == "placement":
+        scale = obj.scale.eval() if obj.scale else [1.0, 1.0, 1.0]
+        data = [objType, obj.name, obj.rotation.eval(), obj.position.eval(), scale]
+        data += [obj.copyNumber]
+        children = [obj.logicalVolume]
+    elif objType == "assembly":
+        data = [objType, obj.name]
+        children = list(obj.daughterVolumes)
+    elif objType == "replica":
+        data = [objType, obj.name, obj.axis, obj.nreplicas, obj.width, obj.offset]
+        data += [obj.wunit, obj.ounit]
+        # the mother is only compared non-recursively, i.e. without its daughters
+        mother = obj.motherVolume
+        data += [mother.name, len(mother.daughterVolumes)]
+        children = [obj.logicalVolume, mother.solid, mother.material]
+    else:
+        # division and parameterised volumes are only compared by type
+        return [objType, getattr(obj, "name", None)]
+
+    for child in children:
+        h = structuralHash(child, hashes)
+        if h is None:
+            return None
+        data.append(h)
+    return data
+
+
+def _materialHashData(obj, hashes):
+    if isinstance(obj, _Isotope):
+        return [obj.type, obj.name, obj.Z, obj.N, obj.a]
+
+    data = [type(obj).__name__, obj.name, getattr(obj, "type", None)]
+    if isinstance(obj, _Material):
+        data += [obj.density, obj.number_of_components]
+    elif isinstance(obj, _Element):
+        data += [obj.A, obj.Z, obj.n_comp]
+
+    # components are compared sorted by name
+    components = []
+    for component in sorted(getattr(obj, "components", []), key=lambda c: c[0].name):
+        h = structuralHash(component[0], hashes)
+        if h is None:
+            return None
+        components.append([h, *component[1:]])
+    data.append(components)
+    return data
+
+
+def _identical(reference, other, includeAllTestResults, testsAlreadyDone):
+    """
+    True if reference and other have the same structural hash, so all tests would pass.
+    Never true when all test results are to be documented as then each test is needed.
+    """
+    if includeAllTestResults:
+        return False
+    referenceHash = structuralHash(reference, testsAlreadyDone.hashes)
+    if referenceHash is None:
+        return False
+    return referenceHash == structuralHash(other, testsAlreadyDone.hashes)
+
+
+def _identicalResult():
+    result = ComparisonResult()
+    result.result = TestResult.Passed
+    return result
+
+
+def gdmlFiles(referenceFile, otherFile, tests=Tests(), includeAllTestResults=False, nProcesses=1):
     """
     :param referenceFile: GDML file to use as a reference.
     :type  referenceFile: str.
@@ -266,6 +409,8 @@ def gdmlFiles(referenceFile, otherFile, tests=Tests(), includeAllTestResults=Fal
     :type  tests: pyg4ometry.compare._Compare.Tests.
     :param includeAllTestResults: document all tests attempted in result.
     :type  includeAllTestResults: bool.
+    :param nProcesses: number of processes for the mesh tests, see geometry.
+    :type  nProcesses: int.
     """
     from .. import gdml as gd
 
@@ -275,10 +420,10 @@ def gdmlFiles(referenceFile, otherFile, tests=Tests(), includeAllTestResults=Fal
     otherReader = gd.Reader(otherFile)
     otherReg = otherReader.getRegistry()
     otherWorldLV = otherReg.getWorldVolume()
-    return geometry(referenceWorldLV, otherWorldLV, tests, includeAllTestResults)
+    return geometry(referenceWorldLV, otherWorldLV, tests, includeAllTestResults, nProcesses)
 
 
-def geometry(referenceLV, otherLV, tests=Tests(), includeAllTestResults=False):
+def geometry(referenceLV, otherLV, tests=Tests(), includeAllTestResults=False, nProcesses=1):
     """
     :param referenceLV: LogicalVolume instance to compare against.
     :type  referenceLV: LogicalVolume
@@ -288,11 +433,97 @@ def geometry(referenceLV, otherLV, tests=Tests(), includeAllTestResults=False):
     :type  tests: pyg4ometry.compare._Compare.Tests.
     :param includeAllTestResults: document all tests attempted in result.
     :type  includeAllTestResults: bool.
+    :param nProcesses: number of processes for the mesh tests (shapeExtent, shapeVolume and shapeArea).
+    :type  nProcesses: int.
+
+    If nProcesses is greater than 1 the mesh tests of the logical volumes are collected
+    during the comparison and done at the end: the logical volumes are meshed and the
+    bounding boxes, volumes and areas of their meshes are computed in a pool of worker
+    processes, then the tests are run here with these values.
     """
-    # note we should explicitly pass the empty list to overwrite the 1 definition python will have to this argument
+    testsAlreadyDone = _TestsDone()
+    if nProcesses > 1:
+        testsAlreadyDone.meshTests = []
+
     result = logicalVolumes(
-        referenceLV, otherLV, tests, True, includeAllTestResults, testsAlreadyDone=[]
+        referenceLV, otherLV, tests, True, includeAllTestResults, testsAlreadyDone
     )
+
+    if testsAlreadyDone.meshTests:
+        result += _logicalVolumeMeshes(testsAlreadyDone.meshTests, tests, nProcesses)
+    return result
+
+
+_meshWorkerMeshes = []
+_meshWorkerTests = None
+
+
+def _meshWorkerRun(index):
+    mesh = _meshWorkerMeshes[index]
+    boundingBox = mesh.getBoundingBox() if _meshWorkerTests.shapeExtent else None
+    volume = mesh.volume() if _meshWorkerTests.shapeVolume else None
+    area = mesh.area() if _meshWorkerTests.shapeArea else None
+    return boundingBox, volume, area
+
+
+def _logicalVolumeMeshes(meshTests, tests, nProcesses=1):
+    """
+    Mesh tests for a list of (test name, reference lv, other lv). The logical volumes
+    are meshed and the measures needed by the tests are computed for each mesh in a pool
+    of nProcesses forked worker processes and cached in the meshes. Where fork is not
+    available they are computed here.
+    """
+    import multiprocessing as _multiprocessing
+
+    from .. import visualisation as _vis
+
+    global _meshWorkerMeshes
+    global _meshWorkerTests
+
+    if _config.doMeshing:
+        lvs = {}
+        for _, rlv, olv in meshTests:
+            for lv in (rlv, olv):
+                if not lv.meshed:
+                    lvs[id(lv)] = lv
+        _meshLogicalVolumes(list(lvs.values()), nProcesses)
+
+    # meshes of solids with the same key (e.g. in the reference and the other geometry)
+    # are the same so their measures are only computed once
+    groups = {}  # solid key : [meshes]
+    seen = set()  # (solid key, id(mesh))
+    for _, rlv, olv in meshTests:
+        if rlv.mesh and olv.mesh:
+            for mesh in (rlv.mesh, olv.mesh):
+                if type(mesh) is _vis.Mesh:
+                    key = _meshCache.solidKey(mesh.solid)
+                    key = id(mesh) if key is None else key
+                    if (key, id(mesh)) not in seen:
+                        seen.add((key, id(mesh)))
+                        groups.setdefault(key, []).append(mesh)
+
+    if (
+        nProcesses > 1
+        and len(groups) > 1
+        and (tests.shapeExtent or tests.shapeVolume or tests.shapeArea)
+        and "fork" in _multiprocessing.get_all_start_methods()
+    ):
+        _meshWorkerMeshes = [meshes[0] for meshes in groups.values()]
+        _meshWorkerTests = tests
+        try:
+            with _multiprocessing.get_context("fork").Pool(nProcesses) as pool:
+                measures = pool.map(_meshWorkerRun, range(len(_meshWorkerMeshes)), 1)
+        finally:
+            _meshWorkerMeshes = []
+            _meshWorkerTests = None
+
+        for meshes, m in zip(groups.values(), measures):
+            for mesh in meshes:
+                mesh._cacheMeasures(*m)
+
+    result = ComparisonResult()
+    for testName, rlv, olv in meshTests:
+        result += _meshes(testName, rlv.mesh, olv.mesh, tests)
     return result
 
 
@@ -302,15 +533,22 @@ def logicalVolumes(
     tests,
     recursive=False,
     includeAllTestResults=False,
-    testsAlreadyDone=[],
+    testsAlreadyDone=None,
 ):
     """
     Compare two LogicalVolume instances with a set of tests.
 
-    testsAlreadyDone should be purposively given as an empty list if using more than once. This
-    is an artefact of the only way we can nicely pass by reference a set of tests while we use
-    these functions recursively. However, this is defined on import and must be updated if reused.
+    Subtrees with the same structural hash (see structuralHash) are identical and are
+    not compared in detail unless includeAllTestResults is True.
+
+    testsAlreadyDone is the bookkeeping of the comparisons already done, shared while
+    these functions recurse. A new one is started if it is None.
     """
+    testsAlreadyDone = _testsDone(testsAlreadyDone)
+    if _identical(referenceLV, otherLV, includeAllTestResults, testsAlreadyDone):
+        testsAlreadyDone.add(("lv_test_" + referenceLV.name, "lv_test_" + otherLV.name))
+        return _identicalResult()
+
     result = ComparisonResult()
 
     rlv = referenceLV  # shortcuts
@@ -331,9 +569,7 @@ def logicalVolumes(
             "mat_test_" + olv.material.name,
         ) not in testsAlreadyDone:
             result += materials(rlv.material, olv.material, tests, testName, includeAllTestResults)
-            testsAlreadyDone.append(
-                ("mat_test_" + rlv.material.name, "mat_test_" + olv.material.name)
-            )
+            testsAlreadyDone.add(("mat_test_" + rlv.material.name, "mat_test_" + olv.material.name))
 
     if tests.nDaughters:
         if len(olv.daughterVolumes) != len(rlv.daughterVolumes):
@@ -343,11 +579,15 @@ def logicalVolumes(
         elif includeAllTestResults:
             result["nDaughters"] += [TestResultNamed(testName, TestResult.Passed)]
 
-    result += _meshes(testName, rlv.mesh, olv.mesh, tests)
+    if testsAlreadyDone.meshTests is None:
+        result += _meshes(testName, rlv.mesh, olv.mesh, tests)
+    else:
+        # done for all logical volumes at once at the end, see geometry
+        testsAlreadyDone.meshTests.append((testName, rlv, olv))
 
     # if not recursive return now and don't loop over daughter physical volumes
     if not recursive:
-        testsAlreadyDone.append(("lv_test_" + referenceLV.name, "lv_test_" + otherLV.name))
+        testsAlreadyDone.add(("lv_test_" + referenceLV.name, "lv_test_" + otherLV.name))
         return result
 
     # test daughters are the same - could even be same number but different
@@ -415,7 +655,7 @@ def logicalVolumes(
     if tests.names or tests.namesIgnorePointer:
         result = _testDaughterNameSets(rSet, oSet, result, testName, includeAllTestResults)
 
-    testsAlreadyDone.append(("lv_test_" + referenceLV.name, "lv_test_" + otherLV.name))
+    testsAlreadyDone.add(("lv_test_" + referenceLV.name, "lv_test_" + otherLV.name))
     return result
 
 
@@ -426,11 +666,16 @@ def physicalVolumes(
     recursive=False,
     lvName="",
     includeAllTestResults=False,
-    testsAlreadyDone=[],
+    testsAlreadyDone=None,
 ):
     """
     lvName is an optional parent object name to help in print out details decode where the placement is.
     """
+    testsAlreadyDone = _testsDone(testsAlreadyDone)
+    if _identical(referencePV, otherPV, includeAllTestResults, testsAlreadyDone):
+        testsAlreadyDone.add(("pv_test_" + referencePV.name, "pv_test_" + otherPV.name))
+        return _identicalResult()
+
     result = ComparisonResult()
 
     rpv = referencePV  # shortcuts
@@ -509,7 +754,7 @@ def physicalVolumes(
                 testsAlreadyDone,
             )
 
-    testsAlreadyDone.append(("pv_test_" + referencePV.name, "pv_test_" + otherPV.name))
+    testsAlreadyDone.add(("pv_test_" + referencePV.name, "pv_test_" + otherPV.name))
     return result
 
 
@@ -519,8 +764,13 @@ def assemblyVolumes(
     tests,
     recursive=False,
     includeAllTestResults=False,
-    testsAlreadyDone=[],
+    testsAlreadyDone=None,
 ):
+    testsAlreadyDone = _testsDone(testsAlreadyDone)
+    if _identical(referenceAV, otherAV, includeAllTestResults, testsAlreadyDone):
+        testsAlreadyDone.add(("av_test_" + referenceAV.name, "av_test_" + otherAV.name))
+        return _identicalResult()
+
     result = ComparisonResult()
 
     rav = referenceAV
@@ -616,7 +866,7 @@ def assemblyVolumes(
             for nameToUse, rMesh, oMesh in zip(i_rMeshName, i_rMeshes, i_oMeshes):
                 result += _meshes(nameToUse, rMesh, oMesh, tests)
 
-    testsAlreadyDone.append(("av_test_" + referenceAV.name, "av_test_" + otherAV.name))
+    testsAlreadyDone.add(("av_test_" + referenceAV.name, "av_test_" + otherAV.name))
     return result
 
 
@@ -629,8 +879,9 @@ def _checkPVLikeDaughters(
     result,
     recursive=True,
     includeAllTestResults=True,
-    testsAlreadyDone=[],
+    testsAlreadyDone=None,
 ):
+    testsAlreadyDone = _testsDone(testsAlreadyDone)
     rDaughter = referencePVLikeObject
     oDaughter = otherPVLikeObject
     r = recursive
@@ -659,7 +910,7 @@ def _checkPVLikeDaughters(
     else:
         # LN: don't know what to SkinSurface, BorderSurface and Loop
         pass
-    testsAlreadyDone.append(("daughter_test_" + rDaughter.name, "daughter_test_" + oDaughter.name))
+    testsAlreadyDone.add(("daughter_test_" + rDaughter.name, "daughter_test_" + oDaughter.name))
 
     return result
 
@@ -704,8 +955,13 @@ def replicaVolumes(
     tests,
     recursive=True,
     includeAllTestResults=False,
-    testsAlreadyDone=[],
+    testsAlreadyDone=None,
 ):
+    testsAlreadyDone = _testsDone(testsAlreadyDone)
+    if _identical(referenceRV, otherRV, includeAllTestResults, testsAlreadyDone):
+        testsAlreadyDone.add(("rv_test_" + referenceRV.name, "rv_test_" + otherRV.name))
+        return _identicalResult()
+
     result = ComparisonResult()
 
     rrv = referenceRV
@@ -795,11 +1051,13 @@ def replicaVolumes(
         result["replicaOunit"] += [TestResultNamed(testName, TestResult.Passed)]
 
     result.result = result.result | TestResult.Passed
-    testsAlreadyDone.append(("rv_test_" + rrv.name, "rv_test_" + orv.name))
+    testsAlreadyDone.add(("rv_test_" + rrv.name, "rv_test_" + orv.name))
     return result
 
 
-def divisionVolumes(referenceRV, otherRV, tests, includeAllTestResults=False, testsAlreadyDone=[]):
+def divisionVolumes(
+    referenceRV, otherRV, tests, includeAllTestResults=False, testsAlreadyDone=None
+):
     """
     Compare two DivisionVolume instances with a set of tests.
     """
@@ -808,7 +1066,7 @@ def divisionVolumes(referenceRV, otherRV, tests, includeAllTestResults=False, te
 
 
 def parameterisedVolumes(
-    referenceRV, otherRV, tests, includeAllTestResults=False, testsAlreadyDone=[]
+    referenceRV, otherRV, tests, includeAllTestResults=False, testsAlreadyDone=None
 ):
     """
     Compare two ParameterisedVolume instances with a set of tests.
@@ -823,7 +1081,7 @@ def materials(
     tests,
     lvName="",
     includeAllTestResults=False,
-    testsAlreadyDone=[],
+    testsAlreadyDone=None,
 ):
     """
     Compare two materials with a set of tests.
@@ -1240,15 +1498,6 @@ def _getBoundingBox(obj):
         return _vis._getBoundingBox(obj)
 
 
-def _getRawMesh(obj):
-    from .. import visualisation as _vis
-
-    if type(obj) is _vis.Mesh:
-        return obj.localmesh
-    else:
-        return obj
-
-
 def _meshes(lvname, referenceMesh, otherMesh, tests, includeAllTestResults=False):
     result = ComparisonResult()
 
@@ -1292,10 +1541,9 @@ def _meshes(lvname, referenceMesh, otherMesh, tests, includeAllTestResults=False
 
     if tests.shapeVolume:
         if rm and om:
-            rmRawMesh = _getRawMesh(rm)
-            omRawMesh = _getRawMesh(om)
-            rVolume = rmRawMesh.volume()
-            oVolume = omRawMesh.volume()
+            # visualisation.Mesh caches these
+            rVolume = rm.volume()
+            oVolume = om.volume()
             dVolume = oVolume - rVolume
             dVolumeFraction = abs(dVolume) / rVolume
             if dVolumeFraction > tests.toleranceVolumeFraction:
@@ -1318,10 +1566,9 @@ def _meshes(lvname, referenceMesh, otherMesh, tests, includeAllTestResults=False
 
     if tests.shapeArea:
         if rm and om:
-            rmRawMesh = _getRawMesh(rm)
-            omRawMesh = _getRawMesh(om)
-            rArea = rmRawMesh.area()
-            oArea = omRawMesh.area()
+            # visualisation.Mesh caches these
+            rArea = rm.area()
+            oArea = om.area()
             dArea = oArea - rArea
             dAreaFraction = abs(dArea) / rArea
             if dAreaFraction > tests.toleranceAreaFraction:
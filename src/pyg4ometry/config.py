@@ -8,13 +8,30 @@ errors. The default is around float precision.
 """
 twoPiComparisonTolerance = 1e-7
 
+"""
+Padding (in mm) added to the axis aligned bounding boxes used in the broad phase of
+overlap checking. Boxes closer than this are still tested so touching (coplanar)
+volumes are not missed. This matches the distance used to decide if two faces are coplanar.
+"""
+overlapBroadPhaseTolerance = 1e-2
+
+"""
+Two faces are coplanar (in the coplanar overlap check) if the distance between their
+planes and the difference between their unit normals are both less than this.
+"""
+coplanarTolerance = 1e-2
+
 
 class meshingType:
     pycsg = 1
     cgal_sm = 2
     cgal_np = 3
+    cgal_sm_fast = 4
 
 
+# cgal_sm_fast is cgal_sm with primitive solids meshed and transformed with the inexact
+# (double precision) kernel. Exact arithmetic is only used for boolean operations, so
+# this is best for visualisation and export.
 meshing = meshingType.cgal_sm
 # meshing = meshingType.pycsg
 meshingNullException = True
@@ -27,10 +44,21 @@ def backendName():
         return "cgal_sm"
     if meshing == meshingType.cgal_np:
         return "cgal_np"
+    if meshing == meshingType.cgal_sm_fast:
+        return "cgal_sm_fast"
+
 
+# cache solid meshes by solid type, evaluated parameters and mesh settings so identical
+# solids are only meshed once (see geant4.solid.MeshCache). Off by default, as cached
+# meshes are shared process wide. The cache memory use (approximate, in bytes) is limited
+# to meshCacheMaxBytes. If meshCacheDir is set to a directory meshes are also stored
+# there as binary arrays and reused by later sessions (e.g. repeated loads of a GDML file)
+meshCache = False
+meshCacheMaxBytes = 1024**3
+meshCacheDir = None
 
-# whether to generate meshes during the construction of each logical volume
-# note this is required for a lot of functionality
+# whether to generate meshes of logical volumes. Meshes are generated when first used
+# (or by Registry.meshAll). Note this is required for a lot of functionality
 doMeshing = True
 
 # Global settings for default meshing settings for solids
@@ -13,7 +13,7 @@ from .. import geant4 as _g4
 from .. import transformation as _trans
 from .. import config as _config
 
-if _config.meshing == _config.meshingType.cgal_sm:
+if _config.meshing in (_config.meshingType.cgal_sm, _config.meshingType.cgal_sm_fast):
     from ..pycgal.core import do_intersect as _do_intersect
 elif _config.meshing == _config.meshingType.pycsg:
     from ..pycsg.core import do_intersect as _do_intersect
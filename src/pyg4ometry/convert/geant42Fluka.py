@@ -2,12 +2,18 @@ from .. import transformation as _transformation
 from .. import geant4 as _geant4
 from .. import fluka as _fluka
 from .. import pycgal as _pycgal
+from .. import config as _config
 from ..pycgal.core import PolygonProcessing as _PolygonProcessing
 from ..fluka.directive import (
     rotoTranslationFromTra2 as _rotoTranslationFromTra2,
 )
+from ..fluka.directive import RecursiveRotoTranslation as _RecursiveRotoTranslation
+from ..geant4.solid.MeshCache import meshCache as _meshCache
+from ..exceptions import NullMeshError as _NullMeshError
 import numpy as _np
 import copy as _copy
+import re as _re
+import logging as _logging
 import scipy.linalg as _la
 
 # this should be refactored to rename namespaced (privately)
@@ -15,14 +21,29 @@ from ..fluka.body import *
 
 # import matplotlib.pyplot as _plt
 
+logger = _logging.getLogger(__name__)
 
-def geant4Reg2FlukaReg(greg, logicalVolumeName="", bakeTransforms=False):
+
+def geant4Reg2FlukaReg(
+    greg,
+    logicalVolumeName="",
+    bakeTransforms=False,
+    aabbSubtraction=False,
+    nProcesses=1,
+    lattice=False,
+):
     """
     Convert a Geant4 model to a FLUKA one. This is done by handing over a complete
     pyg4ometry.geant4.Registry instance.
 
     :param greg: geant4 registry
     :type greg: pyg4ometry.geant4.Registry
+    :param aabbSubtraction: only subtract a daughter from the zones of its mother whose bounding boxes it overlaps
+    :type aabbSubtraction: bool
+    :param nProcesses: number of processes to mesh and convert the distinct solids in
+    :type nProcesses: int
+    :param lattice: convert the daughters of a logical volume only at its first placement and make the other placements LATTICE cells of it
+    :type lattice: bool
 
     returns:  pyg4ometry.fluka.FlukaRegistry
     """
@@ -33,13 +54,44 @@ def geant4Reg2FlukaReg(greg, logicalVolumeName="", bakeTransforms=False):
         logi = greg.getWorldVolume()
     else:
         logi = greg.logicalVolumeDict[logicalVolumeName]
+    if nProcesses > 1:
+        greg.meshAll(nProcesses)
+
     freg = geant4MaterialDict2Fluka(greg.materialDict, freg)
-    freg = geant4Logical2Fluka(logi, freg, bakeTransforms)
+    freg = geant4Logical2Fluka(logi, freg, bakeTransforms, aabbSubtraction, nProcesses, lattice)
+
+    if logger.isEnabledFor(_logging.DEBUG):
+        for regionName, nTerms in regionTermCounts(freg).items():
+            logger.debug("region %s : %d terms", regionName, nTerms)
 
     return freg
 
 
-def geant4Logical2Fluka(logicalVolume, flukaRegistry=None, bakeTransforms=False):
+def regionTermCounts(flukaRegistry):
+    """
+    Number of terms (see fluka.boolean_algebra.nTermsDNF) of each region in a FLUKA
+    registry, e.g. to find regions whose expressions blow up from the subtraction of
+    many daughters.
+
+    :param flukaRegistry: FLUKA registry
+    :type flukaRegistry: pyg4ometry.fluka.FlukaRegistry
+
+    returns: dict of region name : number of terms
+    """
+    return {
+        name: _fluka.boolean_algebra.nTermsDNF(region)
+        for name, region in flukaRegistry.regionDict.items()
+    }
+
+
+def geant4Logical2Fluka(
+    logicalVolume,
+    flukaRegistry=None,
+    bakeTransforms=False,
+    aabbSubtraction=False,
+    nProcesses=1,
+    lattice=False,
+):
     """
     Convert a single logical volume - not the main entry point for the conversion.
     """
@@ -49,6 +101,10 @@ def geant4Logical2Fluka(logicalVolume, flukaRegistry=None, bakeTransforms=False)
     if not flukaRegistry:
         flukaRegistry = _fluka.FlukaRegistry()
 
+    # the distinct solids can be converted in parallel before walking the tree
+    if not bakeTransforms:
+        _makeSolidPrototypes(logicalVolume, flukaRegistry, nProcesses)
+
     flukaNameCount = 0
 
     # find extent of logical
@@ -115,9 +171,13 @@ def geant4Logical2Fluka(logicalVolume, flukaRegistry=None, bakeTransforms=False)
         )
         return
 
-    flukaMotherRegion = _copy.deepcopy(flukaMotherOuterRegion)
+    flukaMotherRegion = _copyRegion(flukaMotherOuterRegion)
     flukaNameCount += 1
 
+    motherZoneAABBs = None
+    if aabbSubtraction:
+        motherZoneAABBs = _zoneAABBs(flukaMotherRegion, _volumeAABB(logicalVolume, mtra, tra))
+
     for zone in flukaMotherOuterRegion.zones:
         fzone.addSubtraction(zone)
 
@@ -131,13 +191,23 @@ def geant4Logical2Fluka(logicalVolume, flukaRegistry=None, bakeTransforms=False)
         new_tra = mtra @ pvtra + tra
 
         flukaDaughterOuterRegion, flukaNameCount = geant4PhysicalVolume2Fluka(
-            dv, new_mtra, new_tra, flukaRegistry, flukaNameCount, bakeTransforms=bakeTransforms
+            dv,
+            new_mtra,
+            new_tra,
+            flukaRegistry,
+            flukaNameCount,
+            bakeTransforms=bakeTransforms,
+            aabbSubtraction=aabbSubtraction,
+            lattice=lattice,
         )
 
         # subtract daughters from black body
-        for motherZones in flukaMotherRegion.zones:
-            for daughterZones in flukaDaughterOuterRegion.zones:
-                motherZones.addSubtraction(daughterZones)
+        daughterAABB = None
+        if motherZoneAABBs is not None:
+            daughterAABB = _volumeAABB(dv.logicalVolume, new_mtra, new_tra)
+        _subtractDaughter(
+            flukaMotherRegion, flukaDaughterOuterRegion, motherZoneAABBs, daughterAABB
+        )
 
     ###########################################
     # create black body region
@@ -178,7 +248,22 @@ def geant4PhysicalVolume2Fluka(
     flukaRegistry=None,
     flukaNameCount=0,
     bakeTransforms=False,
+    aabbSubtraction=False,
+    lattice=False,
 ):
+    # the first placement of a logical volume is the prototype of the LATTICE cells
+    # made for its other placements, its daughters are not made cells themselves
+    latticePrototype = None
+    if lattice and _isLatticeVolume(physicalVolume.logicalVolume, mtra):
+        latticePrototype = flukaRegistry.latticePrototypes.get(id(physicalVolume.logicalVolume))
+        if latticePrototype is None:
+            flukaRegistry.latticePrototypes[id(physicalVolume.logicalVolume)] = (
+                physicalVolume.logicalVolume,
+                mtra,
+                tra,
+            )
+            lattice = False
+
     # logical volume (outer and complete)
     if physicalVolume.logicalVolume.type == "logical":
         geant4LvOuterSolid = physicalVolume.logicalVolume.solid
@@ -208,9 +293,13 @@ def geant4PhysicalVolume2Fluka(
         # z = _fluka.Zone()
         # flukaMotherOuterRegion.addZone(z)
 
-    flukaMotherRegion = _copy.deepcopy(flukaMotherOuterRegion)
+    flukaMotherRegion = _copyRegion(flukaMotherOuterRegion)
     flukaMotherRegion.comment = physicalVolume.name
 
+    if latticePrototype is not None:
+        _addLatticeCell(flukaMotherRegion, latticePrototype, mtra, tra, flukaRegistry)
+        return flukaMotherOuterRegion, flukaNameCount
+
     # Check if we have a replica - a replica is a special case where we have an in-effect dummy mother
     # volume that the replica by-construction should entirely fill. Therefore, we cut out the pv shape
     # from the parent but we don't create it itself and just place the daughters from the replica in it.
@@ -241,6 +330,8 @@ def geant4PhysicalVolume2Fluka(
                 flukaRegistry=flukaRegistry,
                 flukaNameCount=flukaNameCount,
                 bakeTransforms=bakeTransforms,
+                aabbSubtraction=aabbSubtraction,
+                lattice=lattice,
             )
 
         materialName = daughterVolumes[0].logicalVolume.material.name
@@ -252,6 +343,12 @@ def geant4PhysicalVolume2Fluka(
         except KeyError:
             pass
     else:
+        motherZoneAABBs = None
+        if aabbSubtraction and physicalVolume.logicalVolume.type == "logical":
+            motherZoneAABBs = _zoneAABBs(
+                flukaMotherRegion, _volumeAABB(physicalVolume.logicalVolume, mtra, tra)
+            )
+
         # loop over daughters and remove from mother region
         for dv in physicalVolume.logicalVolume.daughterVolumes:
             # placement information for daughter
@@ -270,11 +367,16 @@ def geant4PhysicalVolume2Fluka(
                 flukaRegistry=flukaRegistry,
                 flukaNameCount=flukaNameCount,
                 bakeTransforms=bakeTransforms,
+                aabbSubtraction=aabbSubtraction,
+                lattice=lattice,
             )
             if physicalVolume.logicalVolume.type == "logical":
-                for motherZones in flukaMotherRegion.zones:
-                    for daughterZones in flukaDaughterOuterRegion.zones:
-                        motherZones.addSubtraction(daughterZones)
+                daughterAABB = None
+                if motherZoneAABBs is not None:
+                    daughterAABB = _volumeAABB(dv.logicalVolume, new_mtra, new_tra)
+                _subtractDaughter(
+                    flukaMotherRegion, flukaDaughterOuterRegion, motherZoneAABBs, daughterAABB
+                )
             elif physicalVolume.logicalVolume.type == "assembly":
                 # If assembly the daughters form the outer
                 for daughterZones in flukaDaughterOuterRegion.zones:
@@ -297,6 +399,168 @@ def geant4PhysicalVolume2Fluka(
     return flukaMotherOuterRegion, flukaNameCount
 
 
+def _isLatticeVolume(logicalVolume, mtra):
+    """
+    If a placement of a logical volume with rotation mtra can be a LATTICE cell (or
+    prototype), i.e. the volume has daughters to leave out of the cells and is not a
+    reflection, replica or extruder.
+    """
+    return (
+        logicalVolume.type == "logical"
+        and logicalVolume.solid.type != "extruder"
+        and len(logicalVolume.daughterVolumes) > 0
+        and not any(type(dv) is _geant4.ReplicaVolume for dv in logicalVolume.daughterVolumes)
+        and _np.linalg.det(mtra) > 0
+    )
+
+
+def _addLatticeCell(cellRegion, prototype, mtra, tra, flukaRegistry):
+    """
+    Make a region a LATTICE cell of the prototype placement (logical volume, mtra, tra)
+    of the logical volume placed there with rotation mtra and translation tra. The
+    rototranslation of the cell moves it onto the prototype.
+    """
+    _, prototypeMtra, prototypeTra = prototype
+    cellMtra = prototypeMtra @ _np.linalg.inv(mtra)
+    rotoTranslation = _rotoTranslationFromTra2(
+        "L" + cellRegion.name[1:],
+        [_transformation.matrix2tbxyz(cellMtra), prototypeTra - cellMtra @ tra],
+        flukaregistry=flukaRegistry,
+    )
+    return _fluka.Lattice(cellRegion, rotoTranslation, flukaregistry=flukaRegistry)
+
+
+def _copyRegion(region):
+    """
+    Copy of a region with new zones so that daughters can be subtracted from it
+    without changing the original. The bodies and subzones are shared.
+    """
+    result = _fluka.Region(region.name, comment=region.comment)
+    for zone in region.zones:
+        newZone = _fluka.Zone(zone.name)
+        newZone.intersections = list(zone.intersections)
+        newZone.subtractions = list(zone.subtractions)
+        result.addZone(newZone)
+    return result
+
+
+def _volumeAABB(logicalVolume, mtra, tra):
+    """
+    Axis aligned bounding box (fluka.AABB in mm) of a logical volume with rotation
+    mtra and translation tra or None if it is not known (e.g. an assembly). The box of
+    the mesh is padded (see _padAABB) so it also contains the curved surfaces the mesh
+    cuts inside of.
+    """
+    if logicalVolume.type != "logical":
+        return None
+
+    try:
+        mesh = logicalVolume.mesh
+        if mesh is None:
+            return None
+        aabb = _fluka.AABB(*mesh.getBoundingBox(mtra, tra))
+    except (ValueError, _NullMeshError):
+        return None
+    return _padAABB(aabb, _solidNSlice(logicalVolume.solid))
+
+
+_planarBodies = (
+    _fluka.body.RPP,
+    _fluka.body.BOX,
+    _fluka.body._WED_RAW,
+    _fluka.body.ARB,
+    _fluka.body._HalfSpaceMixin,
+)
+
+
+def _zoneAABBs(region, aabb):
+    """
+    Axis aligned bounding box of each zone of a region converted from a solid with
+    bounding box aabb, which also limits infinite bodies. Returns None if aabb is
+    None and uses aabb for zones that cannot be meshed.
+    """
+    if aabb is None:
+        return None
+    if len(region.zones) == 1:
+        return [aabb]
+
+    # the bodies of a zone are meshed with the default discretisation
+    nslice = min(
+        _config.SolidDefaults.Cons.nslice,
+        _config.SolidDefaults.Ellipsoid.nslice,
+        _config.SolidDefaults.Ellipsoid.nstack,
+        _config.SolidDefaults.EllipticalTube.nslice,
+        _config.SolidDefaults.EllipticalTube.nstack,
+        _config.SolidDefaults.Orb.nslice,
+        _config.SolidDefaults.Orb.nstack,
+        _config.SolidDefaults.Tubs.nslice,
+    )
+
+    zoneAABBs = []
+    for zone in region.zones:
+        try:
+            mesh = zone.mesh(aabb=aabb)
+            if mesh is None:
+                zoneAABBs.append(aabb)
+                continue
+            zoneAABB = _fluka.AABB.fromMesh(mesh)
+            if all(isinstance(b, _planarBodies) for b in zone.bodies()):
+                zoneAABBs.append(_padAABB(zoneAABB))
+            else:
+                zoneAABBs.append(_padAABB(zoneAABB, nslice))
+        except (ValueError, TypeError, _NullMeshError):
+            # e.g. null zones or bodies (QUA) that cannot be meshed with an aabb
+            zoneAABBs.append(aabb)
+    return zoneAABBs
+
+
+def _solidNSlice(solid):
+    """
+    Smallest number of segments per circle used to mesh a solid or its constituents,
+    or None if none of them is curved.
+    """
+    nslices = []
+    solids = [solid]
+    while solids:
+        s = solids.pop()
+        solids.extend(s._meshCacheOperands())
+        if not hasattr(s, "nslice"):
+            continue
+        nslices.extend(n for n in [s.nslice, getattr(s, "nstack", None)] if n)
+    return int(min(nslices)) if nslices else None
+
+
+def _padAABB(aabb, nslice=None):
+    """
+    Axis aligned bounding box padded by config.overlapBroadPhaseTolerance and, for a
+    mesh made with nslice segments per circle, by the largest distance between a
+    curved surface and the mesh. A segment is a chord of at most the box diagonal
+    that subtends at most 2 pi / nslice, so the distance is below half the diagonal
+    times tan(pi / (2 nslice)).
+    """
+    padding = _config.overlapBroadPhaseTolerance
+    if nslice:
+        padding += aabb.cornerDistance() * _np.tan(_np.pi / (2 * nslice))
+    return _fluka.AABB(aabb.lower - padding, aabb.upper + padding)
+
+
+def _subtractDaughter(motherRegion, daughterRegion, motherZoneAABBs=None, daughterAABB=None):
+    """
+    Subtract the zones of a daughter region from each zone of its mother region. If
+    bounding boxes are given the daughter is only subtracted from the mother zones it
+    overlaps.
+    """
+    for i, motherZone in enumerate(motherRegion.zones):
+        if (
+            motherZoneAABBs is not None
+            and daughterAABB is not None
+            and not motherZoneAABBs[i].intersects(daughterAABB)
+        ):
+            continue
+        for daughterZone in daughterRegion.zones:
+            motherZone.addSubtraction(daughterZone)
+
+
 def geant4Solid2FlukaRegion(
     flukaNameCount,
     solid,
@@ -314,6 +578,14 @@ def geant4Solid2FlukaRegion(
     # add PV -> region map
     flukaRegistry.PhysVolToRegionMap[commentName] = "R" + name
 
+    # solids are converted once and then instanced for each placement
+    if not bakeTransforms and _np.linalg.det(mtra) > 0:
+        prototype = _solidPrototype(solid, flukaRegistry)
+        if prototype is not None:
+            return _instanceSolidPrototype(
+                flukaNameCount, prototype, solid, mtra, tra, flukaRegistry, commentName
+            )
+
     fregion = None
     fbodies = []
 
@@ -321,7 +593,11 @@ def geant4Solid2FlukaRegion(
     rotation = _transformation.matrix2tbxyz(mtra)
 
     transform = _rotoTranslationFromTra2("T" + name, [rotation, tra], flukaregistry=flukaRegistry)
-    commentName = commentName + " " + solid.name
+    if isinstance(flukaRegistry, _PrototypeRegistry):
+        flukaRegistry.placements["T" + name] = (mtra, tra)
+        commentName = commentName + " " + flukaRegistry.enterSolid(solid)
+    else:
+        commentName = commentName + " " + solid.name
 
     # print 'geant4Solid2FlukaRegion',flukaNameCount,name,solid.type, rotation,position,transform
 
@@ -790,9 +1066,251 @@ def geant4Solid2FlukaRegion(
         fregion = _fluka.Region("R" + name)
         print(solid.type)
 
+    if isinstance(flukaRegistry, _PrototypeRegistry):
+        flukaRegistry.exitSolid()
+
     return fregion, flukaNameCount
 
 
+class _PrototypeRegistry(_fluka.FlukaRegistry):
+    """
+    Registry a solid is converted into once by _solidPrototype. It also records the
+    placement (rotation matrix and translation) each transform was made from.
+    """
+
+    def __init__(self):
+        super().__init__()
+        # constituents of a prototype are converted directly
+        self.solidPrototypes = None
+        self.placements = {}  # transform name : (mtra, tra)
+        self.solidStack = []  # [solid, path, converted operand indices]
+        self.namesByPath = True
+
+    def enterSolid(self, solid):
+        """
+        Start converting a solid. Returns the name to use for it in body comments, a
+        placeholder for its path (operand indices, see SolidBase._meshCacheOperands)
+        from the prototype solid, which an instance replaces with the names of its own
+        solid. If the solid is not an operand of the solid being converted its name is
+        used and namesByPath is set to False.
+        """
+        path = ()
+        if self.solidStack:
+            parent, parentPath, converted = self.solidStack[-1]
+            index = None
+            if parentPath is not None:
+                for i, operand in enumerate(parent._meshCacheOperands()):
+                    if operand is solid and i not in converted:
+                        index = i
+                        break
+            if index is None:
+                self.namesByPath = False
+                path = None
+            else:
+                converted.add(index)
+                path = (*parentPath, index)
+
+        self.solidStack.append([solid, path, set()])
+        return solid.name if path is None else _solidNameToken(path)
+
+    def exitSolid(self):
+        self.solidStack.pop()
+
+
+def _solidNameToken(path):
+    return "{" + ".".join(str(i) for i in path) + "}"
+
+
+def _solidNames(solid):
+    """
+    Name of a solid and its constituents by placeholder (see
+    _PrototypeRegistry.enterSolid).
+    """
+    names = {}
+    solids = [(solid, ())]
+    while solids:
+        s, path = solids.pop()
+        names[_solidNameToken(path)] = s.name
+        solids.extend((operand, (*path, i)) for i, operand in enumerate(s._meshCacheOperands()))
+    return names
+
+
+def _solidPrototype(solid, flukaRegistry):
+    """
+    Solid converted once in its own frame (i.e. without a placement transform), cached
+    by solid key (see SolidBase.meshCacheKey) in flukaRegistry.solidPrototypes. Returns
+    the prototype (see _makeSolidPrototype) or None if the solid cannot be instanced,
+    e.g. its key is unknown or it adds regions itself (extruder).
+    """
+    key = _solidPrototypeKey(solid, flukaRegistry)
+    if key is None:
+        return None
+
+    prototypes = flukaRegistry.solidPrototypes
+    if key not in prototypes:
+        prototypes[key] = _makeSolidPrototype(solid)
+
+    return prototypes[key]
+
+
+def _solidPrototypeKey(solid, flukaRegistry):
+    if flukaRegistry.solidPrototypes is None or solid.type == "extruder":
+        return None
+    return _meshCache.solidKey(solid)
+
+
+def _makeSolidPrototype(solid):
+    """
+    Convert a solid at the origin. Returns the region, the placement of each transform
+    name and the number of names used by the conversion, or None if a body has a
+    transform the placement of an instance cannot be added to or the solid names in
+    the body comments cannot be replaced by those of an instance.
+    """
+    prototypeRegistry = _PrototypeRegistry()
+    region, nameCount = geant4Solid2FlukaRegion(0, solid, flukaRegistry=prototypeRegistry)
+
+    if not prototypeRegistry.namesByPath:
+        return None
+
+    for body in region.bodies():
+        if (
+            type(body.transform) is not _RecursiveRotoTranslation
+            or body.transform.name not in prototypeRegistry.placements
+        ):
+            return None
+
+    return region, prototypeRegistry.placements, nameCount
+
+
+_prototypeWorkerSolids = []
+
+
+def _prototypeWorkerRun(index):
+    return _makeSolidPrototype(_prototypeWorkerSolids[index])
+
+
+def _makeSolidPrototypes(logicalVolume, flukaRegistry, nProcesses=1):
+    """
+    Convert each distinct solid in the tree of a logical volume to its prototype in a
+    pool of nProcesses worker processes and add them to flukaRegistry.solidPrototypes.
+    The solids are independent of each other and the names of a placement only depend
+    on the number of names before it (see _instanceSolidPrototype), so the result is
+    the same as converting them while walking the tree. The workers are forked so they
+    share the solids with this process. Solids of replicas (made while walking the
+    tree) and solids that cannot be instanced are left to the walk.
+    """
+    import multiprocessing as _multiprocessing
+
+    global _prototypeWorkerSolids
+
+    if nProcesses <= 1 or "fork" not in _multiprocessing.get_all_start_methods():
+        return
+
+    solids = {}  # solid key : solid
+    logicalVolumes = [logicalVolume]
+    seen = set()
+    while logicalVolumes:
+        lv = logicalVolumes.pop()
+        if id(lv) in seen:
+            continue
+        seen.add(id(lv))
+
+        if lv.type == "logical":
+            key = _solidPrototypeKey(lv.solid, flukaRegistry)
+            if key is not None and key not in flukaRegistry.solidPrototypes:
+                solids.setdefault(key, lv.solid)
+
+        for dv in lv.daughterVolumes:
+            if type(dv) is not _geant4.ReplicaVolume:
+                logicalVolumes.append(dv.logicalVolume)
+
+    if len(solids) < 2:
+        return
+
+    _prototypeWorkerSolids = list(solids.values())
+    try:
+        with _multiprocessing.get_context("fork").Pool(nProcesses) as pool:
+            results = pool.map(_prototypeWorkerRun, range(len(_prototypeWorkerSolids)), 1)
+    finally:
+        _prototypeWorkerSolids = []
+
+    flukaRegistry.solidPrototypes.update(zip(solids.keys(), results))
+
+
+def _instanceSolidPrototype(
+    flukaNameCount, prototype, solid, mtra, tra, flukaRegistry, commentName=""
+):
+    """
+    Region for a placement of a solid from its prototype (see _solidPrototype), which
+    may have been made from another solid of the same shape. The prototype bodies are
+    copied, renumbered from flukaNameCount, given the names of solid in their comments
+    and the placement of the instance composed with their own (e.g. that of a boolean
+    constituent), so the result is the same as converting the solid at this placement.
+    Copies identical to existing bodies are not added again but the existing body is
+    used.
+    """
+    region, placements, nameCount = prototype
+    solidNames = _solidNames(solid)
+
+    def instanceName(prototypeName):
+        # names are a letter, the 4 digit name count and an optional suffix
+        count = flukaNameCount + int(prototypeName[1:5])
+        return prototypeName[0] + format(count, "04") + prototypeName[5:]
+
+    transforms = {}  # prototype transform name : transform of this instance
+    bodies = {}  # prototype body name : body of this instance
+
+    def instanceTransform(prototypeTransform):
+        transform = transforms.get(prototypeTransform.name)
+        if transform is None:
+            localMtra, localTra = placements[prototypeTransform.name]
+            transform = _rotoTranslationFromTra2(
+                instanceName(prototypeTransform.name),
+                [
+                    _transformation.matrix2tbxyz(mtra @ localMtra),
+                    mtra @ localTra + tra,
+                ],
+                flukaregistry=flukaRegistry,
+            )
+            transforms[prototypeTransform.name] = transform
+        return transform
+
+    def instanceBody(prototypeBody):
+        body = bodies.get(prototypeBody.name)
+        if body is None:
+            # the geometry (e.g. Three vectors) is copied so the instance does not
+            # share it with the prototype, the transform is replaced below
+            body = _copy.deepcopy(
+                prototypeBody, {id(prototypeBody.transform): prototypeBody.transform}
+            )
+            body.name = instanceName(prototypeBody.name)
+            body.transform = instanceTransform(prototypeBody.transform)
+            body.comment = commentName + _re.sub(
+                r"\{[0-9.]*\}", lambda m: solidNames[m.group(0)], prototypeBody.comment
+            )
+            body = flukaRegistry.getDegenerateBody(body)
+            bodies[prototypeBody.name] = body
+        return body
+
+    def instanceZone(prototypeZone):
+        zone = _fluka.Zone()
+        for boolean in prototypeZone.intersections:
+            zone.addIntersection(instance(boolean.body))
+        for boolean in prototypeZone.subtractions:
+            zone.addSubtraction(instance(boolean.body))
+        return zone
+
+    def instance(obj):
+        if isinstance(obj, _fluka.Zone):
+            return instanceZone(obj)
+        return instanceBody(obj)
+
+    fregion = _fluka.Region(instanceName(region.name))
+    for zone in region.zones:
+        fregion.addZone(instanceZone(zone))
+    return fregion, flukaNameCount + nameCount
+
+
 def geant4MaterialDict2Fluka(matr, freg):
     for material in matr.items():
         if isinstance(material[1], _geant4.Material):
@@ -986,7 +1504,8 @@ def geant4Box2Fluka(
     fbody = None
 
     if not bakeTransform:
-        fbody = _fluka.RPP(
+        fbody = flukaRegistry.makeBody(
+            _fluka.RPP,
             "B" + name + "01",
             -pX,
             pX,
@@ -1006,7 +1525,8 @@ def geant4Box2Fluka(
         h2 = mtra @ _np.array([0, 2 * pY, 0])
         h3 = mtra @ _np.array([0, 0, 2 * pZ])
 
-        fbody = _fluka.BOX(
+        fbody = flukaRegistry.makeBody(
+            _fluka.BOX,
             "B" + name + "01",
             v,
             h1,
@@ -1519,7 +2039,8 @@ def geant4Cons2Fluka(
             )
             fzone.addIntersection(fbody1)
         else:
-            fbody1 = _fluka.TRC(
+            fbody1 = flukaRegistry.makeBody(
+                _fluka.TRC,
                 "B" + name + "01",
                 major_centre=[0, 0, -pDz / 2],
                 direction=[0, 0, pDz],
@@ -1531,7 +2052,8 @@ def geant4Cons2Fluka(
             )
 
             if pRmin1 != 0 and pRmin2 != 0:
-                fbody2 = _fluka.TRC(
+                fbody2 = flukaRegistry.makeBody(
+                    _fluka.TRC,
                     "B" + name + "02",
                     major_centre=[0, 0, -pDz / 2],
                     direction=[0, 0, pDz],
@@ -1597,7 +2119,8 @@ def geant4Cons2Fluka(
             )
             fzone.addIntersection(fbody1)
         else:
-            fbody1 = _fluka.TRC(
+            fbody1 = flukaRegistry.makeBody(
+                _fluka.TRC,
                 "B" + name + "01",
                 major_centre=mtra @ _np.array([0, 0, -pDz / 2]) + tra / 10,
                 direction=mtra @ _np.array([0, 0, pDz]),
@@ -1609,7 +2132,8 @@ def geant4Cons2Fluka(
             )
 
             if pRmin1 != 0 and pRmin2 != 0:
-                fbody2 = _fluka.TRC(
+                fbody2 = flukaRegistry.makeBody(
+                    _fluka.TRC,
                     "B" + name + "02",
                     major_centre=mtra @ _np.array([0, 0, -pDz / 2]) + tra / 10,
                     direction=mtra @ _np.array([0, 0, pDz]),
@@ -1680,7 +2204,7 @@ def pycsgmesh2FlukaRegion(
     transform = _rotoTranslationFromTra2("T" + name, [rotation, tra], flukaregistry=flukaRegistry)
 
     polyhedron = _pycgal.Polyhedron_3.Polyhedron_3_EPECK()
-    _pycgal.CGAL.copy_face_graph(mesh.sm, polyhedron)
+    _pycgal.CGAL.copy_face_graph(mesh.toExact().sm, polyhedron)
     nef = _pycgal.Nef_polyhedron_3.Nef_polyhedron_3_EPECK(polyhedron)
     convex_polyhedra = _pycgal.PolyhedronProcessing.nefPolyhedron_to_convexPolyhedra(nef)
 
@@ -1760,7 +2284,8 @@ def geant4Sphere2Fluka(
     pDTheta = solid.evaluateParameter(solid.pDTheta) * auval
 
     if not bakeTransform:
-        fbody1 = _fluka.SPH(
+        fbody1 = flukaRegistry.makeBody(
+            _fluka.SPH,
             "B" + name + "01",
             [0, 0, 0],
             pRmax,
@@ -1770,7 +2295,8 @@ def geant4Sphere2Fluka(
         )
 
         if pRmin != 0:
-            fbody2 = _fluka.SPH(
+            fbody2 = flukaRegistry.makeBody(
+                _fluka.SPH,
                 "B" + name + "02",
                 [0, 0, 0],
                 pRmin,
@@ -1807,7 +2333,8 @@ def geant4Sphere2Fluka(
             if pTheta1 < _np.pi / 2.0:
                 r = _np.tan(pTheta1) * pRmax
 
-                fbody5 = _fluka.TRC(
+                fbody5 = flukaRegistry.makeBody(
+                    _fluka.TRC,
                     "B" + name + "05",
                     [0, 0, pRmax],
                     [0, 0, -pRmax],
@@ -1821,7 +2348,8 @@ def geant4Sphere2Fluka(
             elif pTheta1 > _np.pi / 2.0:
                 r = _np.tan(pTheta1) * pRmax
 
-                fbody5 = _fluka.TRC(
+                fbody5 = flukaRegistry.makeBody(
+                    _fluka.TRC,
                     "B" + name + "05",
                     [0, 0, -pRmax],
                     [0, 0, pRmax],
@@ -1845,7 +2373,8 @@ def geant4Sphere2Fluka(
             if pTheta2 < _np.pi / 2.0:
                 r = abs(_np.tan(pTheta2) * pRmax)
 
-                fbody6 = _fluka.TRC(
+                fbody6 = flukaRegistry.makeBody(
+                    _fluka.TRC,
                     "B" + name + "06",
                     [0, 0, pRmax],
                     [0, 0, -pRmax],
@@ -1858,7 +2387,8 @@ def geant4Sphere2Fluka(
 
             elif pTheta2 > _np.pi / 2.0:
                 r = abs(_np.tan(pTheta2) * pRmax)
-                fbody6 = _fluka.TRC(
+                fbody6 = flukaRegistry.makeBody(
+                    _fluka.TRC,
                     "B" + name + "06",
                     [0, 0, -pRmax],
                     [0, 0, pRmax],
@@ -1878,7 +2408,8 @@ def geant4Sphere2Fluka(
                     comment=commentName,
                 )
     else:
-        fbody1 = _fluka.SPH(
+        fbody1 = flukaRegistry.makeBody(
+            _fluka.SPH,
             "B" + name + "01",
             mtra @ _np.array([0, 0, 0]) + tra / 10,
             pRmax,
@@ -1888,7 +2419,8 @@ def geant4Sphere2Fluka(
         )
 
         if pRmin != 0:
-            fbody2 = _fluka.SPH(
+            fbody2 = flukaRegistry.makeBody(
+                _fluka.SPH,
                 "B" + name + "02",
                 mtra @ _np.array([0, 0, 0]) + tra / 10,
                 pRmin,
@@ -1925,7 +2457,8 @@ def geant4Sphere2Fluka(
             if pTheta1 < _np.pi / 2.0:
                 r = _np.tan(pTheta1) * pRmax
 
-                fbody5 = _fluka.TRC(
+                fbody5 = flukaRegistry.makeBody(
+                    _fluka.TRC,
                     "B" + name + "05",
                     mtra @ _np.array([0, 0, pRmax]) + tra / 10,
                     mtra @ _np.array([0, 0, -pRmax]) + tra / 10,
@@ -1939,7 +2472,8 @@ def geant4Sphere2Fluka(
             elif pTheta1 > _np.pi / 2.0:
                 r = _np.tan(pTheta1) * pRmax
 
-                fbody5 = _fluka.TRC(
+                fbody5 = flukaRegistry.makeBody(
+                    _fluka.TRC,
                     "B" + name + "05",
                     mtra @ _np.array([0, 0, -pRmax]) + tra / 10,
                     mtra @ _np.array([0, 0, pRmax]) + tra / 10,
@@ -1964,7 +2498,8 @@ def geant4Sphere2Fluka(
             if pTheta2 < _np.pi / 2.0:
                 r = abs(_np.tan(pTheta2) * pRmax)
 
-                fbody6 = _fluka.TRC(
+                fbody6 = flukaRegistry.makeBody(
+                    _fluka.TRC,
                     "B" + name + "06",
                     mtra @ _np.array([0, 0, pRmax]) + tra / 10,
                     mtra @ _np.array([0, 0, -pRmax]) + tra / 10,
@@ -1977,7 +2512,8 @@ def geant4Sphere2Fluka(
 
             elif pTheta2 > _np.pi / 2.0:
                 r = abs(_np.tan(pTheta2) * pRmax)
-                fbody6 = _fluka.TRC(
+                fbody6 = flukaRegistry.makeBody(
+                    _fluka.TRC,
                     "B" + name + "06",
                     mtra @ _np.array([0, 0, -pRmax]) + tra / 10,
                     mtra @ _np.array([0, 0, pRmax]) + tra / 10,
@@ -2063,7 +2599,8 @@ def geant4Orb2Fluka(
     pRmax = solid.evaluateParameter(solid.pRMax) * luval / 10.0
 
     if not bakeTransform:
-        fbody1 = _fluka.SPH(
+        fbody1 = flukaRegistry.makeBody(
+            _fluka.SPH,
             "B" + name + "01",
             [0, 0, 0],
             pRmax,
@@ -2072,7 +2609,8 @@ def geant4Orb2Fluka(
             comment=commentName,
         )
     else:
-        fbody1 = _fluka.SPH(
+        fbody1 = flukaRegistry.makeBody(
+            _fluka.SPH,
             "B" + name + "01",
             mtra @ _np.array([0, 0, 0]) + tra / 10,
             pRmax,
@@ -2172,7 +2710,8 @@ def geant4Torus2Fluka(
         nz2 = 0
 
         if not bakeTransform:
-            body1 = _fluka.RCC(
+            body1 = flukaRegistry.makeBody(
+                _fluka.RCC,
                 "B" + name + "" + format(4 * i, "02"),
                 [x1, y1, z1],
                 [2 * nx1, 2 * ny1, 2 * nz1],
@@ -2202,7 +2741,8 @@ def geant4Torus2Fluka(
             )
 
             if pRmin != 0:
-                body4 = _fluka.RCC(
+                body4 = flukaRegistry.makeBody(
+                    _fluka.RCC,
                     "B" + name + format(4 * i + 3, "02"),
                     [x1, y1, z1],
                     [2 * nx1, 2 * ny1, 2 * nz1],
@@ -2212,7 +2752,8 @@ def geant4Torus2Fluka(
                     comment=commentName,
                 )
         else:
-            body1 = _fluka.RCC(
+            body1 = flukaRegistry.makeBody(
+                _fluka.RCC,
                 "B" + name + "" + format(4 * i, "02"),
                 mtra @ _np.array([x1, y1, z1]) + tra / 10,
                 mtra @ [2 * nx1, 2 * ny1, 2 * nz1],
@@ -2242,7 +2783,8 @@ def geant4Torus2Fluka(
             )
 
             if pRmin != 0:
-                body4 = _fluka.RCC(
+                body4 = flukaRegistry.makeBody(
+                    _fluka.RCC,
                     "B" + name + format(4 * i + 3, "02"),
                     mtra @ _np.array([x1, y1, z1]) + tra / 10,
                     mtra @ _np.array([2 * nx1, 2 * ny1, 2 * nz1]),
@@ -2401,7 +2943,8 @@ def geant4Polycone2Fluka(
 
             elif dz > 0 and r1 != 0 and r2 != 0:
                 if not bakeTransform:
-                    body = _fluka.TRC(
+                    body = flukaRegistry.makeBody(
+                        _fluka.TRC,
                         "B" + name + format(ibody, "02"),
                         [0, 0, z1],
                         [0, 0, dz],
@@ -2412,7 +2955,8 @@ def geant4Polycone2Fluka(
                         comment=commentName,
                     )
                 else:
-                    body = _fluka.TRC(
+                    body = flukaRegistry.makeBody(
+                        _fluka.TRC,
                         "B" + name + format(ibody, "02"),
                         mtra @ _np.array([0, 0, z1]) + tra / 10,
                         mtra @ _np.array([0, 0, dz]),
@@ -2427,7 +2971,8 @@ def geant4Polycone2Fluka(
 
             elif dz < 0 and r1 != 0 and r2 != 0:
                 if not bakeTransform:
-                    body = _fluka.TRC(
+                    body = flukaRegistry.makeBody(
+                        _fluka.TRC,
                         "B" + name + format(ibody, "02"),
                         [0, 0, z1],
                         [0, 0, dz],
@@ -2438,7 +2983,8 @@ def geant4Polycone2Fluka(
                         comment=commentName,
                     )
                 else:
-                    body = _fluka.TRC(
+                    body = flukaRegistry.makeBody(
+                        _fluka.TRC,
                         "B" + name + format(ibody, "02"),
                         mtra @ _np.array([0, 0, z1]) + tra / 10,
                         mtra @ _np.array([0, 0, dz]),
@@ -2915,7 +3461,8 @@ def geant4EllipticalTube2Fluka(
 
     # main elliptical cylinder
     if not bakeTransform:
-        fbody1 = _fluka.REC(
+        fbody1 = flukaRegistry.makeBody(
+            _fluka.REC,
             "B" + name + "01",
             [0, 0, -pDz / 2],
             [0, 0, pDz],
@@ -2926,7 +3473,8 @@ def geant4EllipticalTube2Fluka(
             comment=commentName,
         )
     else:
-        fbody1 = _fluka.REC(
+        fbody1 = flukaRegistry.makeBody(
+            _fluka.REC,
             "B" + name + "01",
             mtra @ _np.array([0, 0, -pDz / 2]) + tra / 10,
             mtra @ _np.array([0, 0, pDz]),
@@ -2993,7 +3541,8 @@ def geant4Ellipsoid2Fluka(
         transform = None
 
     # Main ellipsoid.  ELL can't be used as ELL is an ellipsoid of rotation.
-    fbody1 = _fluka.QUA(
+    fbody1 = flukaRegistry.makeBody(
+        _fluka.QUA,
         f"B{name}_01",
         cxx,
         cyy,
@@ -3117,7 +3666,8 @@ def geant4EllipticalCone2Fluka(
 
     fzone = _fluka.Zone()
     # Cone from general quadric
-    fbody1 = _fluka.QUA(
+    fbody1 = flukaRegistry.makeBody(
+        _fluka.QUA,
         f"B{name}_01",
         cxx,
         cyy,
@@ -3235,7 +3785,8 @@ def geant4Paraboloid2Fluka(
 
     fzone = _fluka.Zone()
     # Tip points in -ve z direction.  larger face is +ve z.
-    fbody1 = _fluka.QUA(
+    fbody1 = flukaRegistry.makeBody(
+        _fluka.QUA,
         f"B{name}_01",
         cxx,
         cyy,
@@ -3356,7 +3907,8 @@ def geant4Hype2Fluka(
 
     fzone = _fluka.Zone()
     # Outer QUA
-    fbody1 = _fluka.QUA(
+    fbody1 = flukaRegistry.makeBody(
+        _fluka.QUA,
         f"B{name}_01",
         cxx,
         cyy,
@@ -3395,7 +3947,8 @@ def geant4Hype2Fluka(
     # Only build if it is not null
     if innerRadius != 0 or innerStereo != 0:
         # Inner QUA
-        fbody2 = _fluka.QUA(
+        fbody2 = flukaRegistry.makeBody(
+            _fluka.QUA,
             f"B{name}_0{ihype}",
             cxx,
             cyy,
@@ -3507,7 +4060,8 @@ def geant4Tet2Fluka(
         verts.append([0, 0, 0] + tra / 10)
         transform = None
 
-    fbody1 = _fluka.ARB(
+    fbody1 = flukaRegistry.makeBody(
+        _fluka.ARB,
         "B" + name + "01",
         verts,
         [123.0, 134.0, 243.0, 142.0, 0.0, 0.0],
@@ -3565,7 +4119,8 @@ def geant4GenericTrap2Fluka(
     verts_set = set(verts_tuple)
 
     if len(verts_set) == 8:
-        fbody1 = _fluka.ARB(
+        fbody1 = flukaRegistry.makeBody(
+            _fluka.ARB,
             "B" + name + "01",
             verts,
             [4321.0, 5678.0, 2651.0, 3762.0, 7843.0, 5841.0],
@@ -3574,7 +4129,8 @@ def geant4GenericTrap2Fluka(
             comment=commentName,
         )
     elif len(verts_set) == 6:
-        fbody1 = _fluka.WED(
+        fbody1 = flukaRegistry.makeBody(
+            _fluka.WED,
             "B" + name + "01",
             verts[0],
             [v1 - v2 for v1, v2 in zip(verts[1], verts[0])],
@@ -3585,7 +4141,8 @@ def geant4GenericTrap2Fluka(
             comment=commentName,
         )
     elif len(verts_set) == 4:
-        fbody1 = _fluka.ARB(
+        fbody1 = flukaRegistry.makeBody(
+            _fluka.ARB,
             "B" + name + "01",
             verts,
             [123.0, 134.0, 243.0, 142.0, 0.0, 0.0],
@@ -49,7 +49,7 @@ if _config.meshing == _config.meshingType.pycsg:
     from ..pycsg.geom import Vector as _Vector
     from ..pycsg.geom import Vertex as _Vertex
     from ..pycsg.geom import Polygon as _Polygon
-elif _config.meshing == _config.meshingType.cgal_sm:
+elif _config.meshing in (_config.meshingType.cgal_sm, _config.meshingType.cgal_sm_fast):
     from ..pycgal.core import CSG as _CSG
     from ..pycgal.geom import Vector as _Vector
     from ..pycgal.geom import Vertex as _Vertex
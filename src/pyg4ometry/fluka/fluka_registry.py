@@ -69,6 +69,13 @@ class FlukaRegistry:
 
         self.PhysVolToRegionMap = {}
 
+        # geant4 solid key : region of the solid in its own frame, see convert.geant42Fluka
+        self.solidPrototypes = {}
+
+        # geant4 logical volume id : (logical volume, rotation, translation) of the
+        # prototype placement of its LATTICE cells, see convert.geant42Fluka
+        self.latticePrototypes = {}
+
     def addBody(self, body):
         if body.name in self.bodyDict:
             raise _IdenticalNameError(body.name)
@@ -819,15 +826,35 @@ class FlukaBodyStoreExact:
         return list(self.nameBody.values())
 
     def make(self, cls, *args, **kwargs):
+        # the body is only added (by getDegenerateBody) if there is no identical one
+        kwargs.pop("flukaregistry", None)
+        kwargs.pop("addRegistry", None)
         body = cls(*args, **kwargs)
         return self.getDegenerateBody(body)
 
     def getDegenerateBody(self, body):
-        if body.hash() in self.hashBody:
-            return self.hashBody[body.hash()]
-        else:
-            self.addBody(body)
-            return body
+        # the hash only selects the candidates, a match must have the same parameters
+        for candidate in self.hashBody.get(body.hash(), []):
+            if self._sameBody(candidate, body):
+                return candidate
+        self.addBody(body)
+        return body
+
+    @staticmethod
+    def _sameBody(first, second):
+        if type(first) is not type(second):
+            return False
+
+        ignore = ("name", "comment", "transform")
+        firstParameters = {k: v for k, v in vars(first).items() if k not in ignore}
+        secondParameters = {k: v for k, v in vars(second).items() if k not in ignore}
+        if firstParameters.keys() != secondParameters.keys():
+            return False
+        for k, v in firstParameters.items():
+            if not _np.array_equal(v, secondParameters[k]):
+                return False
+
+        return _np.array_equal(first.transform.to4DMatrix(), second.transform.to4DMatrix())
 
     def addBody(self, body):
         if body.name in self.nameBody:
@@ -835,8 +862,12 @@ class FlukaBodyStoreExact:
         logger.debug("%s", body)
 
         self.nameBody[body.name] = body
-        self.hashBody[body.hash()] = body
-        self.hashName[body.hash()] = body.name
+        # identical bodies resolve to the first one added
+        h = body.hash()
+        bucket = self.hashBody.setdefault(h, [])
+        if not any(self._sameBody(b, body) for b in bucket):
+            bucket.append(body)
+            self.hashName.setdefault(h, []).append(body.name)
 
     def keys(self):
         return self._bodyNames()
@@ -851,26 +882,31 @@ class FlukaBodyStoreExact:
         # c.setBody(value)
 
     def __getitem__(self, key):
-        if key not in self._bodyNames():
+        if key not in self.nameBody:
             msg = f"Undefined body: {key}"
             raise _FLUKAError(msg)
         return self.nameBody[key]
 
     def __delitem__(self, key):
-        if key not in self._bodyNames():
+        if key not in self.nameBody:
             msg = f"Missing body name: {key}"
             raise KeyError(msg)
 
-        body = self[key]
         b = self.nameBody.pop(key)
-        self.hashBody.pop(b.hash())
-        self.hashName.pop(b.hash())
+        h = b.hash()
+        bucket = self.hashBody.get(h, [])
+        if any(c is b for c in bucket):
+            self.hashBody[h] = [c for c in bucket if c is not b]
+            self.hashName[h].remove(b.name)
+            if not self.hashBody[h]:
+                self.hashBody.pop(h)
+                self.hashName.pop(h)
 
     def __len__(self):
         return len(self.nameBody)
 
     def __contains__(self, key):
-        return key in self._bodyNames()
+        return key in self.nameBody
 
     def __iter__(self):
         return iter(self._bodies())
@@ -20,10 +20,8 @@ from .. import config as _config
 
 if _config.meshing == _config.meshingType.pycsg:
     from ..pycsg.core import CSG, do_intersect
-elif _config.meshing == _config.meshingType.cgal_sm:
-    pass
-    # TODO reinstate intersecting meshes
-    # from pyg4ometry.pycgal.core import CSG, do_intersect, intersecting_meshes
+elif _config.meshing in (_config.meshingType.cgal_sm, _config.meshingType.cgal_sm_fast):
+    from ..pycgal.core import CSG, do_intersect, intersecting_meshes
 
 from textwrap import wrap as _wrap
 
@@ -689,8 +687,8 @@ class Region(vis.ViewableMixin):
             zone.allBodiesToRegistry(registry)
 
     def zoneGraph(self, zoneAABBs=None, aabb=None):
-        if _config.meshing == _config.meshingType.cgal_sm:
-            return self._zoneGraphPycgal()
+        if _config.meshing in (_config.meshingType.cgal_sm, _config.meshingType.cgal_sm_fast):
+            return self._zoneGraphPycgal(aabb=aabb)
 
         zones = self.zones
         n_zones = len(zones)
@@ -732,8 +730,8 @@ class Region(vis.ViewableMixin):
 
         return graph
 
-    def _zoneGraphPycgal(self):
-        meshes = [z.mesh() for z in self.zones]
+    def _zoneGraphPycgal(self, aabb=None):
+        meshes = [z.mesh(aabb=aabb) for z in self.zones]
         intersections = intersecting_meshes(meshes)
         graph = nx.Graph()
         graph.add_nodes_from(range(len(self.zones)))
@@ -0,0 +1,142 @@
+import logging as _log
+from collections import defaultdict as _defaultdict
+
+from . import Defines as _Defines
+
+_log = _log.getLogger(__name__)
+
+
+def variables(registry, obj):
+    """
+    Names of the defines in the registry that obj uses directly.
+
+    :param registry: registry containing the defines
+    :type registry: Registry
+    :param obj: define, expression string, number or (nested) list of these
+    :return: set of define names
+    """
+    result = set()
+
+    if obj is None or isinstance(obj, (bool, int, float)):
+        pass
+    elif isinstance(obj, str):
+        if obj in registry.defineDict:
+            result.add(obj)
+        else:
+            try:
+                names = registry.getExpressionParser().compile(obj).variables
+            except ValueError as e:
+                # invalid expression, so its dependencies are unknown
+                _log.warning("cannot find the defines used by %r: %s", obj, e)
+                names = []
+            result.update(n for n in names if n in registry.defineDict)
+    elif isinstance(obj, _Defines.BasicExpression):
+        result |= variables(registry, obj.expressionString)
+    elif isinstance(obj, (_Defines.ScalarBase, _Defines.VectorBase, _Defines.Matrix)):
+        if registry.defineDict.get(obj.name) is obj:
+            result.add(obj.name)
+        else:
+            result |= defineVariables(registry, obj)
+    elif isinstance(obj, (list, tuple)):
+        for o in obj:
+            result |= variables(registry, o)
+
+    return result
+
+
+def defineVariables(registry, define):
+    """
+    Names of the defines in the registry used by the expression(s) of a define.
+    """
+    if isinstance(define, _Defines.ScalarBase):
+        return variables(registry, define.expression)
+    elif isinstance(define, _Defines.VectorBase):
+        return variables(registry, [define.x, define.y, define.z])
+    elif isinstance(define, _Defines.Matrix):
+        return variables(registry, define.values)
+    return set()
+
+
+class DefineGraph:
+    """
+    Dependency graph between the defines and solids of a registry. For each define
+    it records which defines and solids use it so that when a define is changed only
+    the values and meshes downstream of it have to be recomputed.
+
+    :param registry: registry to build the graph for
+    :type registry: Registry
+    """
+
+    def __init__(self, registry):
+        self.registry = registry
+        self.build()
+
+    def build(self):
+        """
+        (Re)build the graph from all defines and solids in the registry.
+        """
+        self.defineUses = {}  # define name : set(define names)
+        self.defineUsers = _defaultdict(set)  # define name : set(define names)
+        self.solidUsers = _defaultdict(set)  # define name : set(solid names)
+        self.solidSolidUsers = _defaultdict(set)  # solid name : set(solid names)
+
+        for name, define in self.registry.defineDict.items():
+            self.updateDefine(define)
+
+        for solid in self.registry.solidDict.values():
+            self._addSolid(solid)
+
+    def updateDefine(self, define):
+        """
+        Update the edges of a define, e.g. after its expression has changed.
+        """
+        for used in self.defineUses.get(define.name, set()):
+            self.defineUsers[used].discard(define.name)
+
+        uses = defineVariables(self.registry, define)
+        uses.discard(define.name)
+        self.defineUses[define.name] = uses
+        for used in uses:
+            self.defineUsers[used].add(define.name)
+
+    def _addSolid(self, solid):
+        for varName in solid.varNames:
+            for used in variables(self.registry, getattr(solid, varName, None)):
+                self.solidUsers[used].add(solid.name)
+
+        for operand in solid._meshCacheOperands():
+            self.solidSolidUsers[operand.name].add(solid.name)
+
+    def dependents(self, defineName):
+        """
+        All defines and solids that depend (directly or indirectly) on a define.
+
+        :param defineName: name of the define
+        :type defineName: str
+        :return: list of define names and list of solid names
+        """
+        defines = []
+        seen = {defineName}
+        stack = [defineName]
+        while stack:
+            name = stack.pop()
+            for user in self.defineUsers.get(name, ()):
+                if user not in seen:
+                    seen.add(user)
+                    defines.append(user)
+                    stack.append(user)
+
+        solids = []
+        solidsSeen = set()
+        stack = []
+        for name in [defineName, *defines]:
+            stack.extend(self.solidUsers.get(name, ()))
+        while stack:
+            name = stack.pop()
+            if name in solidsSeen:
+                continue
+            solidsSeen.add(name)
+            solids.append(name)
+            stack.extend(self.solidSolidUsers.get(name, ()))
+
+        return defines, solids
@@ -45,15 +45,14 @@ class BasicExpression:
             if unit is not None:
                 return float(match_w_unit.group(1)) * unit
 
-        expressionParser = self.registry.getExpressionParser()
-        self.parseTree = expressionParser.parse(self.expressionString)
-        value = expressionParser.evaluate(self.parseTree, self.registry.defineDict)
+        # the expression is only parsed the first time it is seen
+        compiled = self.registry.getExpressionParser().compile(self.expressionString)
+        value = compiled(self.registry.defineDict)
         return value
 
     def variables(self, allDependents=False):
-        expressionParser = self.registry.getExpressionParser()
-        self.parseTree = expressionParser.parse(self.expressionString)
-        variables = expressionParser.get_variables(self.parseTree)
+        compiled = self.registry.getExpressionParser().compile(self.expressionString)
+        variables = list(compiled.variables)
         if allDependents:
             dependents = []
             for v in variables:
@@ -352,6 +351,8 @@ class ScalarBase(DefineBase):
         super().__init__(name, registry)
         self.expression = None
         self._typeName = typeName
+        self._value = None
+        self._valueKey = None
 
     def setName(self, name):
         """
@@ -365,16 +366,23 @@ class ScalarBase(DefineBase):
 
     def setExpression(self, expressionString):
         """
-        Take a string and make it into the BasicExpression type for this object.
+        Take a string and make it into the BasicExpression type for this object. If
+        this define is in a registry, the defines, solids and meshes that depend on it
+        are updated (see Registry.defineChanged).
 
         :param expressionString: Expression to store.
         :type expressionString: str
+        :return: names of the dependent defines, solids and logical volumes (or None)
         """
         self.expression = BasicExpression(
             f"expr_{self.name}",
             upgradeToStringExpression(self.registry, expressionString),
             self.registry,
         )
+        self._clearValue()
+
+        if self._isRegistered():
+            return self.registry.defineChanged(self)
 
     def setRegistry(self, registry):
         super().setRegistry(registry)
@@ -383,13 +391,39 @@ class ScalarBase(DefineBase):
 
     def eval(self):
         """
-        Evaluate the expression
+        Evaluate the expression. The value of defines in a registry is memoised until
+        this define or one it depends on is changed with setExpression.
 
         :return: numerical evaluation of Constant
         :rtype: float
         """
+        if not self._isRegistered():
+            return self._evaluate()
+
+        key = (
+            self.registry.defineGeneration,
+            self.expression.expressionString,
+            getattr(self, "unit", None),
+        )
+        if getattr(self, "_valueKey", None) != key:
+            self._value = self._evaluate()
+            self._valueKey = key
+        return self._value
+
+    def _evaluate(self):
         return self.expression.eval()
 
+    def _clearValue(self):
+        self._value = None
+        self._valueKey = None
+
+    def _isRegistered(self):
+        return (
+            self.registry is not None
+            and self.registry.defineDict.get(self.name) is self
+            and hasattr(self.registry, "defineGeneration")
+        )
+
     def __repr__(self):
         return self._typeName + f" : {self.name} = {self.expression!s}"
 
@@ -833,7 +867,7 @@ class Quantity(ScalarBase):
     def __repr__(self):
         return self._typeName + f" : {self.name} = {self.expression!s} [{self.unit}] {self.type}"
 
-    def eval(self):
+    def _evaluate(self):
         # it is possible for a quantity not to have a unit and it uses the units of variables in the expression
         if self.unit:
             uval = _Units.unit(self.unit)
@@ -841,7 +875,7 @@ class Quantity(ScalarBase):
             uval = 1.0
 
         # evaluate quantity with units baked in
-        return super().eval() * uval
+        return super()._evaluate() * uval
 
 
 class Variable(ScalarBase):
@@ -167,7 +167,188 @@ class GdmlExpressionEvalVisitor(GdmlExpressionVisitor):
                 return getattr(math, constant().getText())
 
 
+class GdmlExpressionCompileVisitor(GdmlExpressionVisitor):
+    """
+    Converts a parse tree into nested python closures of the form f(defines) which give
+    the same result as GdmlExpressionEvalVisitor, but can be evaluated repeatedly (with
+    different defines) without walking the parse tree again.
+    """
+
+    def visitVariable(self, ctx):
+        name = ctx.VARIABLE().getText()
+
+        def variable(defines):
+            try:
+                return defines[name]
+            except KeyError:
+                try:
+                    return _units[name]
+                except KeyError as err:
+                    msg = f"<= Undefined variable : {name}"
+                    if not err.args:
+                        err.args = ("",)
+                    err.args = (*err.args, msg)
+                    raise
+
+        return variable
+
+    def visitScientific(self, ctx):
+        value = float(ctx.SCIENTIFIC_NUMBER().getText())
+        return lambda defines: value
+
+    def visitMultiplyingExpression(self, ctx):
+        operands = [self.visit(e) for e in ctx.powExpression()]
+        times = [bool(op.TIMES()) for op in ctx.operatorMulDiv()]
+        first = operands[0]
+        rest = list(zip(times, operands[1:]))
+
+        if not rest:
+            return lambda defines: float(first(defines))
+
+        def multiplyingExpression(defines):
+            left = float(first(defines))
+            for t, operand in rest:
+                if t:
+                    left *= float(operand(defines))
+                else:
+                    left /= float(operand(defines))
+            return left
+
+        return multiplyingExpression
+
+    def visitExpression(self, ctx):
+        operands = [self.visit(e) for e in ctx.multiplyingExpression()]
+        plus = [bool(op.PLUS()) for op in ctx.operatorAddSub()]
+        first = operands[0]
+        rest = list(zip(plus, operands[1:]))
+
+        if not rest:
+            return lambda defines: float(first(defines))
+
+        def expression(defines):
+            left = float(first(defines))
+            for p, operand in rest:
+                if p:
+                    left += float(operand(defines))
+                else:
+                    left -= float(operand(defines))
+            return left
+
+        return expression
+
+    def visitPowExpression(self, ctx):
+        operands = [self.visit(e) for e in ctx.signedAtom()]
+        first = operands[0]
+        rest = operands[1:]
+
+        if not rest:
+            return lambda defines: float(first(defines))
+
+        def powExpression(defines):
+            base = float(first(defines))
+            for operand in rest:
+                base = base ** float(operand(defines))
+            return base
+
+        return powExpression
+
+    def visitMatrixElement(self, ctx):
+        matrix = self.visit(ctx.variable())
+        indices = [self.visit(e) for e in ctx.expression()]
+
+        def matrixElement(defines):
+            # decrement indices to match python 0-indexing
+            index = tuple(int(i(defines)) - 1 for i in indices)
+            return matrix(defines).values_asarray[index]
+
+        return matrixElement
+
+    def visitParens(self, ctx):
+        return self.visit(ctx.expression())
+
+    def visitSignedAtom(self, ctx):
+        sign = -1 if ctx.MINUS() else 1
+        if ctx.func():
+            value = self.visit(ctx.func())
+        elif ctx.atom():
+            value = self.visit(ctx.atom())
+        elif ctx.signedAtom():
+            value = self.visit(ctx.signedAtom())
+        else:
+            return lambda defines: sign * 0.0
+
+        if sign == 1:
+            return lambda defines: float(value(defines))
+        return lambda defines: -float(value(defines))
+
+    def visitAtom(self, ctx):
+        if ctx.constant():
+            value = self.visit(ctx.constant())
+        elif ctx.variable():
+            value = self.visit(ctx.variable())
+        elif ctx.expression():  # This handles expr with and without parens
+            value = self.visit(ctx.expression())
+        elif ctx.scientific():
+            value = self.visit(ctx.scientific())
+        elif ctx.matrixElement():
+            value = self.visit(ctx.matrixElement())
+        else:
+            msg = "Invalid atom."
+            raise ValueError(msg)
+
+        return lambda defines: float(value(defines))
+
+    def visitFunc(self, ctx):
+        function_name = str(ctx.funcname().getText())
+        if hasattr(builtins, function_name):
+            function = getattr(builtins, function_name)
+        elif hasattr(math, function_name):
+            function = getattr(math, function_name)
+        elif hasattr(numpy, function_name):
+            function = getattr(numpy, function_name)
+        else:
+            msg = f"Function {function_name} not found in 'builtins', 'numpy' or 'math'"
+            raise ValueError(msg)
+
+        arguments = [self.visit(expr) for expr in ctx.expression()]
+        return lambda defines: function(*[a(defines) for a in arguments])
+
+    def visitConstant(self, ctx):
+        value = getattr(math, ctx.getText())
+        return lambda defines: value
+
+
+class CompiledExpression:
+    """
+    An expression string compiled to a python function of the defines dictionary.
+
+    :param expression: expression string
+    :type expression: str
+    :param evaluate: function of the defines dictionary returning the value
+    :param variables: names of variables (defines or units) used in the expression
+    :type variables: list of str
+    """
+
+    def __init__(self, expression, evaluate, variables):
+        self.expression = expression
+        self.evaluate = evaluate
+        self.variables = variables
+
+    def __call__(self, define_dict):
+        return self.evaluate(define_dict)
+
+
 class ExpressionParser:
+    """
+    Parser for GDML expressions. Expressions are compiled once (see compile) and
+    the compiled form is shared by all parsers, as it does not depend on the
+    values of the defines.
+    """
+
+    # expression string : CompiledExpression
+    compiled = {}
+    maxCompiled = 1000000
+
     def __init__(self):
         self.visitor = GdmlExpressionEvalVisitor()
         self.defines_dict = {}
@@ -186,6 +367,24 @@ class ExpressionParser:
 
         return parse_tree
 
+    def compile(self, expression):
+        """
+        Return the CompiledExpression for an expression string, parsing it only the first
+        time it is seen.
+        """
+        compiled = self.compiled.get(expression)
+        if compiled is None:
+            parse_tree = self.parse(expression)
+            compiled = CompiledExpression(
+                expression,
+                GdmlExpressionCompileVisitor().visit(parse_tree),
+                self.get_variables(parse_tree),
+            )
+            if len(self.compiled) >= self.maxCompiled:
+                self.compiled.clear()
+            self.compiled[expression] = compiled
+        return compiled
+
     def evaluate(self, parse_tree, define_dict={}):
         # Update the defines dict for every evaluation
         self.visitor.defines = define_dict
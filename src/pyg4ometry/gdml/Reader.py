@@ -16,6 +16,86 @@ def isComment(node):
     return not node.attributes
 
 
+class _Attribute:
+    """
+    Attribute value of a _StreamElement (as xml.dom.minidom.Attr.value).
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+
+class _StreamText:
+    """
+    Text node of a _StreamElement (as xml.dom.minidom.Text).
+    """
+
+    __slots__ = ("nodeValue",)
+
+    ELEMENT_NODE = 1
+    TEXT_NODE = 3
+    nodeType = TEXT_NODE
+    attributes = None
+
+    def __init__(self, nodeValue):
+        self.nodeValue = nodeValue
+
+    @property
+    def data(self):
+        return self.nodeValue
+
+
+class _StreamElement:
+    """
+    Light weight element built by the streaming reader. Only provides the parts of the
+    xml.dom.minidom.Element interface used by the Reader parse functions.
+    """
+
+    __slots__ = ("tagName", "attributes", "childNodes")
+
+    ELEMENT_NODE = 1
+    TEXT_NODE = 3
+    nodeType = ELEMENT_NODE
+
+    def __init__(self, tagName, attributes):
+        self.tagName = tagName
+        self.attributes = {k: _Attribute(v) for k, v in attributes.items()}
+        self.childNodes = []
+
+    def getElementsByTagName(self, name):
+        # all descendants in document order
+        result = []
+        stack = list(reversed(self.childNodes))
+        while stack:
+            node = stack.pop()
+            if node.nodeType != node.ELEMENT_NODE:
+                continue
+            if node.tagName == name:
+                result.append(node)
+            stack.extend(reversed(node.childNodes))
+        return result
+
+
+def _collapseText(text):
+    """
+    Remove line breaks and indentation from element text in the same way as the
+    (non-streaming) reader does when it joins the lines of the file.
+    """
+    lines = text.split("\n")
+    result = ""
+    for i, l in enumerate(lines):
+        if i > 0:
+            l = l.lstrip()
+        if i < len(lines) - 1:
+            l = l.rstrip()
+            if l and not l.endswith(">"):
+                l += " "
+        result += l
+    return result if result.strip() else ""
+
+
 class Reader:
     """
     Read a GDML file.
@@ -28,6 +108,10 @@ class Reader:
     :type reduceNISTMaterialsToPredefined: bool
     :param makeAllVisible: loaded volumes with aux info to make them invisible will be ignored and made visible
     :type makeAllVisible: bool
+    :param streaming: parse the file incrementally (see loadStreaming) rather than building a complete DOM
+    :type streaming: bool
+    :param meshProcesses: if given, mesh all logical volumes after loading using this many processes (see Registry.meshAll), otherwise they are meshed when first used
+    :type meshProcesses: int
 
     When loading a GDML file that was exported by Geant4, the NIST materials may be
     fully expanded to include their full element / isotope composition. With the
@@ -43,9 +127,13 @@ class Reader:
         skipMaterials=False,
         reduceNISTMaterialsToPredefined=False,
         makeAllVisible=False,
+        streaming=True,
+        meshProcesses=None,
     ):
         super().__init__()
         self.filename = fileName
+        self.streaming = streaming
+        self.meshProcesses = meshProcesses
         self.registryOn = registryOn
         self._reduceNISTMaterialsToPredefined = reduceNISTMaterialsToPredefined
         self._makeAllVisible = makeAllVisible
@@ -61,6 +149,135 @@ class Reader:
         self.load()
 
     def load(self):
+        if self.streaming:
+            self.loadStreaming()
+        else:
+            self.loadMinidom()
+
+        if self.registryOn and self.meshProcesses:
+            self._registry.meshAll(self.meshProcesses)
+
+    def loadStreaming(self):
+        """
+        Parse the file with expat callbacks. Each child of the define, materials, solids
+        and structure sections is converted as soon as it has been read and then
+        discarded, so the whole document is never held in memory. ENTITY includes are
+        parsed from their files as they are referenced. The sections must be in the usual
+        GDML order (defines, materials, solids, structure).
+        """
+        _log.info("Reader.loadStreaming>")
+        self._physVolumeNameCount.clear()
+
+        materials = []
+        elements = []
+        isotopes = []
+        deferred = []  # setup and userinfo sections (processed at the end as in loadMinidom)
+        state = {"materialSubstitutionNames": None}
+
+        # stack of open elements, the root (gdml) element is never stored
+        stack = []
+        text = []
+
+        def flushText():
+            if text:
+                value = _collapseText("".join(text))
+                text.clear()
+                if value and stack and stack[-1] is not None:
+                    stack[-1].childNodes.append(_StreamText(value))
+
+        def startElement(name, attrs):
+            flushText()
+            depth = len(stack)
+            if depth == 0:
+                stack.append(None)  # gdml
+            elif depth == 1:
+                skip = name == "materials" and self._skipMaterials
+                stack.append(None if skip else _StreamElement(name, attrs))
+            elif stack[-1] is None:
+                stack.append(None)  # inside a skipped section
+            else:
+                element = _StreamElement(name, attrs)
+                # children of streamed sections are not attached to the section element
+                if depth > 2 or stack[1].tagName not in streamed:
+                    stack[-1].childNodes.append(element)
+                stack.append(element)
+
+        def endElement(name):
+            flushText()
+            element = stack.pop()
+            depth = len(stack)
+            if element is None:
+                return
+
+            if depth == 2 and stack[1].tagName in streamed:
+                streamed[stack[1].tagName](element)
+            elif depth == 1:
+                if element.tagName == "materials":
+                    state["materialSubstitutionNames"] = self._makeMaterials(
+                        materials, elements, isotopes
+                    )
+                    materials.clear()
+                    elements.clear()
+                    isotopes.clear()
+                elif element.tagName in ("setup", "userinfo"):
+                    deferred.append(element)
+
+        def characterData(data):
+            text.append(data)
+
+        streamed = {
+            "define": self.parseDefine,
+            "materials": lambda node: self._collectMaterial(node, materials, elements, isotopes),
+            "solids": self.parseSolid,
+            "structure": lambda node: self.extractStructureNodeData(
+                node, state["materialSubstitutionNames"]
+            ),
+        }
+
+        directory = _os.path.dirname(_os.path.abspath(self.filename))
+
+        def externalEntityRef(context, base, systemId, publicId):
+            # ENTITY includes are relative to the including file
+            entityParser = parser.ExternalEntityParserCreate(context)
+            with open(_os.path.join(base or directory, systemId), "rb") as f:
+                entityParser.ParseFile(f)
+            return 1
+
+        parser = _expat.ParserCreate()
+        parser.buffer_text = True
+        parser.SetBase(directory)
+        parser.StartElementHandler = startElement
+        parser.EndElementHandler = endElement
+        parser.CharacterDataHandler = characterData
+        parser.ExternalEntityRefHandler = externalEntityRef
+
+        with open(self.filename, "rb") as f:
+            try:
+                parser.ParseFile(f)
+            except _expat.ExpatError as ee:
+                _log.error(
+                    "%s (line %s, column %s)",
+                    _expat.ErrorString(ee.code),
+                    ee.lineno,
+                    ee.offset,
+                )
+                raise ee
+
+        for element in deferred:
+            if element.tagName == "setup":
+                self.xmlsetup = element
+                self.parseSetup(element)
+                break
+
+        for element in deferred:
+            if element.tagName == "userinfo":
+                self.userinfo = element
+                for chnode in element.childNodes:
+                    if chnode.nodeType == chnode.ELEMENT_NODE:
+                        self._parseAuxiliary(chnode)
+                break
+
+    def loadMinidom(self):
         _log.info("Reader.load>")
         self._physVolumeNameCount.clear()
 
@@ -158,73 +375,76 @@ class Reader:
             return
 
         for df in self.xmldefines.childNodes:
-            try:
-                define_type = df.tagName
-            except AttributeError:
-                # comment so continue
-                continue
+            self.parseDefine(df)
 
-            name = df.attributes["name"].value
-            attrs = df.attributes
+    def parseDefine(self, df):
+        try:
+            define_type = df.tagName
+        except AttributeError:
+            # comment so continue
+            return
 
-            keys = attrs.keys()
-            vals = [attr.value for attr in attrs.values()]
-            def_attrs = dict(zip(keys, vals))
+        name = df.attributes["name"].value
+        attrs = df.attributes
 
-            # parse positions and rotations
-            def getXYZ(def_attrs):
-                x = def_attrs.get("x", "0.0")
-                y = def_attrs.get("y", "0.0")
-                z = def_attrs.get("z", "0.0")
-                u = def_attrs.get("unit", None)
-                return (x, y, z, u)
+        keys = attrs.keys()
+        vals = [attr.value for attr in attrs.values()]
+        def_attrs = dict(zip(keys, vals))
 
-            # parse matrices
-            def getMatrix(def_attrs):
-                try:
-                    coldim = def_attrs["coldim"]
-                except KeyError:
-                    coldim = 0
-                values = def_attrs["values"].split()
-                return (coldim, values)
-
-            if define_type == "constant":
-                value = def_attrs["value"]
-                _defines.Constant(name, value, self._registry, True)
-            elif define_type == "quantity":
-                value = def_attrs["value"]
-                try:
-                    unit = def_attrs["unit"]
-                except KeyError:
-                    unit = None
-                try:
-                    qtype = def_attrs["type"]
-                except KeyError:
-                    qtype = None
-                _defines.Quantity(name, value, unit, qtype, self._registry, True)
-            elif define_type == "variable":
-                value = def_attrs["value"]
-                _defines.Variable(name, value, self._registry, True)
-            elif define_type == "expression":
-                value = df.childNodes[0].nodeValue
-                _defines.Expression(name, value, self._registry, True)
-            elif define_type == "position":
-                (x, y, z, u) = getXYZ(def_attrs)
-                unit = u if u else "mm"
-                _defines.Position(name, x, y, z, unit, self._registry, True)
-            elif define_type == "rotation":
-                (x, y, z, u) = getXYZ(def_attrs)
-                unit = u if u else "rad"
-                _defines.Rotation(name, x, y, z, unit, self._registry, True)
-            elif define_type == "scale":
-                (x, y, z, u) = getXYZ(def_attrs)
-                unit = u if u else "none"
-                _defines.Scale(name, x, y, z, unit, self._registry, True)
-            elif define_type == "matrix":
-                (coldim, values) = getMatrix(def_attrs)
-                _defines.Matrix(name, coldim, values, self._registry, True)
-            else:
-                _log.warning("unrecognised define: %s", define_type)
+        # parse positions and rotations
+        def getXYZ(def_attrs):
+            x = def_attrs.get("x", "0.0")
+            y = def_attrs.get("y", "0.0")
+            z = def_attrs.get("z", "0.0")
+            u = def_attrs.get("unit", None)
+            return (x, y, z, u)
+
+        # parse matrices
+        def getMatrix(def_attrs):
+            try:
+                coldim = def_attrs["coldim"]
+            except KeyError:
+                coldim = 0
+            values = def_attrs["values"].split()
+            return (coldim, values)
+
+        if define_type == "constant":
+            value = def_attrs["value"]
+            _defines.Constant(name, value, self._registry, True)
+        elif define_type == "quantity":
+            value = def_attrs["value"]
+            try:
+                unit = def_attrs["unit"]
+            except KeyError:
+                unit = None
+            try:
+                qtype = def_attrs["type"]
+            except KeyError:
+                qtype = None
+            _defines.Quantity(name, value, unit, qtype, self._registry, True)
+        elif define_type == "variable":
+            value = def_attrs["value"]
+            _defines.Variable(name, value, self._registry, True)
+        elif define_type == "expression":
+            value = df.childNodes[0].nodeValue
+            _defines.Expression(name, value, self._registry, True)
+        elif define_type == "position":
+            (x, y, z, u) = getXYZ(def_attrs)
+            unit = u if u else "mm"
+            _defines.Position(name, x, y, z, unit, self._registry, True)
+        elif define_type == "rotation":
+            (x, y, z, u) = getXYZ(def_attrs)
+            unit = u if u else "rad"
+            _defines.Rotation(name, x, y, z, unit, self._registry, True)
+        elif define_type == "scale":
+            (x, y, z, u) = getXYZ(def_attrs)
+            unit = u if u else "none"
+            _defines.Scale(name, x, y, z, unit, self._registry, True)
+        elif define_type == "matrix":
+            (coldim, values) = getMatrix(def_attrs)
+            _defines.Matrix(name, coldim, values, self._registry, True)
+        else:
+            _log.warning("unrecognised define: %s", define_type)
 
     def parseVector(self, node, type="position", addRegistry=True):
         try:
@@ -275,118 +495,123 @@ class Reader:
         self.materialdef = xmldoc.getElementsByTagName("materials")[0]
 
         for node in self.materialdef.childNodes:
-            if node.nodeType != node.ELEMENT_NODE:
-                # probably a comment node, skip
-                continue
+            self._collectMaterial(node, materials, elements, isotopes)
 
-            mat_type = node.tagName
+        materialSubstitutionNames = self._makeMaterials(materials, elements, isotopes)
+        return materialSubstitutionNames
 
-            name = node.attributes["name"].value
-            attrs = node.attributes
+    def _collectMaterial(self, node, materials, elements, isotopes):
+        """
+        Collect the attributes of an isotope, element or material node in the
+        corresponding list. These are constructed afterwards by _makeMaterials.
+        """
+        if node.nodeType != node.ELEMENT_NODE:
+            # probably a comment node, skip
+            return
 
-            keys = attrs.keys()
-            vals = [attr.value for attr in attrs.values()]
-            def_attrs = dict(zip(keys, vals))
+        mat_type = node.tagName
 
-            if mat_type == "isotope":
-                for chNode in node.childNodes:
-                    if chNode.nodeType != chNode.ELEMENT_NODE:
-                        continue  # comment
+        name = node.attributes["name"].value
+        attrs = node.attributes
 
-                    if chNode.tagName == "atom":
-                        def_attrs["a"] = chNode.attributes["value"].value
+        keys = attrs.keys()
+        vals = [attr.value for attr in attrs.values()]
+        def_attrs = dict(zip(keys, vals))
 
-                isotopes.append(def_attrs)
+        if mat_type == "isotope":
+            for chNode in node.childNodes:
+                if chNode.nodeType != chNode.ELEMENT_NODE:
+                    continue  # comment
 
-            elif mat_type == "element":
-                components = []
-                for chNode in node.childNodes:
-                    if chNode.nodeType != chNode.ELEMENT_NODE:
-                        continue  # comment
+                if chNode.tagName == "atom":
+                    def_attrs["a"] = chNode.attributes["value"].value
 
-                    if chNode.tagName == "atom":
-                        def_attrs["a"] = chNode.attributes["value"].value
+            isotopes.append(def_attrs)
 
-                    elif chNode.tagName == "fraction":
-                        keys = chNode.attributes.keys()
-                        vals = [attr.value for attr in chNode.attributes.values()]
-                        comp = dict(zip(keys, vals))
-                        comp["comp_type"] = "fraction"
-                        components.append(comp)
+        elif mat_type == "element":
+            components = []
+            for chNode in node.childNodes:
+                if chNode.nodeType != chNode.ELEMENT_NODE:
+                    continue  # comment
 
-                def_attrs["components"] = components
-                elements.append(def_attrs)
+                if chNode.tagName == "atom":
+                    def_attrs["a"] = chNode.attributes["value"].value
 
-            elif mat_type == "material":
-                components = []
-                properties = {}
+                elif chNode.tagName == "fraction":
+                    keys = chNode.attributes.keys()
+                    vals = [attr.value for attr in chNode.attributes.values()]
+                    comp = dict(zip(keys, vals))
+                    comp["comp_type"] = "fraction"
+                    components.append(comp)
 
-                try:
-                    state = node.attributes["state"].value
-                except:
-                    state = None
-                for chNode in node.childNodes:
-                    if chNode.nodeType != chNode.ELEMENT_NODE:
-                        continue  # comment
-
-                    if chNode.tagName == "D":
-                        def_attrs["density"] = chNode.attributes["value"].value
-
-                    elif chNode.tagName == "T":
-                        def_attrs["temperature"] = chNode.attributes["value"].value
-                        try:
-                            def_attrs["temperature_unit"] = chNode.attributes["unit"].value
-                        except KeyError:
-                            def_attrs["temperature_unit"] = "K"
+            def_attrs["components"] = components
+            elements.append(def_attrs)
 
-                    elif chNode.tagName == "P":
-                        def_attrs["pressure"] = chNode.attributes["value"].value
-                        try:
-                            def_attrs["pressure_unit"] = chNode.attributes["unit"].value
-                        except KeyError:
-                            def_attrs["pressure_unit"] = "pascal"
-
-                    elif chNode.tagName == "atom":
-                        def_attrs["a"] = chNode.attributes["value"].value
-
-                    elif chNode.tagName == "composite":
-                        keys = chNode.attributes.keys()
-                        vals = [attr.value for attr in chNode.attributes.values()]
-                        comp = dict(zip(keys, vals))
-                        comp["comp_type"] = "composite"
-                        components.append(comp)
-
-                    elif chNode.tagName == "fraction":
-                        keys = chNode.attributes.keys()
-                        vals = [attr.value for attr in chNode.attributes.values()]
-                        comp = dict(zip(keys, vals))
-                        comp["comp_type"] = "fraction"
-                        components.append(comp)
-
-                    elif chNode.tagName == "property":
-                        try:
-                            properties[chNode.attributes["name"].value] = chNode.attributes[
-                                "value"
-                            ].value
-                        except KeyError:
-                            pass
+        elif mat_type == "material":
+            components = []
+            properties = {}
 
-                        try:
-                            properties[chNode.attributes["name"].value] = chNode.attributes[
-                                "ref"
-                            ].value
-                        except KeyError:
-                            pass
+            try:
+                state = node.attributes["state"].value
+            except:
+                state = None
+            for chNode in node.childNodes:
+                if chNode.nodeType != chNode.ELEMENT_NODE:
+                    continue  # comment
 
-                def_attrs["components"] = components
-                def_attrs["properties"] = properties
-                materials.append(def_attrs)
+                if chNode.tagName == "D":
+                    def_attrs["density"] = chNode.attributes["value"].value
 
-            else:
-                _log.warning("Unrecognised define: %s", mat_type)
+                elif chNode.tagName == "T":
+                    def_attrs["temperature"] = chNode.attributes["value"].value
+                    try:
+                        def_attrs["temperature_unit"] = chNode.attributes["unit"].value
+                    except KeyError:
+                        def_attrs["temperature_unit"] = "K"
 
-        materialSubstitutionNames = self._makeMaterials(materials, elements, isotopes)
-        return materialSubstitutionNames
+                elif chNode.tagName == "P":
+                    def_attrs["pressure"] = chNode.attributes["value"].value
+                    try:
+                        def_attrs["pressure_unit"] = chNode.attributes["unit"].value
+                    except KeyError:
+                        def_attrs["pressure_unit"] = "pascal"
+
+                elif chNode.tagName == "atom":
+                    def_attrs["a"] = chNode.attributes["value"].value
+
+                elif chNode.tagName == "composite":
+                    keys = chNode.attributes.keys()
+                    vals = [attr.value for attr in chNode.attributes.values()]
+                    comp = dict(zip(keys, vals))
+                    comp["comp_type"] = "composite"
+                    components.append(comp)
+
+                elif chNode.tagName == "fraction":
+                    keys = chNode.attributes.keys()
+                    vals = [attr.value for attr in chNode.attributes.values()]
+                    comp = dict(zip(keys, vals))
+                    comp["comp_type"] = "fraction"
+                    components.append(comp)
+
+                elif chNode.tagName == "property":
+                    try:
+                        properties[chNode.attributes["name"].value] = chNode.attributes[
+                            "value"
+                        ].value
+                    except KeyError:
+                        pass
+
+                    try:
+                        properties[chNode.attributes["name"].value] = chNode.attributes["ref"].value
+                    except KeyError:
+                        pass
+
+            def_attrs["components"] = components
+            def_attrs["properties"] = properties
+            materials.append(def_attrs)
+
+        else:
+            _log.warning("Unrecognised define: %s", mat_type)
 
     def _makeMaterials(self, materials, elements, isotopes):
         """
@@ -557,84 +782,87 @@ class Reader:
         self.xmlsolids = xmldoc.getElementsByTagName("solids")[0]
 
         for node in self.xmlsolids.childNodes:
-            try:
-                solid_type = node.tagName
-            except AttributeError:
-                continue  # node is probably a comment so continue
-
-            if solid_type == "box":  # solid test 001
-                self.parseBox(node)
-            elif solid_type == "tube":  # solid test 002
-                self.parseTube(node)
-            elif solid_type == "cutTube":  # solid test 003
-                self.parseCutTube(node)
-            elif solid_type == "cone":  # solid test 004 (problem when rmin1 == rmin2 != 0)
-                self.parseCone(node)
-            elif solid_type == "para":  # solid test 005
-                self.parsePara(node)
-            elif solid_type == "trd":  # solid test 006
-                self.parseTrd(node)
-            elif solid_type == "trap":  # solid test 007
-                self.parseTrap(node)
-            elif solid_type == "sphere":  # solid test 008
-                self.parseSphere(node)
-            elif solid_type == "orb":  # solid test 009
-                self.parseOrb(node)
-            elif solid_type == "torus":  # solid test 010
-                self.parseTorus(node)
-            elif solid_type == "polycone":  # solid test 011
-                self.parsePolycone(node)
-            elif solid_type == "genericPolycone":  # solid test 012
-                self.parseGenericPolycone(node)
-            elif solid_type == "polyhedra":  # solid test 013
-                self.parsePolyhedra(node)
-            elif solid_type == "genericPolyhedra":  # solid test 014
-                self.parseGenericPolyhedra(node)
-            elif solid_type == "eltube":  # solid test 015
-                self.parseEllipticalTube(node)
-            elif solid_type == "ellipsoid":  # solid test 016
-                self.parseEllipsoid(node)
-            elif solid_type == "elcone":  # solid test 017
-                self.parseEllipticalCone(node)
-            elif solid_type == "paraboloid":  # solid test 018
-                self.parseParaboloid(node)
-            elif solid_type == "hype":  # solid test 019
-                self.parseHype(node)
-            elif solid_type == "tet":  # solid test 020
-                self.parseTet(node)
-            elif solid_type == "xtru":  # solid test 021
-                self.parseExtrudedSolid(node)
-            elif solid_type == "twistedbox":  # solid test 022
-                self.parseTwistedBox(node)
-            elif solid_type == "twistedtrap":  # solid test 023
-                self.parseTwistedTrap(node)
-            elif solid_type == "twistedtrd":  # solid test 024
-                self.parseTwistedTrd(node)
-            elif solid_type == "twistedtubs":  # solid test 025
-                self.parseTwistedTubs(node)
-            elif solid_type == "arb8":  # solid test 026
-                self.parseGenericTrap(node)
-            elif solid_type == "tessellated":  # solid test 027
-                self.parseTessellatedSolid(node)
-            elif solid_type == "union":  # solid test 028
-                self.parseUnion(node)
-            elif solid_type == "subtraction":  # solid test 029
-                self.parseSubtraction(node)
-            elif solid_type == "intersection":  # solid test 030
-                self.parseIntersection(node)
-            elif solid_type == "multiUnion":  # solid test 031
-                self.parseMultiUnion(node)
-            elif solid_type == "opticalsurface":
-                self.parseOpticalSurface(node)
-            elif solid_type == "scaledSolid":
-                self.parseScaledSolid(node)
-            elif solid_type == "loop":
-                pass
-                # self.parseSolidLoop(node)
-            else:
-                _log.warning(
-                    "unrecognized solid %s (name=%s)", solid_type, node.attributes["name"].value
-                )
+            self.parseSolid(node)
+
+    def parseSolid(self, node):
+        try:
+            solid_type = node.tagName
+        except AttributeError:
+            return  # node is probably a comment so skip
+
+        if solid_type == "box":  # solid test 001
+            self.parseBox(node)
+        elif solid_type == "tube":  # solid test 002
+            self.parseTube(node)
+        elif solid_type == "cutTube":  # solid test 003
+            self.parseCutTube(node)
+        elif solid_type == "cone":  # solid test 004 (problem when rmin1 == rmin2 != 0)
+            self.parseCone(node)
+        elif solid_type == "para":  # solid test 005
+            self.parsePara(node)
+        elif solid_type == "trd":  # solid test 006
+            self.parseTrd(node)
+        elif solid_type == "trap":  # solid test 007
+            self.parseTrap(node)
+        elif solid_type == "sphere":  # solid test 008
+            self.parseSphere(node)
+        elif solid_type == "orb":  # solid test 009
+            self.parseOrb(node)
+        elif solid_type == "torus":  # solid test 010
+            self.parseTorus(node)
+        elif solid_type == "polycone":  # solid test 011
+            self.parsePolycone(node)
+        elif solid_type == "genericPolycone":  # solid test 012
+            self.parseGenericPolycone(node)
+        elif solid_type == "polyhedra":  # solid test 013
+            self.parsePolyhedra(node)
+        elif solid_type == "genericPolyhedra":  # solid test 014
+            self.parseGenericPolyhedra(node)
+        elif solid_type == "eltube":  # solid test 015
+            self.parseEllipticalTube(node)
+        elif solid_type == "ellipsoid":  # solid test 016
+            self.parseEllipsoid(node)
+        elif solid_type == "elcone":  # solid test 017
+            self.parseEllipticalCone(node)
+        elif solid_type == "paraboloid":  # solid test 018
+            self.parseParaboloid(node)
+        elif solid_type == "hype":  # solid test 019
+            self.parseHype(node)
+        elif solid_type == "tet":  # solid test 020
+            self.parseTet(node)
+        elif solid_type == "xtru":  # solid test 021
+            self.parseExtrudedSolid(node)
+        elif solid_type == "twistedbox":  # solid test 022
+            self.parseTwistedBox(node)
+        elif solid_type == "twistedtrap":  # solid test 023
+            self.parseTwistedTrap(node)
+        elif solid_type == "twistedtrd":  # solid test 024
+            self.parseTwistedTrd(node)
+        elif solid_type == "twistedtubs":  # solid test 025
+            self.parseTwistedTubs(node)
+        elif solid_type == "arb8":  # solid test 026
+            self.parseGenericTrap(node)
+        elif solid_type == "tessellated":  # solid test 027
+            self.parseTessellatedSolid(node)
+        elif solid_type == "union":  # solid test 028
+            self.parseUnion(node)
+        elif solid_type == "subtraction":  # solid test 029
+            self.parseSubtraction(node)
+        elif solid_type == "intersection":  # solid test 030
+            self.parseIntersection(node)
+        elif solid_type == "multiUnion":  # solid test 031
+            self.parseMultiUnion(node)
+        elif solid_type == "opticalsurface":
+            self.parseOpticalSurface(node)
+        elif solid_type == "scaledSolid":
+            self.parseScaledSolid(node)
+        elif solid_type == "loop":
+            pass
+            # self.parseSolidLoop(node)
+        else:
+            _log.warning(
+                "unrecognized solid %s (name=%s)", solid_type, node.attributes["name"].value
+            )
 
     def parseBox(self, node):
         solid_name = node.attributes["name"].value
@@ -1847,7 +2075,10 @@ class Reader:
 
         # find world logical volume
         self.xmlsetup = xmldoc.getElementsByTagName("setup")[0]
-        worldLvName = self.xmlsetup.childNodes[0].attributes["ref"].value
+        self.parseSetup(self.xmlsetup)
+
+    def parseSetup(self, node):
+        worldLvName = node.childNodes[0].attributes["ref"].value
         self._registry.orderLogicalVolumes(worldLvName)
         self._registry.setWorld(worldLvName)
 
@@ -1955,7 +2186,7 @@ class Reader:
                 except IndexError:
                     fileref = chNode.getElementsByTagName("file")[0].attributes["name"].value
                     _log.debug("got filref %s", fileref)
-                    r = Reader(fileref, skipMaterials=self._skipMaterials)
+                    r = Reader(fileref, skipMaterials=self._skipMaterials, streaming=self.streaming)
                     fileReg = r.getRegistry()
                     fileReg.name = fileref
                     fileLV = r.getRegistry().getWorldVolume()
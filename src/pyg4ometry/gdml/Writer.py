@@ -1,14 +1,110 @@
-from xml.dom import getDOMImplementation
 from ..geant4._Material import Material as _Material
 from ..geant4._Material import Element as _Element
 from ..geant4._Material import Isotope as _Isotope
 from ..gdml import Defines as _Defines
 from .. import geant4 as _g4
+import io as _io
 import logging as _log
 
 _log = _log.getLogger(__name__)
 
 
+def _writeData(f, data):
+    # as xml.dom.minidom._write_data
+    if data:
+        f.write(
+            str(data)
+            .replace("&", "&amp;")
+            .replace("<", "&lt;")
+            .replace('"', "&quot;")
+            .replace(">", "&gt;")
+        )
+
+
+class _XmlText:
+    __slots__ = ("data",)
+
+    def __init__(self, data):
+        self.data = data
+
+    def writexml(self, f, indent="", addindent="", newl=""):
+        _writeData(f, f"{indent}{self.data}{newl}")
+
+
+class _XmlElement:
+    """
+    Minimal XML element with the parts of the xml.dom.minidom interface used by the
+    Writer. Much smaller than a minidom element and written out (see writexml) in
+    exactly the same format as minidom.
+    """
+
+    __slots__ = ("tagName", "attributes", "childNodes")
+
+    def __init__(self, tagName):
+        self.tagName = tagName
+        self.attributes = {}
+        self.childNodes = []
+
+    def setAttribute(self, name, value):
+        self.attributes[name] = value
+
+    def getAttribute(self, name):
+        return self.attributes.get(name, "")
+
+    def appendChild(self, node):
+        self.childNodes.append(node)
+        return node
+
+    def removeChild(self, node):
+        self.childNodes.remove(node)
+        return node
+
+    def writexml(self, f, indent="", addindent="", newl=""):
+        f.write(indent + "<" + self.tagName)
+        for name, value in self.attributes.items():
+            f.write(f' {name}="')
+            _writeData(f, value)
+            f.write('"')
+
+        if self.childNodes:
+            f.write(">")
+            if len(self.childNodes) == 1 and isinstance(self.childNodes[0], _XmlText):
+                self.childNodes[0].writexml(f, "", "", "")
+            else:
+                f.write(newl)
+                childIndent = indent + addindent
+                for node in self.childNodes:
+                    node.writexml(f, childIndent, addindent, newl)
+                f.write(indent)
+            f.write(f"</{self.tagName}>{newl}")
+        else:
+            f.write(f"/>{newl}")
+
+
+class _XmlDocument:
+    """
+    Minimal XML document used in place of an xml.dom.minidom.Document by the Writer.
+    """
+
+    def __init__(self, tagName):
+        self.documentElement = _XmlElement(tagName)
+
+    def createElement(self, tagName):
+        return _XmlElement(tagName)
+
+    def createTextNode(self, data):
+        return _XmlText(data)
+
+    def writexml(self, f, indent="", addindent="", newl=""):
+        f.write(f'<?xml version="1.0" ?>{newl}')
+        self.documentElement.writexml(f, indent, addindent, newl)
+
+    def toprettyxml(self, indent="\t", newl="\n"):
+        f = _io.StringIO()
+        self.writexml(f, "", indent, newl)
+        return f.getvalue()
+
+
 class Writer:
     """
     :param writeColour: whether to write the VisOptions of each LogicalVolume.
@@ -21,8 +117,7 @@ class Writer:
         self.prepend = prepend
         self._writeColour = writeColour
 
-        self.imp = getDOMImplementation()
-        self.doc = self.imp.createDocument(None, "gdml", None)
+        self.doc = _XmlDocument("gdml")
         self.top = self.doc.documentElement
         self.top.setAttribute("xmlns:xsi", "http://www.w3.org/2001/XMLSchema-instance")
         self.top.setAttribute(
@@ -106,11 +201,25 @@ class Writer:
         we.setAttribute("ref", self.prepend + registry.worldName)
         self.setup.appendChild(we)
 
-    def write(self, filename):
-        f = open(filename, "w")
-        xmlString = self.doc.toprettyxml()
-        f.write(xmlString)
-        f.close()
+    def write(self, filename, pretty=True, bufferSize=1 << 20):
+        """
+        Write the GDML document. Elements are written directly to the (buffered) file
+        rather than first building the whole text in memory.
+
+        :param filename: path of the output file or open text file object
+        :type filename: str, pathlib.Path, file
+        :param pretty: indent the elements (one per line) as xml.dom.minidom.toprettyxml
+        :type pretty: bool
+        :param bufferSize: size of the write buffer in bytes
+        :type bufferSize: int
+        """
+        addindent, newl = ("\t", "\n") if pretty else ("", "")
+
+        if hasattr(filename, "write"):
+            self.doc.writexml(filename, "", addindent, newl)
+        else:
+            with open(filename, "w", buffering=bufferSize) as f:
+                self.doc.writexml(f, "", addindent, newl)
 
     def writeGMADTesterNoBeamline(self, gmad, gdml):
         text = f"""test: placement, geometryFile="gdml:{gdml}";
@@ -902,6 +1011,19 @@ option, physicsList="em";
         qf.setAttribute("type", "ABSOLUTE")
         return qf
 
+    def writeVertexDefine(self, name, vertex):
+        """
+        Write a position define (in mm) for a vertex of a tessellated solid. Equivalent to
+        writeDefine(Position(name, *vertex)) without creating a Position for every vertex.
+        """
+        vn = self.doc.createElement("position")
+        vn.setAttribute("name", name)
+        vn.setAttribute("x", _Defines.upgradeToStringExpression(None, vertex[0]))
+        vn.setAttribute("y", _Defines.upgradeToStringExpression(None, vertex[1]))
+        vn.setAttribute("z", _Defines.upgradeToStringExpression(None, vertex[2]))
+        vn.setAttribute("unit", "mm")
+        self.defines.appendChild(vn)
+
     def writeTessellatedSolid(self, instance):
         oe = self.doc.createElement("tessellated")
         name = instance.name
@@ -921,7 +1043,7 @@ option, physicsList="em";
                 defname = f"{name}_{vertex_id}"
                 vert_names.append(defname)
 
-                self.writeDefine(_Defines.Position(defname, v[0], v[1], v[2]))
+                self.writeVertexDefine(defname, v)
 
             for f in facet:
                 oe.appendChild(facet_makers[len(f)](*[vert_names[fi] for fi in f]))
@@ -936,7 +1058,7 @@ option, physicsList="em";
                 for vertex_id, v in enumerate(f[0]):
                     defname = f"{name}_f{facet_id}_v{vertex_id}"
                     vertex_names.append(defname)
-                    self.writeDefine(_Defines.Position(defname, v[0], v[1], v[2]))
+                    self.writeVertexDefine(defname, v)
 
                 oe.appendChild(
                     self.createTriangularFacet(vertex_names[0], vertex_names[1], vertex_names[2])
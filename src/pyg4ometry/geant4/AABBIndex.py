@@ -0,0 +1,113 @@
+import numpy as _np
+
+
+class AABBIndex:
+    """
+    Sweep-and-prune broad phase over a set of axis aligned bounding boxes. Used to find
+    candidate pairs of volumes (or faces) whose boxes overlap, so exact (and expensive) mesh
+    operations are only performed on pairs that can actually intersect.
+
+    The boxes are sorted by their lower edge along the axis with the largest spread of box
+    centres. For each box only the boxes that start before it ends along this axis are
+    tested on the remaining two axes.
+
+    :param extents: list of [[xmin, ymin, zmin], [xmax, ymax, zmax]] for each box
+    :type extents: list, numpy.ndarray
+    :param tolerance: padding added to each side of every box so touching boxes are reported
+    :type tolerance: float
+    """
+
+    def __init__(self, extents, tolerance=0.0):
+        extents = _np.asarray(extents, dtype=float).reshape(-1, 2, 3)
+
+        self.tolerance = tolerance
+        self.mins = extents[:, 0, :] - tolerance
+        self.maxs = extents[:, 1, :] + tolerance
+
+        # sweep along the axis where the boxes are most spread out
+        if len(self) > 1:
+            centres = 0.5 * (self.mins + self.maxs)
+            self.axis = int(_np.argmax(centres.var(axis=0)))
+        else:
+            self.axis = 0
+
+        self._order = _np.argsort(self.mins[:, self.axis], kind="stable")
+        self._sortedMins = self.mins[self._order, self.axis]
+
+    def __len__(self):
+        return len(self.mins)
+
+    def overlap(self, i, j):
+        """
+        Return True if the (padded) boxes i and j overlap or touch.
+        """
+        return bool(_np.all(self.mins[i] <= self.maxs[j]) and _np.all(self.mins[j] <= self.maxs[i]))
+
+    def pairs(self):
+        """
+        Return a sorted list of index pairs (i, j) with i < j for all boxes that overlap.
+        """
+        a = self.axis
+        result = []
+
+        for k, i in enumerate(self._order):
+            # boxes starting (along the sweep axis) before box i ends
+            end = _np.searchsorted(self._sortedMins, self.maxs[i, a], side="right")
+            candidates = self._order[k + 1 : end]
+            if len(candidates) == 0:
+                continue
+
+            mask = _np.all(
+                (self.mins[candidates] <= self.maxs[i]) & (self.maxs[candidates] >= self.mins[i]),
+                axis=1,
+            )
+            for j in candidates[mask]:
+                result.append((int(min(i, j)), int(max(i, j))))
+
+        result.sort()
+        return result
+
+    def query(self, vMin, vMax):
+        """
+        Return a sorted list of indices of the boxes that overlap the box [vMin, vMax]. The
+        tolerance of the index is also applied to the query box.
+        """
+        if len(self) == 0:
+            return []
+
+        vMin = _np.asarray(vMin, dtype=float) - self.tolerance
+        vMax = _np.asarray(vMax, dtype=float) + self.tolerance
+
+        end = _np.searchsorted(self._sortedMins, vMax[self.axis], side="right")
+        candidates = self._order[:end]
+
+        mask = _np.all((self.mins[candidates] <= vMax) & (self.maxs[candidates] >= vMin), axis=1)
+        return sorted(int(i) for i in candidates[mask])
+
+    def containedIn(self, vMin, vMax):
+        """
+        Return a boolean array, True for each box that lies entirely inside the box [vMin, vMax].
+        The (padded) boxes must be inside the query box which is not padded.
+        """
+        vMin = _np.asarray(vMin, dtype=float)
+        vMax = _np.asarray(vMax, dtype=float)
+        return _np.all((self.mins >= vMin) & (self.maxs <= vMax), axis=1)
+
+
+def meshFaceExtents(mesh):
+    """
+    Return the axis aligned extents of each face of a mesh as a numpy array of shape
+    (nfaces, 2, 3), suitable for building an AABBIndex.
+
+    :param mesh: mesh (pycsg or pycgal CSG)
+    """
+    verts, connectivity, offsets = mesh.toNumpy()
+    if len(offsets) < 2:
+        return _np.zeros((0, 2, 3))
+
+    # per face minimum and maximum over the vertices of each face
+    faceVerts = verts[connectivity]
+    extents = _np.empty((len(offsets) - 1, 2, 3))
+    extents[:, 0] = _np.minimum.reduceat(faceVerts, offsets[:-1], axis=0)
+    extents[:, 1] = _np.maximum.reduceat(faceVerts, offsets[:-1], axis=0)
+    return extents
@@ -1,10 +1,16 @@
 from .. import config as _config
 from ..visualisation import Mesh as _Mesh
 from ..visualisation import OverlapType as _OverlapType
+from ..visualisation import _getBoundingBox
+from ..visualisation import _meshToArrays
+from ..visualisation import _arraysToMesh
 from . import solid as _solid
 from . import _Material as _mat
 from .. import transformation as _trans
 from .AssemblyVolume import AssemblyVolume as _AssemblyVolume
+from .AABBIndex import AABBIndex as _AABBIndex
+from .AABBIndex import meshFaceExtents as _meshFaceExtents
+from .solid.MeshCache import meshCache as _meshCache
 from ..gdml import Constant as _Constant
 from .. import convert as _convert
 
@@ -48,6 +54,151 @@ def _solid2tessellated(solid):
     return tesselated_solid
 
 
+def _runOverlapTest(overlapType, mesh1, mesh2, boundingMesh1=None, boundingMesh2=None):
+    """
+    Evaluate a single overlap test (see LogicalVolume._getOverlapTests). The bounding
+    meshes are tested first to cull the test. Returns the overlap mesh or None.
+    """
+    if overlapType == _OverlapType.overlap:
+        # first check if bounding mesh intersects
+        if boundingMesh1.intersect(boundingMesh2).vertexCount() == 0:
+            return None
+        # bounding meshes collide, so check full mesh properly
+        result = mesh1.intersect(mesh2)
+    elif overlapType == _OverlapType.protrusion:
+        if boundingMesh1.subtract(boundingMesh2).vertexCount() == 0:
+            return None
+        result = mesh1.subtract(mesh2)
+    else:
+        if boundingMesh1 is not None:
+            cullIntersection = boundingMesh1.intersect(boundingMesh2)
+            cullCoplanar = boundingMesh1.coplanarIntersection(boundingMesh2)
+            if cullIntersection.vertexCount() == 0 and cullCoplanar.vertexCount() == 0:
+                return None
+        result = mesh1.coplanarIntersection(mesh2)
+
+    if result.vertexCount() == 0:
+        return None
+    return result
+
+
+# meshes for the overlap tests in a worker process
+_overlapWorkerMeshArrays = []
+_overlapWorkerMeshes = {}
+
+
+def _overlapWorkerInit(meshArrays):
+    global _overlapWorkerMeshArrays, _overlapWorkerMeshes
+    _overlapWorkerMeshArrays = meshArrays
+    _overlapWorkerMeshes = {}
+
+
+def _overlapWorkerMesh(index):
+    if index is None:
+        return None
+    if index not in _overlapWorkerMeshes:
+        _overlapWorkerMeshes[index] = _arraysToMesh(*_overlapWorkerMeshArrays[index])
+    return _overlapWorkerMeshes[index]
+
+
+def _overlapWorkerRun(job):
+    overlapType, meshIndices = job[0], job[1:]
+    result = _runOverlapTest(overlapType, *[_overlapWorkerMesh(i) for i in meshIndices])
+    if result is None:
+        return None
+    return _meshToArrays(result)
+
+
+def _runOverlapTestsParallel(tests, nProcesses):
+    """
+    Evaluate overlap tests in a pool of worker processes. Each distinct mesh is sent once
+    to each worker as compact arrays. The results are returned in the order of the tests.
+    """
+    import multiprocessing as _multiprocessing
+
+    if len(tests) == 0:
+        return []
+
+    meshIndex = {}
+    meshArrays = []
+
+    def index(mesh):
+        if mesh is None:
+            return None
+        if id(mesh) not in meshIndex:
+            meshIndex[id(mesh)] = len(meshArrays)
+            meshArrays.append(_meshToArrays(mesh))
+        return meshIndex[id(mesh)]
+
+    jobs = [(test[0], *[index(m) for m in test[2:]]) for test in tests]
+    chunksize = max(1, len(jobs) // (4 * nProcesses))
+
+    with _multiprocessing.Pool(nProcesses, _overlapWorkerInit, (meshArrays,)) as pool:
+        results = pool.map(_overlapWorkerRun, jobs, chunksize)
+
+    return [None if r is None else _arraysToMesh(*r) for r in results]
+
+
+_meshWorkerSolids = []
+
+
+def _meshWorkerRun(index):
+    try:
+        return _meshToArrays(_meshWorkerSolids[index].mesh())
+    except (_exceptions.NullMeshError, ValueError):
+        return None
+
+
+def _meshLogicalVolumes(logicalVolumes, nProcesses=1):
+    """
+    Mesh logical volumes. If nProcesses is greater than 1 each distinct solid (see
+    SolidBase.meshCacheKey) is meshed once in a pool of worker processes and returned
+    as compact arrays, then attached to every logical volume using it. The workers are
+    forked so they share the solids with this process. Where fork is not available
+    the logical volumes are meshed here. The solids must not be edited meanwhile (see
+    MeshCache.keyPass).
+    """
+    import multiprocessing as _multiprocessing
+
+    global _meshWorkerSolids
+
+    # the key of each solid is computed once for grouping and meshing
+    with _meshCache.keyPass():
+        groups = {}  # solid key : [logical volumes]
+        for lv in logicalVolumes:
+            key = _meshCache.solidKey(lv.solid)
+            groups.setdefault(id(lv.solid) if key is None else key, []).append(lv)
+
+        if (
+            nProcesses <= 1
+            or len(groups) < 2
+            or "fork" not in _multiprocessing.get_all_start_methods()
+        ):
+            for lv in logicalVolumes:
+                lv.reMesh()
+            return
+
+        _meshWorkerSolids = [lvs[0].solid for lvs in groups.values()]
+        try:
+            with _multiprocessing.get_context("fork").Pool(nProcesses) as pool:
+                results = pool.map(_meshWorkerRun, range(len(_meshWorkerSolids)), 1)
+        finally:
+            _meshWorkerSolids = []
+
+        for (key, lvs), arrays in zip(groups.items(), results):
+            if arrays is None:
+                for lv in lvs:
+                    lv.mesh = None
+                    _log.error("geant4.LogicalVolume> meshing error %s", lv.name)
+                continue
+
+            mesh = _arraysToMesh(*arrays)
+            for i, lv in enumerate(lvs):
+                if _meshCache.enabled() and isinstance(key, str):
+                    _meshCache.put(key, mesh, lv.solid)
+                lv.mesh = _Mesh(lv.solid, mesh if i == 0 else mesh.clone())
+
+
 class LogicalVolume:
     """
     LogicalVolume : G4LogicalVolume
@@ -98,8 +249,7 @@ class LogicalVolume:
         self.daughterVolumes = []
         self._daughterVolumesDict = {}
         self.bdsimObjects = []
-        if _config.doMeshing:
-            self.reMesh()
+        self.invalidateMesh()
         self.auxiliary = []
         self.addAuxiliaryInfo(kwargs.get("auxiliary", None))
 
@@ -117,16 +267,48 @@ class LogicalVolume:
     def __repr__(self):
         return "Logical volume : " + self.name + " " + str(self.solid) + " " + str(self.material)
 
+    @property
+    def mesh(self):
+        """
+        Mesh (visualisation.Mesh) of the solid. It is generated on first access (if
+        config.doMeshing is True) and is None if the solid cannot be meshed.
+        """
+        if not self._meshed:
+            if not _config.doMeshing:
+                return None
+            self.reMesh()
+        return self._mesh
+
+    @mesh.setter
+    def mesh(self, mesh):
+        self._mesh = mesh
+        self._meshed = True
+
+    @property
+    def meshed(self):
+        """
+        Whether the mesh has been generated (see mesh and reMesh).
+        """
+        return self._meshed
+
+    def invalidateMesh(self):
+        """
+        Discard the mesh so it is regenerated from the solid when next used.
+        """
+        self._mesh = None
+        self._meshed = False
+
     def reMesh(self, recursive=False):
         """
         Regenerate the visualisation for this logical volume. Required if the geometry is modified
         and overlap checking is subsequently required or revisualisation.
         """
         try:
-            self.mesh = _Mesh(self.solid)
-            if recursive:
-                for d in self.daughterVolumes:
-                    d.logicalVolume.reMesh(recursive)
+            with _meshCache.keyPass():
+                self.mesh = _Mesh(self.solid)
+                if recursive:
+                    for d in self.daughterVolumes:
+                        d.logicalVolume.reMesh(recursive)
         except _exceptions.NullMeshError:
             self.mesh = None
             _log.error("geant4.LogicalVolume> meshing error %s", self.name)
@@ -286,7 +468,7 @@ class LogicalVolume:
         ruval = _Units.unit(runit)
 
         self.solid = newSolid
-        self.reMesh(False)
+        self.invalidateMesh()
 
         matNew = _np.linalg.inv(_trans.tbxyz2matrix(_np.array(rotation) * ruval))
         posNew = _np.array(position) * puval
@@ -389,7 +571,7 @@ class LogicalVolume:
             )
 
             self.solid = solidIntersection
-            self.reMesh(False)
+            self.invalidateMesh()
 
         outside = []
         intersections = []
@@ -636,7 +818,7 @@ class LogicalVolume:
 
         # finally update the solid
         self.solid = newSolid
-        self.reMesh(False)
+        self.invalidateMesh()
 
     def checkOverlaps(
         self,
@@ -644,12 +826,21 @@ class LogicalVolume:
         coplanar=False,
         printOut=True,
         nOverlapsDetected=[0],
+        nProcesses=1,
     ):
         """
         Check based on the meshes in each logical volume if there are any geometrical overlaps. By
         default, overlaps are checked between daughter volumes and with the mother volume itself (protrusion).
         Coplanar overlaps may also be checked (default on).
 
+        Only pairs of daughters whose axis aligned extents overlap are tested with the full
+        mesh intersection. The padding of the extents is set by
+        pyg4ometry.config.overlapBroadPhaseTolerance.
+
+        If nProcesses is greater than 1, the mesh tests for this logical volume (and all
+        daughters if recursive) are collected first and evaluated in a pool of worker processes.
+        The overlaps found are added to the meshes in the same order as the serial check.
+
         logged error messages will be given for any overlaps detected and the visualiser will show the
         colour coded overlaps.
 
@@ -657,21 +848,103 @@ class LogicalVolume:
         :param coplanar: bool - Whether to check for coplanar overlaps
         :param printOut: bool - (internal) Whether to print out a summary of N overlaps detected
         :param nOverlapsDetected: [int] - (internal) counter for recursion - ignore
+        :param nProcesses: int - Number of worker processes to use for the mesh tests
         """
         from ..geant4 import IsAReplica as _IsAReplica
 
         _log.debug("LogicalVolume.checkOverlaps> %s", self.name)
 
-        # return if overlaps already checked
-        if self.overlapChecked:
-            _log.debug("Overlaps already checked - skipping")
+        if nProcesses > 1:
+            tests = []
+            checked = {}
+            self._collectOverlapTests(recursive, coplanar, nOverlapsDetected, tests, checked)
+
+            results = _runOverlapTestsParallel([test for _, test in tests], nProcesses)
+            for (lv, test), result in zip(tests, results):
+                lv._recordOverlap(test, result, nOverlapsDetected)
+
+            for lv in checked:
+                lv.overlapChecked = True
+        else:
+            # return if overlaps already checked
+            if self.overlapChecked:
+                _log.debug("Overlaps already checked - skipping")
+                return
+
+            if _IsAReplica(self):
+                self.daughterVolumes[0]._checkInternalOverlaps(nOverlapsDetected)
+                self.overlapChecked = True
+                return
+
+            for test in self._getOverlapTests(coplanar):
+                self._recordOverlap(test, _runOverlapTest(test[0], *test[2:]), nOverlapsDetected)
+
+            # recursively check entire tree
+            if recursive:
+                for d in self.daughterVolumes:
+                    if type(d.logicalVolume) is _AssemblyVolume:
+                        continue  # no specific overlap check - handled by the PV of an assembly
+                    # don't make any summary print out for a recursive call
+                    d.logicalVolume.checkOverlaps(
+                        recursive=recursive,
+                        coplanar=coplanar,
+                        printOut=False,
+                        nOverlapsDetected=nOverlapsDetected,
+                    )
+
+            # ok this logical has been checked
+            self.overlapChecked = True
+
+        if printOut:
+            _log.log(
+                _logging.ERROR if nOverlapsDetected[0] > 0 else _logging.INFO,
+                "%d overlaps detected",
+                nOverlapsDetected[0],
+            )
+
+    def _collectOverlapTests(self, recursive, coplanar, nOverlapsDetected, tests, checked):
+        """
+        Recursively gather the overlap tests of this logical volume (and daughters) as
+        [(logicalVolume, test), ...] in the order the serial checkOverlaps would do them.
+        """
+        from ..geant4 import IsAReplica as _IsAReplica
+
+        if self.overlapChecked or self in checked:
             return
+        checked[self] = True
 
         if _IsAReplica(self):
             self.daughterVolumes[0]._checkInternalOverlaps(nOverlapsDetected)
-            self.overlapChecked = True
             return
 
+        tests.extend((self, test) for test in self._getOverlapTests(coplanar))
+
+        if recursive:
+            for d in self.daughterVolumes:
+                if type(d.logicalVolume) is _AssemblyVolume:
+                    continue  # no specific overlap check - handled by the PV of an assembly
+                d.logicalVolume._collectOverlapTests(
+                    recursive, coplanar, nOverlapsDetected, tests, checked
+                )
+
+    def _recordOverlap(self, test, overlapMesh, nOverlapsDetected):
+        """
+        Log and store the result of an overlap test from _getOverlapTests.
+        """
+        if overlapMesh is None:
+            return
+
+        nOverlapsDetected[0] += 1
+        _log.error(f"OVERLAP DETECTED> {test[1]} {overlapMesh.vertexCount()}")
+        self.mesh.addOverlapMesh([overlapMesh, test[0]])
+
+    def _getOverlapTests(self, coplanar=False):
+        """
+        Transform the daughter meshes into the frame of this logical volume and return the
+        mesh tests that pass the broad phase. Each test is
+        [overlapType, description, mesh1, mesh2, boundingMesh1, boundingMesh2] and
+        is evaluated by _runOverlapTest.
+        """
         # local meshes
         transformedMeshes = []
         transformedBoundingMeshes = []
@@ -733,123 +1006,93 @@ class LogicalVolume:
                 transformedBoundingMeshes.append(boundingmesh)
                 transformedMeshesNames.append(name)
 
-        # overlap daughter pv checks
-        for i in range(len(transformedMeshes)):
-            for j in range(i + 1, len(transformedMeshes)):
-                _log.debug(
-                    f"LogicalVolume.checkOverlaps> daughter-daughter bounding mesh intersection test: {transformedMeshesNames[i]} {transformedMeshesNames[j]}"
-                )
+        tests = []
 
-                # first check if bounding mesh intersects
-                cullIntersection = transformedBoundingMeshes[i].intersect(
-                    transformedBoundingMeshes[j]
-                )
-                if cullIntersection.vertexCount() == 0:
-                    continue
+        # broad phase - axis aligned extents of the transformed bounding meshes
+        transformedExtents = [_getBoundingBox(bm) for bm in transformedBoundingMeshes]
+        daughterIndex = _AABBIndex(transformedExtents, _config.overlapBroadPhaseTolerance)
+        candidatePairs = daughterIndex.pairs()
 
-                # bounding meshes collide, so check full mesh properly
-                interMesh = transformedMeshes[i].intersect(transformedMeshes[j])
-                _log.debug(
-                    f"LogicalVolume.checkOverlaps> full daughter-daughter intersection test: {i} {j} {interMesh.vertexCount()} {interMesh.polygonCount()}"
-                )
-                if interMesh.vertexCount() != 0:
-                    nOverlapsDetected[0] += 1
-                    _log.error(
-                        f"OVERLAP DETECTED> overlap between daughters of {self.name} {transformedMeshesNames[i]} {transformedMeshesNames[j]} {interMesh.vertexCount()}"
-                    )
-                    self.mesh.addOverlapMesh([interMesh, _OverlapType.overlap])
+        # overlap daughter pv checks
+        for i, j in candidatePairs:
+            _log.debug(
+                f"LogicalVolume.checkOverlaps> daughter-daughter intersection test: {transformedMeshesNames[i]} {transformedMeshesNames[j]}"
+            )
+            tests.append(
+                [
+                    _OverlapType.overlap,
+                    f"overlap between daughters of {self.name} {transformedMeshesNames[i]} {transformedMeshesNames[j]}",
+                    transformedMeshes[i],
+                    transformedMeshes[j],
+                    transformedBoundingMeshes[i],
+                    transformedBoundingMeshes[j],
+                ]
+            )
 
         # coplanar daughter pv checks
         if coplanar:
-            for i in range(len(transformedMeshes)):
-                for j in range(i + 1, len(transformedMeshes)):
-                    _log.debug(
-                        f"LogicalVolume.checkOverlaps> full coplanar test between daughters {transformedMeshesNames[i]} {transformedMeshesNames[j]}"
-                    )
+            for i, j in candidatePairs:
+                _log.debug(
+                    f"LogicalVolume.checkOverlaps> full coplanar test between daughters {transformedMeshesNames[i]} {transformedMeshesNames[j]}"
+                )
+                tests.append(
+                    [
+                        _OverlapType.coplanar,
+                        f"coplanar overlap between daughters {transformedMeshesNames[i]} {transformedMeshesNames[j]}",
+                        transformedMeshes[i],
+                        transformedMeshes[j],
+                        transformedBoundingMeshes[i],
+                        transformedBoundingMeshes[j],
+                    ]
+                )
 
-                    # first check if bounding mesh intersects
-                    cullIntersection = transformedBoundingMeshes[i].intersect(
-                        transformedBoundingMeshes[j]
-                    )
-                    cullCoplanar = transformedBoundingMeshes[i].coplanarIntersection(
-                        transformedBoundingMeshes[j]
-                    )
-                    if cullIntersection.vertexCount() == 0 and cullCoplanar.vertexCount() == 0:
-                        continue
-
-                    coplanarMesh = transformedMeshes[i].coplanarIntersection(transformedMeshes[j])
-                    if coplanarMesh.vertexCount() != 0:
-                        nOverlapsDetected[0] += 1
-                        _log.error(
-                            f"OVERLAP DETECTED> coplanar overlap between daughters {transformedMeshesNames[i]} {transformedMeshesNames[j]} {coplanarMesh.vertexCount()}"
-                        )
-                        self.mesh.addOverlapMesh([coplanarMesh, _OverlapType.coplanar])
-
-        # protrusion from mother solid
+        # protrusion from mother solid - daughters whose extent is inside the
+        # extent of the mother bounding mesh cannot protrude from it
+        motherExtent = _getBoundingBox(self.mesh.localboundingmesh)
+        insideMother = daughterIndex.containedIn(motherExtent[0], motherExtent[1])
         for i in range(len(transformedMeshes)):
-            _log.debug(
-                f"LogicalVolume.checkOverlaps> full daughter-mother intersection test {transformedMeshesNames[i]}"
-            )
-
-            cullIntersection = transformedBoundingMeshes[i].subtract(self.mesh.localboundingmesh)
-            if cullIntersection.vertexCount() == 0:
+            if insideMother[i]:
                 continue
 
-            interMesh = transformedMeshes[i].subtract(self.mesh.localmesh)
             _log.debug(
-                f"LogicalVolume.checkOverlaps> daughter container {i} {interMesh.vertexCount()} {interMesh.polygonCount()}"
+                f"LogicalVolume.checkOverlaps> full daughter-mother intersection test {transformedMeshesNames[i]}"
+            )
+            tests.append(
+                [
+                    _OverlapType.protrusion,
+                    f"overlap with mother {transformedMeshesNames[i]}",
+                    transformedMeshes[i],
+                    self.mesh.localmesh,
+                    transformedBoundingMeshes[i],
+                    self.mesh.localboundingmesh,
+                ]
             )
 
-            if interMesh.vertexCount() != 0:
-                nOverlapsDetected[0] += 1
-                _log.error(
-                    f"OVERLAP DETECTED> overlap with mother {transformedMeshesNames[i]} {interMesh.vertexCount()}"
-                )
-                self.mesh.addOverlapMesh([interMesh, _OverlapType.protrusion])
-
-        # coplanar with solid
+        # coplanar with solid - only daughters whose extent touches a face of the mother
         if coplanar:
+            motherFaceIndex = _AABBIndex(
+                _meshFaceExtents(self.mesh.localmesh), _config.overlapBroadPhaseTolerance
+            )
             for i in range(len(transformedMeshes)):
+                if len(motherFaceIndex.query(*transformedExtents[i])) == 0:
+                    continue
+
                 _log.debug(
                     f"LogicalVolume.checkOverlaps> full daughter-mother coplanar test {transformedMeshesNames[i]}"
-                ),
-
-                # cullCoplanar = self.mesh.localboundingmesh.coplanarIntersection(transformedBoundingMeshes[i])
-                # if cullCoplanar.vertexCount() == 0 :
-                #    continue
-                # print(self.mesh.localboundingmesh,transformedBoundingMeshes[i])
-                coplanarMesh = self.mesh.localmesh.coplanarIntersection(
-                    transformedMeshes[i]
-                )  # Need mother.coplanar(daughter) as typically mother is larger
-                if coplanarMesh.vertexCount() != 0:
-                    nOverlapsDetected[0] += 1
-                    _log.error(
-                        f"OVERLAP DETECTED> coplanar overlap between daughter and mother {transformedMeshesNames[i]} {coplanarMesh.vertexCount()}"
-                    )
-                    self.mesh.addOverlapMesh([coplanarMesh, _OverlapType.coplanar])
-
-        # recursively check entire tree
-        if recursive:
-            for d in self.daughterVolumes:
-                if type(d.logicalVolume) is _AssemblyVolume:
-                    continue  # no specific overlap check - handled by the PV of an assembly
-                # don't make any summary print out for a recursive call
-                d.logicalVolume.checkOverlaps(
-                    recursive=recursive,
-                    coplanar=coplanar,
-                    printOut=False,
-                    nOverlapsDetected=nOverlapsDetected,
+                )
+                # Need mother.coplanar(daughter) as typically mother is larger
+                tests.append(
+                    [
+                        _OverlapType.coplanar,
+                        f"coplanar overlap between daughter and mother {transformedMeshesNames[i]}",
+                        self.mesh.localmesh,
+                        transformedMeshes[i],
+                        None,
+                        None,
+                    ]
                 )
 
-        # ok this logical has been checked
-        self.overlapChecked = True
-
-        if printOut:
-            _log.log(
-                _logging.ERROR if nOverlapsDetected[0] > 0 else _logging.INFO,
-                "%d overlaps detected",
-                nOverlapsDetected[0],
-            )
+        return tests
 
     def setSolid(self, solid):
         """
@@ -857,7 +1100,7 @@ class LogicalVolume:
         transformation then use replaceSolid
         """
         self.solid = solid
-        self.mesh = _Mesh(self.solid)
+        self.invalidateMesh()
 
     def makeSolidTessellated(self):
         """
@@ -986,7 +1229,7 @@ class LogicalVolume:
                 "Warning: only Box container volume supported: all daughter placements have been recentred but container solid has not"
             )
 
-        self.mesh.remesh()
+        self.invalidateMesh()
         return centre
 
     def makeLogicalPhysicalNameSets(self):
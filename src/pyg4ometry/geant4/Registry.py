@@ -69,6 +69,10 @@ class Registry:
 
         self.expressionParser = None
 
+        # incremented when defines are added or renamed, invalidating memoised define values
+        self.defineGeneration = 0
+        self.defineGraph = None  # built on demand by getDefineGraph
+
     def clear(self):
         """Empty all internal structures"""
         # to match constructor
@@ -104,6 +108,9 @@ class Registry:
 
         self.editedSolids = []
 
+        self.defineGeneration += 1
+        self.defineGraph = None
+
     def getExpressionParser(self):
         if not self.expressionParser:
             from ..gdml.GdmlExpression import ExpressionParser
@@ -113,9 +120,89 @@ class Registry:
         return self.expressionParser
 
     def registerSolidEdit(self, solid):
+        # parameters may now refer to different defines
+        self.defineGraph = None
+        self._invalidateSolid(solid)
+
+    def _invalidateSolid(self, solid):
+        from .solid.MeshCache import meshCache as _meshCache
+
+        _meshCache.invalidate(solid)
         if solid.name in self.solidDict:
             self.editedSolids.append(solid.name)
 
+    def getDefineGraph(self):
+        """
+        Return the dependency graph between the defines and solids of this registry,
+        building it if required.
+        """
+        if self.defineGraph is None:
+            from ..gdml.DefineGraph import DefineGraph as _DefineGraph
+
+            self.defineGraph = _DefineGraph(self)
+        return self.defineGraph
+
+    def defineChanged(self, define):
+        """
+        Update everything downstream of a define whose expression has changed. The
+        memoised values of dependent defines are cleared, dependent solids are marked
+        as edited (removing them from the mesh cache) and the meshes of the logical
+        volumes using those solids are discarded, to be regenerated when next used.
+        Called by ScalarBase.setExpression for defines in this registry.
+
+        :param define: define that has changed
+        :type define: ScalarBase, VectorBase, Matrix
+        :return: names of the dependent defines, solids and logical volumes
+        """
+        graph = self.getDefineGraph()
+        graph.updateDefine(define)
+        defineNames, solidNames = graph.dependents(define.name)
+
+        for d in [define] + [self.defineDict[name] for name in defineNames]:
+            if hasattr(d, "_clearValue"):
+                d._clearValue()
+
+        for name in solidNames:
+            self._invalidateSolid(self.solidDict[name])
+
+        solidNames = set(solidNames)
+        lvNames = []
+        for lv in self.logicalVolumeDict.values():
+            if getattr(lv, "solid", None) is not None and lv.solid.name in solidNames:
+                lvNames.append(lv.name)
+                if getattr(lv, "meshed", False):
+                    lv.invalidateMesh()
+
+        return defineNames, sorted(solidNames), lvNames
+
+    def updateDefine(self, name, value):
+        """
+        Change the expression of a scalar define and update only the defines, solids and
+        logical volume meshes that depend on it (see defineChanged).
+
+        :param name: name of the define
+        :type name: str
+        :param value: new expression
+        :type value: str, float, ScalarBase
+        :return: names of the dependent defines, solids and logical volumes
+        """
+        return self.defineDict[name].setExpression(value)
+
+    def meshAll(self, nProcesses=1):
+        """
+        Generate the meshes of all logical volumes that have not been meshed yet.
+        Logical volume meshes are otherwise generated when first used.
+
+        :param nProcesses: number of worker processes, each distinct solid is meshed once
+        :type nProcesses: int
+        """
+        from .LogicalVolume import _meshLogicalVolumes
+
+        lvs = [
+            lv for lv in self.logicalVolumeDict.values() if lv.type == "logical" and not lv.meshed
+        ]
+        _meshLogicalVolumes(lvs, nProcesses)
+
     def addMaterial(self, material, dontWarnIfAlreadyAdded=False):
         """
         Register a material with this registry.
@@ -200,6 +287,7 @@ class Registry:
 
         self.solidTypeCountDict[solid.type] += 1
         self.solidNameCount[solid.name] += 1
+        self.defineGraph = None
 
     def transferSolid(self, solid, incrementRenameDict={}, userRenameDict=None):
         """
@@ -231,6 +319,7 @@ class Registry:
 
         self.solidTypeCountDict[solid.type] += 1
         self.solidNameCount[solid.name] += 1
+        self.defineGraph = None
 
     def addLogicalVolume(self, volume):
         """
@@ -392,6 +481,8 @@ class Registry:
             self.defineDict[define.name] = define
 
         self.defineNameCount[define.name] += 1
+        self.defineGeneration += 1
+        self.defineGraph = None
 
         return define.name  # why do we need this?
 
@@ -419,6 +510,8 @@ class Registry:
         define.registry = self
 
         self.defineNameCount[define.name] += 1
+        self.defineGeneration += 1
+        self.defineGraph = None
 
     def transferDefines(self, var, otherRegistry, incrementRenameDict={}, userRenameDict=None):
         """
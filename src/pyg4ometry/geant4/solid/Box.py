@@ -1,13 +1,14 @@
 from ... import config as _config
 
 from .SolidBase import SolidBase as _SolidBase
+from .MeshCache import cachedMesh as _cachedMesh
 
 if _config.meshing == _config.meshingType.pycsg:
     from ...pycsg.core import CSG as _CSG
     from ...pycsg.geom import Vector as _Vector
     from ...pycsg.geom import Vertex as _Vertex
     from ...pycsg.geom import Polygon as _Polygon
-elif _config.meshing == _config.meshingType.cgal_sm:
+elif _config.meshing in (_config.meshingType.cgal_sm, _config.meshingType.cgal_sm_fast):
     from ...pycgal.core import CSG as _CSG
     from ...pycgal.geom import Vector as _Vector
     from ...pycgal.geom import Vertex as _Vertex
@@ -114,6 +115,7 @@ class Box(_SolidBase):
     def __str__(self):
         return f"Box : name={self.name} x={float(self.pX)} y={float(self.pY)} z={float(self.pZ)}"
 
+    @_cachedMesh
     def mesh(self):
         _log.debug("box.pycsgmesh> antlr")
         from ...gdml import Units as _Units
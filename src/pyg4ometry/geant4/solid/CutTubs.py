@@ -1,13 +1,14 @@
 from ... import config as _config
 
 from .SolidBase import SolidBase as _SolidBase
+from .MeshCache import cachedMesh as _cachedMesh
 
 if _config.meshing == _config.meshingType.pycsg:
     from ...pycsg.core import CSG as _CSG
     from ...pycsg.geom import Vector as _Vector
     from ...pycsg.geom import Vertex as _Vertex
     from ...pycsg.geom import Polygon as _Polygon
-elif _config.meshing == _config.meshingType.cgal_sm:
+elif _config.meshing in (_config.meshingType.cgal_sm, _config.meshingType.cgal_sm_fast):
     from ...pycgal.core import CSG as _CSG
     from ...pycgal.geom import Vector as _Vector
     from ...pycgal.geom import Vertex as _Vertex
@@ -106,6 +107,7 @@ class CutTubs(_SolidBase):
         # Low norm and high norm excluded as they are lists
         return f"Cut tubs : name={self.name} rmin={float(self.pRMin)} rmax={float(self.pRMax)} dz={float(self.pDz)} sphi={float(self.pSPhi)} dphi={float(self.pDPhi)}"
 
+    @_cachedMesh
     def mesh(self):
         # 0.00943803787231 66
         _log.debug("tubs.pycsgmesh> antlr")
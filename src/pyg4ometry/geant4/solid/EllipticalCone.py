@@ -1,13 +1,14 @@
 from ... import config as _config
 
 from .SolidBase import SolidBase as _SolidBase
+from .MeshCache import cachedMesh as _cachedMesh
 
 if _config.meshing == _config.meshingType.pycsg:
     from ...pycsg.core import CSG as _CSG
     from ...pycsg.geom import Vector as _Vector
     from ...pycsg.geom import Vertex as _Vertex
     from ...pycsg.geom import Polygon as _Polygon
-elif _config.meshing == _config.meshingType.cgal_sm:
+elif _config.meshing in (_config.meshingType.cgal_sm, _config.meshingType.cgal_sm_fast):
     from ...pycgal.core import CSG as _CSG
     from ...pycgal.geom import Vector as _Vector
     from ...pycgal.geom import Vertex as _Vertex
@@ -76,6 +77,7 @@ class EllipticalCone(_SolidBase):
     def __str__(self):
         return f"EllipticalCone : name={self.name} xSemiAxis={float(self.pxSemiAxis)} ySemiAxis={float(self.pySemiAxis)} zMax={float(self.zMax)} zTopCut={float(self.pzTopCut)}"
 
+    @_cachedMesh
     def mesh(self):
         _log.debug("ellipticalcone.antlr>")
 
@@ -1,6 +1,7 @@
 from ... import config as _config
 
 from .SolidBase import SolidBase as _SolidBase
+from .MeshCache import cachedMesh as _cachedMesh
 from ...gdml.Defines import Expression as _Expression
 
 if _config.meshing == _config.meshingType.pycsg:
@@ -8,7 +9,7 @@ if _config.meshing == _config.meshingType.pycsg:
     from ...pycsg.geom import Vector as _Vector
     from ...pycsg.geom import Vertex as _Vertex
     from ...pycsg.geom import Polygon as _Polygon
-elif _config.meshing == _config.meshingType.cgal_sm:
+elif _config.meshing in (_config.meshingType.cgal_sm, _config.meshingType.cgal_sm_fast):
     from ...pycgal.core import CSG as _CSG
     from ...pycgal.core import PolygonProcessing as _PolygonProcessing
     from ...pycgal.geom import Vector as _Vector
@@ -104,6 +105,7 @@ class ExtrudedSolid(_SolidBase):
             msg = f"ExtrudedSolid.evaluateParameterWithUnits : unknown variable: {varName}"
             raise RuntimeError(msg)
 
+    @_cachedMesh
     def mesh(self):
         _log.debug("xtru.pycsgmesh> antlr")
 
@@ -1,6 +1,7 @@
 from ... import config as _config
 
 from .SolidBase import SolidBase as _SolidBase
+from .MeshCache import cachedMesh as _cachedMesh
 from .GenericPolyhedra import GenericPolyhedra as _GenericPolyhedra
 
 import logging as _log
@@ -80,6 +81,7 @@ class GenericPolycone(_SolidBase):
             msg = "Generic Polycone must have at least 3 R-Z points defined"
             raise ValueError(msg)
 
+    @_cachedMesh
     def mesh(self):
         _log.debug("genericpolycone.antlr>")
 
@@ -1,18 +1,11 @@
 from ... import config as _config
 
 from .SolidBase import SolidBase as _SolidBase
+from .MeshCache import cachedMesh as _cachedMesh
+from .RevolutionMesh import revolutionMesh as _revolutionMesh
 
-if _config.meshing == _config.meshingType.pycsg:
-    from ...pycsg.core import CSG as _CSG
-    from ...pycsg.geom import Vector as _Vector
-    from ...pycsg.geom import Vertex as _Vertex
-    from ...pycsg.geom import Polygon as _Polygon
-elif _config.meshing == _config.meshingType.cgal_sm:
-    from ...pycgal.core import CSG as _CSG
+if _config.meshing in (_config.meshingType.cgal_sm, _config.meshingType.cgal_sm_fast):
     from ...pycgal.core import PolygonProcessing as _PolygonProcessing
-    from ...pycgal.geom import Vector as _Vector
-    from ...pycgal.geom import Vertex as _Vertex
-    from ...pycgal.geom import Polygon as _Polygon
 
 import logging as _log
 import numpy as _np
@@ -83,6 +76,7 @@ class GenericPolyhedra(_SolidBase):
             msg = "Generic Polyhedra must have at least 3 R-Z points defined"
             raise ValueError(msg)
 
+    @_cachedMesh
     def mesh(self):
         _log.debug("genericpolyhedra.antlr>")
 
@@ -97,94 +91,19 @@ class GenericPolyhedra(_SolidBase):
         pR = [val * luval for val in self.evaluateParameter(self.pR)]
         pZ = [val * luval for val in self.evaluateParameter(self.pZ)]
 
-        dPhi = pDPhi / numSide
-
-        zrList = [[z, r] for z, r in zip(pZ, pR)]
-        zrList.reverse()
-        zrArray = _np.array(zrList)
-
-        zrListConvex = _PolygonProcessing.decomposePolygon2d(zrArray)
-
-        # def plotConvex() :
-        #     import matplotlib.pyplot as _plt
-        #     _plt.figure(1)
-        #     _plt.plot(pZ,pR)
-        #
-        #     for cvPolygon in zrListConvex:
-        #         _plt.plot(cvPolygon[:,0],cvPolygon[:,1])
-
-        # plotConvex()
-
-        polygons = []
-
-        for i in range(0, len(pZ), 1):
-            i1 = i
-            i2 = (i + 1) % len(pZ)
-
-            zMin = pZ[i1]
-            zMax = pZ[i2]
-
-            for j in range(0, numSide, 1):
-                j1 = j
-                j2 = j + 1
-
-                phi1 = dPhi * j1 + pSPhi
-                phi2 = dPhi * j2 + pSPhi
-
-                xZMinP1 = pR[i1] * _np.cos(phi1)
-                yZMinP1 = pR[i1] * _np.sin(phi1)
-
-                xZMaxP1 = pR[i2] * _np.cos(phi1)
-                yZMaxP1 = pR[i2] * _np.sin(phi1)
-
-                xZMinP2 = pR[i1] * _np.cos(phi2)
-                yZMinP2 = pR[i1] * _np.sin(phi2)
-
-                xZMaxP2 = pR[i2] * _np.cos(phi2)
-                yZMaxP2 = pR[i2] * _np.sin(phi2)
-
-                vFace = []
-                if pR[i1] != 0:
-                    vFace.append(_Vertex([xZMinP1, yZMinP1, zMin]))
-                vFace.append(_Vertex([xZMaxP1, yZMaxP1, zMax]))
-                if pR[i2] != 0:
-                    vFace.append(_Vertex([xZMaxP2, yZMaxP2, zMax]))
-                vFace.append(_Vertex([xZMinP2, yZMinP2, zMin]))
-
-                vFace.reverse()
-                if pR[i1] == 0 and pR[i2] == 0:
-                    pass
-                else:
-                    polygons.append(_Polygon(vFace))
-
+        caps = None
         if pDPhi != 2 * _np.pi:
-            for cvPolygon in zrListConvex:
-                vPhi1 = []
-                for cvPolygonPoint in cvPolygon:
-                    z = cvPolygonPoint[0]
-                    r = cvPolygonPoint[1]
-
-                    xP1 = r * _np.cos(pSPhi)
-                    yP1 = r * _np.sin(pSPhi)
-
-                    vPhi1.append(_Vertex([xP1, yP1, z]))
-
-                vPhi1.reverse()
-                polygons.append(_Polygon(vPhi1))
-
-                vPhi2 = []
-                for cvPolygonPoint in reversed(cvPolygon):
-                    z = cvPolygonPoint[0]
-                    r = cvPolygonPoint[1]
-
-                    xP2 = r * _np.cos(pSPhi + pDPhi)
-                    yP2 = r * _np.sin(pSPhi + pDPhi)
-
-                    vPhi2.append(_Vertex([xP2, yP2, z]))
+            zrList = [[z, r] for z, r in zip(pZ, pR)]
+            zrList.reverse()
+            zrArray = _np.array(zrList)
 
-                vPhi2.reverse()
-                polygons.append(_Polygon(vPhi2))
+            zrListConvex = _PolygonProcessing.decomposePolygon2d(zrArray)
 
-        mesh = _CSG.fromPolygons(polygons)
+            # convex pieces of the profile as indices of its points
+            pointIndex = {(z, r): i for i, (z, r) in enumerate(zip(pZ, pR))}
+            caps = [
+                [pointIndex[(float(z), float(r))] for z, r in cvPolygon]
+                for cvPolygon in zrListConvex
+            ]
 
-        return mesh
+        return _revolutionMesh(pR, pZ, pSPhi, pDPhi, numSide, caps=caps)
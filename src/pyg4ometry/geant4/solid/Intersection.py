@@ -1,4 +1,5 @@
 from .SolidBase import SolidBase as _SolidBase
+from .MeshCache import cachedMesh as _cachedMesh
 from ...transformation import *
 
 import logging as _log
@@ -60,6 +61,7 @@ class Intersection(_SolidBase):
     def __str__(self):
         return f"Intersection {self.name} {self.obj1.name!s} {self.obj2.name!s}"
 
+    @_cachedMesh
     def mesh(self):
         from ... import geant4 as _g4
 
@@ -96,6 +98,9 @@ class Intersection(_SolidBase):
     def rotation(self):
         return self.tra2[0].eval()
 
+    def _meshCacheOperands(self):
+        return [self.object1(), self.object2()]
+
     def object1(self):
         from ... import geant4 as _g4
 
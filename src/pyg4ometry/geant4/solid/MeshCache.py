@@ -0,0 +1,378 @@
+from ... import config as _config
+
+import contextlib as _contextlib
+import functools as _functools
+import hashlib as _hashlib
+import logging as _log
+import os as _os
+import tempfile as _tempfile
+import time as _time
+from collections import OrderedDict as _OrderedDict
+
+_log = _log.getLogger(__name__)
+
+
+class MeshCache:
+    """
+    In-memory cache of solid meshes, used by the mesh methods decorated with cachedMesh
+    when pyg4ometry.config.meshCache is True (it is off by default) or within a
+    meshingPass. The key is a content hash of the solid (see SolidBase.meshCacheKey) so
+    solids with the same type, evaluated parameters and mesh settings share one entry. Entries are evicted in least recently used order
+    once the approximate memory use exceeds pyg4ometry.config.meshCacheMaxBytes.
+
+    Edited solids are removed from the cache through Registry.registerSolidEdit.
+
+    If pyg4ometry.config.meshCacheDir is set, meshes are also written to that directory as
+    binary vertex and polygon arrays (see visualisation.Mesh._meshToArrays) and memory
+    mapped back in when a key is not in memory, e.g. in a later session loading the same
+    geometry. The key changes with the solid and the entries are kept per pyg4ometry
+    version, so meshes made by older code are not used.
+
+    The number of mesh calls, cache hits and the time spent meshing each solid (including
+    and excluding the time for its constituent solids) are recorded in nodeStats, see
+    statistics and report.
+    """
+
+    # bump if the layout of the files on disk changes
+    diskFormatVersion = 1
+    diskArrays = ["vertices", "connectivity", "offsets"]
+
+    # approximate memory use of a mesh per vertex and per polygon (bytes)
+    bytesPerVertex = 128
+    bytesPerPolygon = 64
+
+    def __init__(self):
+        self._entries = _OrderedDict()  # key : [mesh, nbytes]
+        self._solidKeys = {}  # id(solid) : key
+        self._keyUsers = {}  # key : set(id(solid))
+        self.nbytes = 0
+        self.hits = 0
+        self.diskHits = 0
+        self.misses = 0
+        self.nodeStats = {}  # (solid type, solid name) : [calls, hits, time, exclusive time]
+        self._childTimes = []  # time spent meshing constituents, one per active mesh call
+        self._passKeys = None  # id(solid) : (solid, key) during a meshing pass
+        self._inMeshingPass = False
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key):
+        """
+        Return a copy of the cached mesh for key or None.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            mesh = self._load(key)
+            if mesh is None:
+                self.misses += 1
+                return None
+            self.diskHits += 1
+            self._store(key, mesh.clone())
+            return mesh
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return entry[0].clone()
+
+    def put(self, key, mesh, solid=None):
+        """
+        Store a copy of mesh for key. If solid is given the entry is associated with it
+        so it can be invalidated when the solid is edited.
+        """
+        if solid is not None:
+            self._associate(key, solid)
+
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            return
+
+        self._save(key, mesh)
+        self._store(key, mesh.clone())
+
+    def _store(self, key, mesh):
+        nbytes = (
+            self.bytesPerVertex * mesh.vertexCount() + self.bytesPerPolygon * mesh.polygonCount()
+        )
+        if nbytes > _config.meshCacheMaxBytes:
+            return
+
+        self._entries[key] = [mesh, nbytes]
+        self.nbytes += nbytes
+
+        # least recently used first
+        while self.nbytes > _config.meshCacheMaxBytes:
+            self._evict(next(iter(self._entries)))
+
+    def invalidate(self, solid):
+        """
+        Remove the entry of a solid (and of any solids that depend on it, e.g. Booleans)
+        unless the same mesh is still used by another solid.
+        """
+        key = self._solidKeys.pop(id(solid), None)
+        if key is not None:
+            users = self._keyUsers.get(key, set())
+            users.discard(id(solid))
+            if len(users) == 0:
+                self._keyUsers.pop(key, None)
+                self._evict(key)
+
+        for dependent in getattr(solid, "dependents", []):
+            self.invalidate(dependent)
+
+    def clear(self):
+        self._clearEntries()
+        self.hits = 0
+        self.diskHits = 0
+        self.misses = 0
+        self.nodeStats.clear()
+
+    def _clearEntries(self):
+        self._entries.clear()
+        self._solidKeys.clear()
+        self._keyUsers.clear()
+        self.nbytes = 0
+
+    @_contextlib.contextmanager
+    def meshingPass(self):
+        """
+        Context manager for meshing many solids in one go, e.g. a deep tree of Booleans.
+        Within the pass the cache is used even if pyg4ometry.config.meshCache is False (the
+        entries are then dropped at the end of the pass) and the key of each solid is only
+        computed once, so the solids must not be edited during the pass.
+
+        >>> with meshCache.meshingPass():
+        ...     m = solid.mesh()
+        >>> meshCache.report()
+        """
+        if self._inMeshingPass:
+            yield self
+            return
+
+        self._inMeshingPass = True
+        try:
+            with self.keyPass():
+                yield self
+        finally:
+            self._inMeshingPass = False
+            if not _config.meshCache:
+                self._clearEntries()
+
+    def enabled(self):
+        """
+        Whether meshes are looked up and stored, i.e. pyg4ometry.config.meshCache is True
+        or within a meshingPass.
+        """
+        return _config.meshCache or self._inMeshingPass
+
+    @_contextlib.contextmanager
+    def keyPass(self):
+        """
+        Context manager within which the key of each solid is only computed once (see
+        solidKey), so the solids must not be edited in it. Used around each mesh call
+        and when meshing many logical volumes, as the key of a Boolean includes the
+        keys of all its constituents.
+        """
+        if self._passKeys is not None:
+            yield self
+            return
+
+        self._passKeys = {}
+        try:
+            yield self
+        finally:
+            self._passKeys = None
+
+    def solidKey(self, solid):
+        """
+        Key of a solid (see SolidBase.meshCacheKey), only computed once per solid during
+        a meshing or key pass.
+        """
+        if self._passKeys is None:
+            return solid.meshCacheKey()
+
+        entry = self._passKeys.get(id(solid))
+        if entry is None:
+            # keep a reference to the solid so the id is not reused within the pass
+            entry = (solid, solid.meshCacheKey())
+            self._passKeys[id(solid)] = entry
+        return entry[1]
+
+    def statistics(self):
+        """
+        Return the meshing statistics per solid as a list of dictionaries (name, type,
+        calls, hits, time and exclusiveTime in seconds) sorted by decreasing exclusive
+        time, i.e. the time spent in the solid itself and not in its constituents.
+        """
+        stats = [
+            {
+                "name": name,
+                "type": solidType,
+                "calls": s[0],
+                "hits": s[1],
+                "time": s[2],
+                "exclusiveTime": s[3],
+            }
+            for (solidType, name), s in self.nodeStats.items()
+        ]
+        stats.sort(key=lambda s: s["exclusiveTime"], reverse=True)
+        return stats
+
+    def report(self, n=20):
+        """
+        Print the cache hit rate and the n solids that took the longest to mesh.
+        """
+        print(  # noqa: T201
+            f"mesh cache : {len(self)} entries {self.nbytes / 1024**2:.1f} MB "
+            f"hit rate {self.hitRate():.3f}"
+        )
+        print(  # noqa: T201
+            f"{'type':<16} {'name':<40} {'calls':>6} {'hits':>6} {'time/s':>10} {'excl/s':>10}"
+        )
+        for s in self.statistics()[:n]:
+            print(  # noqa: T201
+                f"{s['type']:<16} {s['name']:<40} {s['calls']:>6} {s['hits']:>6} "
+                f"{s['time']:>10.4f} {s['exclusiveTime']:>10.4f}"
+            )
+
+    def _record(self, solid, hit, elapsed, exclusive):
+        stats = self.nodeStats.setdefault((solid.type, solid.name), [0, 0, 0.0, 0.0])
+        stats[0] += 1
+        stats[1] += int(hit)
+        stats[2] += elapsed
+        stats[3] += exclusive
+
+    def hitRate(self):
+        n = self.hits + self.diskHits + self.misses
+        return (self.hits + self.diskHits) / n if n else 0.0
+
+    def diskPath(self, key, array):
+        """
+        Path of one of the arrays of key in config.meshCacheDir (or None if not set).
+        """
+        if not _config.meshCacheDir:
+            return None
+
+        from ... import __version__
+
+        return _os.path.join(
+            _config.meshCacheDir,
+            f"v{self.diskFormatVersion}",
+            __version__.replace(_os.sep, "_"),
+            key[:2],
+            f"{key}.{array}.npy",
+        )
+
+    def _load(self, key):
+        if not _config.meshCacheDir:
+            return None
+
+        import numpy as _np
+        from ...visualisation.Mesh import _arraysToMesh
+
+        # offsets are written last so their presence means the entry is complete
+        if not _os.path.exists(self.diskPath(key, self.diskArrays[-1])):
+            return None
+
+        try:
+            arrays = [_np.load(self.diskPath(key, a), mmap_mode="r") for a in self.diskArrays]
+            return _arraysToMesh(*arrays)
+        except Exception as e:
+            _log.warning(f"Unable to read mesh {key} from cache directory: {e}")
+            return None
+
+    def _save(self, key, mesh):
+        if not _config.meshCacheDir:
+            return
+
+        import numpy as _np
+        from ...visualisation.Mesh import _meshToArrays
+
+        if _os.path.exists(self.diskPath(key, self.diskArrays[-1])):
+            return
+
+        try:
+            directory = _os.path.dirname(self.diskPath(key, self.diskArrays[0]))
+            _os.makedirs(directory, exist_ok=True)
+            for name, array in zip(self.diskArrays, _meshToArrays(mesh)):
+                # write to a temporary file and rename so concurrent readers never see
+                # a partially written file
+                fd, tmpPath = _tempfile.mkstemp(dir=directory, suffix=".npy.tmp")
+                with _os.fdopen(fd, "wb") as f:
+                    _np.save(f, array)
+                _os.replace(tmpPath, self.diskPath(key, name))
+        except Exception as e:
+            _log.warning(f"Unable to write mesh {key} to cache directory: {e}")
+
+    def _associate(self, key, solid):
+        oldKey = self._solidKeys.get(id(solid))
+        if oldKey == key:
+            return
+        if oldKey is not None:
+            self._keyUsers.get(oldKey, set()).discard(id(solid))
+        self._solidKeys[id(solid)] = key
+        self._keyUsers.setdefault(key, set()).add(id(solid))
+
+    def _evict(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.nbytes -= entry[1]
+
+
+meshCache = MeshCache()
+
+
+def meshCacheKey(data):
+    """
+    Hash of the data describing a mesh (see SolidBase._meshCacheKeyData).
+    """
+    return _hashlib.sha1(repr(data).encode()).hexdigest()
+
+
+def cachedMesh(meshFunction):
+    """
+    Decorator for the mesh method of a solid to look up and store the mesh in the mesh cache
+    (if enabled) and record the meshing statistics.
+
+    >>> class Box(SolidBase):
+    ...     @cachedMesh
+    ...     def mesh(self): ...
+    """
+
+    @_functools.wraps(meshFunction)
+    def mesh(solid):
+        start = _time.perf_counter()
+        meshCache._childTimes.append(0.0)
+        hit = False
+        try:
+            with meshCache.keyPass():
+                m, hit = _cachedMesh(meshFunction, solid)
+        finally:
+            elapsed = _time.perf_counter() - start
+            childTime = meshCache._childTimes.pop()
+            if meshCache._childTimes:
+                meshCache._childTimes[-1] += elapsed
+            meshCache._record(solid, hit, elapsed, elapsed - childTime)
+        return m
+
+    return mesh
+
+
+def _cachedMesh(meshFunction, solid):
+    if not meshCache.enabled():
+        return meshFunction(solid), False
+
+    key = meshCache.solidKey(solid)
+    if key is None:
+        return meshFunction(solid), False
+
+    m = meshCache.get(key)
+    if m is not None:
+        meshCache._associate(key, solid)
+        return m, True
+
+    m = meshFunction(solid)
+    meshCache.put(key, m, solid)
+    return m, False
@@ -1,4 +1,5 @@
 from .SolidBase import SolidBase as _SolidBase
+from .MeshCache import cachedMesh as _cachedMesh
 from ... import exceptions
 from ...transformation import *
 
@@ -50,19 +51,15 @@ class MultiUnion(_SolidBase):
         # TODO put all information
         return f"Multi Union {self.name}"
 
+    def _meshCacheOperands(self):
+        return self.objects
+
+    @_cachedMesh
     def mesh(self):
         _log.debug("MultiUnion.pycsgmesh>")
 
-        result = self.objects[0].mesh()
-        tra2 = self.transformations[0]
-        rot = tbxyz2axisangle(tra2[0].eval())
-        tlate = tra2[1].eval()
-        result.rotate(rot[0], -rad2deg(rot[1]))
-        result.translate(tlate)
-
-        for idx, (solid, tra2) in enumerate(
-            zip(self.objects[1:], self.transformations[1:]), start=1
-        ):
+        meshes = []
+        for idx, (solid, tra2) in enumerate(zip(self.objects, self.transformations)):
             # tranformation
             rot = tbxyz2axisangle(tra2[0].eval())
             tlate = tra2[1].eval()
@@ -72,11 +69,67 @@ class MultiUnion(_SolidBase):
             _log.debug(f"union.mesh> mesh {idx}")
             mesh = solid.mesh()
 
-            # apply transform to second mesh
+            # apply transform to mesh
             mesh.rotate(rot[0], -rad2deg(rot[1]))
             mesh.translate(tlate)
+            meshes.append(mesh)
+
+        _log.debug("MultiUnion.mesh> union")
+        return unionMeshes(meshes)
 
-            _log.debug("MultiUnion.mesh> union")
-            result = result.union(mesh)
 
-        return result
+def unionMeshes(meshes):
+    """
+    Union of a list of meshes. Meshes whose bounding boxes do not overlap (directly or
+    through other meshes) are concatenated without a boolean operation. Within each group
+    of overlapping meshes the unions are done pairwise as a balanced tree (in order along
+    the axis the meshes are most spread out) so the operands stay similar in size, rather
+    than adding each mesh to an ever growing result.
+
+    :param meshes: list of meshes (pycsg or pycgal CSG)
+    :return: union mesh
+    """
+    # circular import
+    from ..AABBIndex import AABBIndex as _AABBIndex
+    from ...visualisation.Mesh import _concatenateMeshes, _meshToArrays
+
+    # empty meshes do not contribute to the union
+    extents = []
+    nonEmpty = []
+    for m in meshes:
+        vertices = _meshToArrays(m)[0]
+        if len(vertices) != 0:
+            extents.append([vertices.min(axis=0), vertices.max(axis=0)])
+            nonEmpty.append(m)
+    if len(nonEmpty) == 0:
+        return meshes[0]
+    meshes = nonEmpty
+
+    index = _AABBIndex(extents)
+
+    # group meshes connected by overlapping bounding boxes
+    parent = list(range(len(meshes)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for i, j in index.pairs():
+        parent[find(i)] = find(j)
+
+    groups = {}
+    for i in sorted(range(len(meshes)), key=lambda i: index.mins[i, index.axis]):
+        groups.setdefault(find(i), []).append(meshes[i])
+
+    results = []
+    for group in groups.values():
+        while len(group) > 1:
+            reduced = [a.union(b) for a, b in zip(group[0::2], group[1::2])]
+            if len(group) % 2:
+                reduced.append(group[-1])
+            group = reduced
+        results.append(group[0])
+
+    return _concatenateMeshes(results)
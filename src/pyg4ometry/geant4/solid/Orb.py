@@ -1,17 +1,13 @@
 from ... import config as _config
 
 from .SolidBase import SolidBase as _SolidBase
+from .MeshCache import cachedMesh as _cachedMesh
+from .RevolutionMesh import revolutionMesh as _revolutionMesh
 
 if _config.meshing == _config.meshingType.pycsg:
     from ...pycsg.core import CSG as _CSG
-    from ...pycsg.geom import Vector as _Vector
-    from ...pycsg.geom import Vertex as _Vertex
-    from ...pycsg.geom import Polygon as _Polygon
-elif _config.meshing == _config.meshingType.cgal_sm:
+elif _config.meshing in (_config.meshingType.cgal_sm, _config.meshingType.cgal_sm_fast):
     from ...pycgal.core import CSG as _CSG
-    from ...pycgal.geom import Vector as _Vector
-    from ...pycgal.geom import Vertex as _Vertex
-    from ...pycgal.geom import Polygon as _Polygon
 
 import logging as _log
 import numpy as _np
@@ -83,6 +79,7 @@ class Orb(_SolidBase):
         return mesh
     """
 
+    @_cachedMesh
     def mesh(self):
         _log.debug("orb.antlr>")
 
@@ -92,62 +89,11 @@ class Orb(_SolidBase):
 
         pRMax = self.evaluateParameter(self.pRMax) * luval
 
-        polygons = []
-
         _log.debug("orb.pycsgmesh>")
 
-        dPhi = 2 * _np.pi / self.nslice
-        dTheta = _np.pi / self.nstack
-
-        for i in range(0, self.nslice, 1):
-            i1 = i
-            i2 = i + 1
-
-            p1 = dPhi * i1
-            p2 = dPhi * i2
-
-            for j in range(0, self.nstack, 1):
-                j1 = j
-                j2 = j + 1
-
-                t1 = dTheta * j1
-                t2 = dTheta * j2
-
-                xRMaxP1T1 = pRMax * _np.sin(t1) * _np.cos(p1)
-                yRMaxP1T1 = pRMax * _np.sin(t1) * _np.sin(p1)
-                zRMaxP1T1 = pRMax * _np.cos(t1)
-
-                xRMaxP2T1 = pRMax * _np.sin(t1) * _np.cos(p2)
-                yRMaxP2T1 = pRMax * _np.sin(t1) * _np.sin(p2)
-                zRMaxP2T1 = pRMax * _np.cos(t1)
-
-                xRMaxP1T2 = pRMax * _np.sin(t2) * _np.cos(p1)
-                yRMaxP1T2 = pRMax * _np.sin(t2) * _np.sin(p1)
-                zRMaxP1T2 = pRMax * _np.cos(t2)
-
-                xRMaxP2T2 = pRMax * _np.sin(t2) * _np.cos(p2)
-                yRMaxP2T2 = pRMax * _np.sin(t2) * _np.sin(p2)
-                zRMaxP2T2 = pRMax * _np.cos(t2)
-
-                if t1 == 0:  # if north pole (triangles)
-                    vCurv = []
-                    vCurv.append(_Vertex([xRMaxP1T1, yRMaxP1T1, zRMaxP1T1]))
-                    vCurv.append(_Vertex([xRMaxP1T2, yRMaxP1T2, zRMaxP1T2]))
-                    vCurv.append(_Vertex([xRMaxP2T2, yRMaxP2T2, zRMaxP2T2]))
-                    polygons.append(_Polygon(vCurv))
-                elif t2 == _np.pi:  # if south pole (triangleS)
-                    vCurv = []
-                    vCurv.append(_Vertex([xRMaxP1T1, yRMaxP1T1, zRMaxP1T1]))
-                    vCurv.append(_Vertex([xRMaxP2T2, yRMaxP2T2, zRMaxP2T2]))
-                    vCurv.append(_Vertex([xRMaxP2T1, yRMaxP2T1, zRMaxP2T1]))
-                    polygons.append(_Polygon(vCurv))
-                else:  # normal curved quad
-                    vCurv = []
-                    vCurv.append(_Vertex([xRMaxP1T1, yRMaxP1T1, zRMaxP1T1]))
-                    vCurv.append(_Vertex([xRMaxP1T2, yRMaxP1T2, zRMaxP1T2]))
-                    vCurv.append(_Vertex([xRMaxP2T2, yRMaxP2T2, zRMaxP2T2]))
-                    vCurv.append(_Vertex([xRMaxP2T1, yRMaxP2T1, zRMaxP2T1]))
-                    polygons.append(_Polygon(vCurv))
-
-        mesh = _CSG.fromPolygons(polygons)
-        return mesh
+        # (r, z) profile: half circle from the south to the north pole
+        theta = _np.pi / self.nstack * _np.arange(self.nstack, -1, -1)
+        sinTheta = _np.sin(theta)
+        sinTheta[[0, -1]] = 0
+
+        return _revolutionMesh(pRMax * sinTheta, pRMax * _np.cos(theta), 0, 2 * _np.pi, self.nslice)
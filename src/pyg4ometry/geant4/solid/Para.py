@@ -1,6 +1,7 @@
 from ... import config as _config
 
 from .SolidBase import SolidBase as _SolidBase
+from .MeshCache import cachedMesh as _cachedMesh
 from .Box import cubeNet as _cubeNet
 
 if _config.meshing == _config.meshingType.pycsg:
@@ -8,7 +9,7 @@ if _config.meshing == _config.meshingType.pycsg:
     from ...pycsg.geom import Vector as _Vector
     from ...pycsg.geom import Vertex as _Vertex
     from ...pycsg.geom import Polygon as _Polygon
-elif _config.meshing == _config.meshingType.cgal_sm:
+elif _config.meshing in (_config.meshingType.cgal_sm, _config.meshingType.cgal_sm_fast):
     from ...pycgal.core import CSG as _CSG
     from ...pycgal.geom import Vector as _Vector
     from ...pycgal.geom import Vertex as _Vertex
@@ -88,6 +89,7 @@ class Para(_SolidBase):
     def __str__(self):
         return f"Para : name={self.name} x={float(self.pX)} y={float(self.pY)} z={float(self.pZ)} alpha={float(self.pAlpha)} theta={float(self.pTheta)} phi={float(self.pPhi)}"
 
+    @_cachedMesh
     def mesh(self):
         _log.debug("para.antlr>")
         from ...gdml import Units as _Units
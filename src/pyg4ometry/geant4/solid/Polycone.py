@@ -1,6 +1,7 @@
 from ... import config as _config
 
 from .SolidBase import SolidBase as _SolidBase
+from .MeshCache import cachedMesh as _cachedMesh
 from .GenericPolyhedra import GenericPolyhedra as _GenericPolyhedra
 
 import logging as _log
@@ -79,6 +80,7 @@ class Polycone(_SolidBase):
         # TODO finish other polycone
         return f"Polycone : name={self.name} sphi={float(self.pSPhi)} dphi={float(self.pDPhi)}"
 
+    @_cachedMesh
     def mesh(self):
         _log.debug("polycone.pycsgmesh>")
 
@@ -1,5 +1,6 @@
 from .GenericPolyhedra import GenericPolyhedra as _GenericPolyhedra
 from .SolidBase import SolidBase as _SolidBase
+from .MeshCache import cachedMesh as _cachedMesh
 import logging as _log
 import numpy as _np
 
@@ -86,6 +87,7 @@ class Polyhedra(_SolidBase):
     def __str__(self):
         return f"Polyhedra : name={self.name} sphi={self.pSPhi!s} dphi={self.pDPhi!s} numside={self.numSide!s} numzplanes={self.numZPlanes!s}"
 
+    @_cachedMesh
     def mesh(self):
         _log.debug("polyhedra.antlr>")
 
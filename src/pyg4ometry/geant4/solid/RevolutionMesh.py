@@ -0,0 +1,128 @@
+from ... import config as _config
+
+if _config.meshing == _config.meshingType.pycsg:
+    from ...pycsg.core import CSG as _CSG
+elif _config.meshing in (_config.meshingType.cgal_sm, _config.meshingType.cgal_sm_fast):
+    from ...pycgal.core import CSG as _CSG
+
+import numpy as _np
+
+
+def _signedArea(r, z):
+    return 0.5 * float(_np.dot(r, _np.roll(z, -1)) - _np.dot(z, _np.roll(r, -1)))
+
+
+def _polygonArrays(polygons):
+    """
+    Connectivity and offsets for an (n, k) array of polygons, removing repeated
+    consecutive vertex indices (e.g. points on the axis) and polygons left with fewer
+    than three vertices.
+    """
+    keep = polygons != _np.roll(polygons, -1, axis=1)
+    sizes = keep.sum(axis=1)
+    valid = sizes >= 3
+    connectivity = polygons[valid][keep[valid]]
+    return connectivity, sizes[valid]
+
+
+def revolutionMesh(r, z, sPhi, dPhi, nslice, loops=None, caps=None):
+    """
+    Mesh of the solid made by rotating a 2D (r, z) profile about the z axis from sPhi
+    to sPhi + dPhi in nslice steps. All vertices and faces are generated with numpy
+    and passed to the mesh as arrays.
+
+    The profile consists of one or more closed loops of points. The solid is on the
+    left when going along a loop (i.e. counterclockwise with r to the right and z
+    up for the outer boundary), otherwise the mesh is inside out. Points with r = 0
+    lie on the axis and faces touching them become triangles.
+
+    If dPhi is not 2 pi the two ends are closed by the cap polygons. These must be
+    convex and are given as lists of indices into the profile points. By default
+    each loop is a cap.
+
+    :param r: r coordinate of each profile point
+    :type r: list or numpy.ndarray
+    :param z: z coordinate of each profile point
+    :type z: list or numpy.ndarray
+    :param sPhi: start angle in radians
+    :type sPhi: float
+    :param dPhi: angle of rotation in radians
+    :type dPhi: float
+    :param nslice: number of steps in phi
+    :type nslice: int
+    :param loops: number of points in each loop, default one loop of all points
+    :type loops: list of int
+    :param caps: polygons (lists of point indices) closing the ends
+    :type caps: list of list of int
+    """
+    r = _np.asarray(r, dtype=_np.float64)
+    z = _np.asarray(z, dtype=_np.float64)
+    if loops is None:
+        loops = [len(r)]
+
+    fullTurn = dPhi == 2 * _np.pi
+    nRing = nslice if fullTurn else nslice + 1
+    phi = sPhi + dPhi / nslice * _np.arange(nRing)
+
+    # one ring of vertices per distinct profile point, a single vertex on the axis
+    points, point = _np.unique(_np.column_stack([r, z]), axis=0, return_inverse=True)
+    point = point.reshape(-1)
+    onAxis = points[:, 0] == 0
+    counts = _np.where(onAxis, 1, nRing)
+    ringStart = _np.cumsum(counts) - counts
+    index = ringStart[:, None] + (~onAxis)[:, None] * _np.arange(nRing)[None, :]
+
+    vertices = _np.empty((int(counts.sum()), 3))
+    vertices[index, 0] = points[:, 0, None] * _np.cos(phi)[None, :]
+    vertices[index, 1] = points[:, 0, None] * _np.sin(phi)[None, :]
+    vertices[index, 2] = points[:, 1, None]
+
+    # vertex index of profile point i in ring j
+    index = index[point]
+
+    # side faces between consecutive points of each loop
+    first = _np.repeat(_np.cumsum(loops) - loops, loops)
+    i1 = _np.arange(len(r))
+    i2 = first + (i1 - first + 1) % _np.repeat(loops, loops)
+    j1 = _np.arange(nslice)
+    j2 = (j1 + 1) % nRing
+
+    quads = _np.stack(
+        [
+            index[i1[:, None], j2[None, :]],
+            index[i2[:, None], j2[None, :]],
+            index[i2[:, None], j1[None, :]],
+            index[i1[:, None], j1[None, :]],
+        ],
+        axis=-1,
+    ).reshape(-1, 4)
+    connectivity, sizes = _polygonArrays(quads)
+    connectivity = [connectivity]
+    sizes = [sizes]
+
+    # end caps, oriented like the (first) profile loop
+    if not fullTurn:
+        if caps is None:
+            caps = _np.split(_np.arange(len(r)), _np.cumsum(loops)[:-1])
+        sign = _np.sign(_signedArea(r[: loops[0]], z[: loops[0]]))
+
+        for cap in caps:
+            cap = _np.asarray(cap, dtype=int)
+            area = _signedArea(r[cap], z[cap])
+            if area == 0:
+                continue
+            if _np.sign(area) != sign:
+                cap = cap[::-1]
+            for ring, order in ((0, cap), (nRing - 1, cap[::-1])):
+                c, s = _polygonArrays(index[order, ring][None, :])
+                connectivity.append(c)
+                sizes.append(s)
+
+    connectivity = _np.concatenate(connectivity)
+    offsets = _np.zeros(sum(len(s) for s in sizes) + 1, dtype=_np.int32)
+    offsets[1:] = _np.cumsum(_np.concatenate(sizes))
+
+    # drop vertices not used by any face (e.g. axis points between two axis points)
+    used, connectivity = _np.unique(connectivity, return_inverse=True)
+
+    return _CSG.fromNumpy(vertices[used], connectivity.reshape(-1), offsets)
@@ -1,4 +1,5 @@
 from .SolidBase import SolidBase as _SolidBase
+from .MeshCache import cachedMesh as _cachedMesh
 from ...pycsg.core import CSG as _CSG
 
 import logging as _log
@@ -45,6 +46,10 @@ class Scaled(_SolidBase):
     def __str__(self):
         return f"Scaled : name={self.name} solid={self.solid} x={float(self.pX)} y={float(self.pY)} z={float(self.pZ)}"
 
+    def _meshCacheOperands(self):
+        return [self.solid]
+
+    @_cachedMesh
     def mesh(self):
         from ...gdml import Units as _Units
 
@@ -1,5 +1,10 @@
+import logging as _log
 import numpy as _np
 from ... import config as _config
+from .MeshCache import meshCacheKey as _meshCacheKey
+from .MeshCache import meshCache as _meshCache
+
+_log = _log.getLogger(__name__)
 
 
 class SolidBase:
@@ -23,6 +28,38 @@ class SolidBase:
                     + '" - Geant4 will not tolerate this.'
                 )
 
+    def meshCacheKey(self):
+        """
+        Content hash of everything that determines the mesh of this solid: type, evaluated
+        parameters, units, mesh settings and the keys of any constituent solids. Returns
+        None if a parameter cannot be evaluated, in which case the mesh is not cached.
+        """
+        try:
+            data = self._meshCacheKeyData()
+        except (KeyError, TypeError, ValueError) as e:
+            _log.warning("mesh of solid %s is not cached: %s", self.name, e)
+            return None
+        if data is None:
+            return None
+        return _meshCacheKey(data)
+
+    def _meshCacheKeyData(self):
+        data = [self.type, _config.meshing]
+        data += [self.evaluateParameter(getattr(self, v)) for v in self.varNames]
+        data += [getattr(self, a, None) for a in ["lunit", "aunit", "nslice", "nstack", "refine"]]
+        for operand in self._meshCacheOperands():
+            key = _meshCache.solidKey(operand)
+            if key is None:
+                return None
+            data.append(key)
+        return data
+
+    def _meshCacheOperands(self):
+        """
+        Solids used to make the mesh of this solid (e.g. for Booleans).
+        """
+        return []
+
     def evaluateParameter(self, obj):
         from ...gdml.Defines import evaluateToFloat
 
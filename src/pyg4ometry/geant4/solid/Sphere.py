@@ -1,17 +1,8 @@
 from ... import config as _config
 
 from .SolidBase import SolidBase as _SolidBase
-
-if _config.meshing == _config.meshingType.pycsg:
-    from ...pycsg.core import CSG as _CSG
-    from ...pycsg.geom import Vector as _Vector
-    from ...pycsg.geom import Vertex as _Vertex
-    from ...pycsg.geom import Polygon as _Polygon
-elif _config.meshing == _config.meshingType.cgal_sm:
-    from ...pycgal.core import CSG as _CSG
-    from ...pycgal.geom import Vector as _Vector
-    from ...pycgal.geom import Vertex as _Vertex
-    from ...pycgal.geom import Polygon as _Polygon
+from .MeshCache import cachedMesh as _cachedMesh
+from .RevolutionMesh import revolutionMesh as _revolutionMesh
 
 import sys as _sys
 from copy import deepcopy as _dc
@@ -19,8 +10,6 @@ from copy import deepcopy as _dc
 import numpy as _np
 import logging as _log
 
-# import resource as _resource
-import time as _time
 
 _log = _log.getLogger(__name__)
 
@@ -112,6 +101,7 @@ class Sphere(_SolidBase):
     def __str__(self):
         return f"Sphere : name={self.name} rmin={float(self.pRmin)} rmax={float(self.pRmax)} sphi={float(self.pSPhi)} dphi={float(self.pDPhi)} stheta={float(self.pSTheta)} dtheta={float(self.pDTheta)}"
 
+    @_cachedMesh
     def mesh(self):
         """
         working off
@@ -119,8 +109,6 @@ class Sphere(_SolidBase):
         0 < theta < pi
         """
 
-        tBefore = _time.process_time()
-
         _log.debug("sphere.antlr>")
         from ...gdml import Units as _Units
 
@@ -136,172 +124,27 @@ class Sphere(_SolidBase):
 
         _log.debug("Sphere.pycsgmesh>")
 
-        polygons = []
-
-        # changed from d - s/ st
-
-        dPhi = (pDPhi) / self.nslice
-        dTheta = (pDTheta) / self.nstack
-
-        for i in range(0, self.nslice, 1):
-            i1 = i
-            i2 = i + 1
-
-            p1 = dPhi * i1 + pSPhi
-            p2 = dPhi * i2 + pSPhi
-
-            for j in range(0, self.nstack, 1):
-                j1 = j
-                j2 = j + 1
-
-                t1 = dTheta * j1 + pSTheta
-                t2 = dTheta * j2 + pSTheta
-
-                if pRmin != 0:
-                    xRMinP1T1 = pRmin * _np.sin(t1) * _np.cos(p1)
-                    yRMinP1T1 = pRmin * _np.sin(t1) * _np.sin(p1)
-                    zRMinP1T1 = pRmin * _np.cos(t1)
-
-                    xRMinP2T1 = pRmin * _np.sin(t1) * _np.cos(p2)
-                    yRMinP2T1 = pRmin * _np.sin(t1) * _np.sin(p2)
-                    zRMinP2T1 = pRmin * _np.cos(t1)
-
-                    xRMinP1T2 = pRmin * _np.sin(t2) * _np.cos(p1)
-                    yRMinP1T2 = pRmin * _np.sin(t2) * _np.sin(p1)
-                    zRMinP1T2 = pRmin * _np.cos(t2)
-
-                    xRMinP2T2 = pRmin * _np.sin(t2) * _np.cos(p2)
-                    yRMinP2T2 = pRmin * _np.sin(t2) * _np.sin(p2)
-                    zRMinP2T2 = pRmin * _np.cos(t2)
-                else:
-                    xRMinP1T1 = 0.0
-                    yRMinP1T1 = 0.0
-                    zRMinP1T1 = 0.0
-
-                    xRMinP2T1 = 0.0
-                    yRMinP2T1 = 0.0
-                    zRMinP2T1 = 0.0
-
-                    xRMinP1T2 = 0.0
-                    yRMinP1T2 = 0.0
-                    zRMinP1T2 = 0.0
-
-                    xRMinP2T2 = 0.0
-                    yRMinP2T2 = 0.0
-                    zRMinP2T2 = 0.0
-
-                xRMaxP1T1 = pRmax * _np.sin(t1) * _np.cos(p1)
-                yRMaxP1T1 = pRmax * _np.sin(t1) * _np.sin(p1)
-                zRMaxP1T1 = pRmax * _np.cos(t1)
-
-                xRMaxP2T1 = pRmax * _np.sin(t1) * _np.cos(p2)
-                yRMaxP2T1 = pRmax * _np.sin(t1) * _np.sin(p2)
-                zRMaxP2T1 = pRmax * _np.cos(t1)
-
-                xRMaxP1T2 = pRmax * _np.sin(t2) * _np.cos(p1)
-                yRMaxP1T2 = pRmax * _np.sin(t2) * _np.sin(p1)
-                zRMaxP1T2 = pRmax * _np.cos(t2)
-
-                xRMaxP2T2 = pRmax * _np.sin(t2) * _np.cos(p2)
-                yRMaxP2T2 = pRmax * _np.sin(t2) * _np.sin(p2)
-                zRMaxP2T2 = pRmax * _np.cos(t2)
-
-                ###########################
-                # Curved sphere faces
-                ###########################
-                if t1 == 0:  # if north pole (triangles)
-                    vCurv = []
-                    vCurv.append(_Vertex([xRMaxP1T1, yRMaxP1T1, zRMaxP1T1]))
-                    vCurv.append(_Vertex([xRMaxP1T2, yRMaxP1T2, zRMaxP1T2]))
-                    vCurv.append(_Vertex([xRMaxP2T2, yRMaxP2T2, zRMaxP2T2]))
-                    # print "outer  north pole",len(polygons)
-                    polygons.append(_Polygon(vCurv))
-                elif t2 == _np.pi:  # if south pole (triangleS)
-                    vCurv = []
-                    vCurv.append(_Vertex([xRMaxP1T1, yRMaxP1T1, zRMaxP1T1]))
-                    vCurv.append(_Vertex([xRMaxP2T2, yRMaxP2T2, zRMaxP2T2]))
-                    vCurv.append(_Vertex([xRMaxP2T1, yRMaxP2T1, zRMaxP2T1]))
-                    # print "outer south pole",len(polygons)
-                    polygons.append(_Polygon(vCurv))
-                else:  # normal curved quad
-                    vCurv = []
-                    vCurv.append(_Vertex([xRMaxP1T1, yRMaxP1T1, zRMaxP1T1]))
-                    vCurv.append(_Vertex([xRMaxP1T2, yRMaxP1T2, zRMaxP1T2]))
-                    vCurv.append(_Vertex([xRMaxP2T2, yRMaxP2T2, zRMaxP2T2]))
-                    vCurv.append(_Vertex([xRMaxP2T1, yRMaxP2T1, zRMaxP2T1]))
-                    # print "outer normal quad",len(polygons)
-                    polygons.append(_Polygon(vCurv))
-
-                if pRmin != 0:
-                    if t1 == 0:  # if north pole (triangles)
-                        vCurv = []
-                        vCurv.append(_Vertex([xRMinP2T2, yRMinP2T2, zRMinP2T2]))
-                        vCurv.append(_Vertex([xRMinP1T2, yRMinP1T2, zRMinP1T2]))
-                        vCurv.append(_Vertex([xRMinP1T1, yRMinP1T1, zRMinP1T1]))
-                        # print "inner north pole", len(polygons)
-                        polygons.append(_Polygon(vCurv))
-                    elif t2 == _np.pi:  # if south pole
-                        vCurv = []
-                        vCurv.append(_Vertex([xRMinP2T1, yRMinP2T1, zRMinP2T1]))
-                        vCurv.append(_Vertex([xRMinP2T2, yRMinP2T2, zRMinP2T2]))
-                        vCurv.append(_Vertex([xRMinP1T1, yRMinP1T1, zRMinP1T1]))
-                        # print "inner south pole", len(polygons)
-                        polygons.append(_Polygon(vCurv))
-                    else:  # normal curved quad
-                        vCurv = []
-                        vCurv.append(_Vertex([xRMinP2T1, yRMinP2T1, zRMinP2T1]))
-                        vCurv.append(_Vertex([xRMinP2T2, yRMinP2T2, zRMinP2T2]))
-                        vCurv.append(_Vertex([xRMinP1T2, yRMinP1T2, zRMinP1T2]))
-                        vCurv.append(_Vertex([xRMinP1T1, yRMinP1T1, zRMinP1T1]))
-                        # print "inner quad ", len(polygons)
-                        polygons.append(_Polygon(vCurv))
-                if pDPhi != 2 * _np.pi:
-                    if i == 0 and pSPhi != 0:
-                        vEnd = []
-                        if pRmin != 0:
-                            vEnd.append(_Vertex([xRMinP1T1, yRMinP1T1, zRMinP1T1]))
-                        vEnd.append(_Vertex([xRMinP1T2, yRMinP1T2, zRMinP1T2]))
-                        vEnd.append(_Vertex([xRMaxP1T2, yRMaxP1T2, zRMaxP1T2]))
-                        vEnd.append(_Vertex([xRMaxP1T1, yRMaxP1T1, zRMaxP1T1]))
-                        # print "theta low end ", len(polygons)
-                        polygons.append(_Polygon(vEnd))
-
-                    if i == self.nslice - 1 and pSPhi + pDPhi != 2 * _np.pi:
-                        vEnd = []
-                        if pRmin != 0:
-                            vEnd.append(_Vertex([xRMinP2T1, yRMinP2T1, zRMinP2T1]))
-                        vEnd.append(_Vertex([xRMaxP2T1, yRMaxP2T1, zRMaxP2T1]))
-                        vEnd.append(_Vertex([xRMaxP2T2, yRMaxP2T2, zRMaxP2T2]))
-                        vEnd.append(_Vertex([xRMinP2T2, yRMinP2T2, zRMinP2T2]))
-                        # print "theta low end ", len(polygons)
-                        polygons.append(_Polygon(vEnd))
-
-                if pDTheta != _np.pi:
-                    if j == 0 and pSTheta != 0:
-                        vEnd = []
-                        if pRmin != 0:
-                            vEnd.append(_Vertex([xRMinP1T1, yRMinP1T1, zRMinP1T1]))
-                        vEnd.append(_Vertex([xRMaxP1T1, yRMaxP1T1, zRMaxP1T1]))
-                        vEnd.append(_Vertex([xRMaxP2T1, yRMaxP2T1, zRMaxP2T1]))
-                        vEnd.append(_Vertex([xRMinP2T1, yRMinP2T1, zRMinP2T1]))
-                        # print "theta low end ", len(polygons)
-                        polygons.append(_Polygon(vEnd))
-
-                    if j == self.nstack - 1 and pSTheta + pDTheta != _np.pi:
-                        vEnd = []
-                        if pRmin != 0:
-                            vEnd.append(_Vertex([xRMinP1T2, yRMinP1T2, zRMinP1T2]))
-                        vEnd.append(_Vertex([xRMinP2T2, yRMinP2T2, zRMinP2T2]))
-                        vEnd.append(_Vertex([xRMaxP2T2, yRMaxP2T2, zRMaxP2T2]))
-                        vEnd.append(_Vertex([xRMaxP1T2, yRMaxP1T2, zRMaxP1T2]))
-                        # print "theta low end ", len(polygons)
-                        polygons.append(_Polygon(vEnd))
-        tAfter = _time.process_time()
-
-        # mBefore = _resource.getrusage(_resource.RUSAGE_SELF).ru_maxrss
-        mesh = _CSG.fromPolygons(polygons)
-        # mAfter = _resource.getrusage(_resource.RUSAGE_SELF).ru_maxrss
-        # _log.debug(
-        #    f"Sphere.pycsgmesh> profile {self.nstack} {self.nslice} {mesh.getNumberPolys()} {mAfter - mBefore} {tAfter - tBefore}"
-        # )
-        return mesh
+        # (r, z) profile: outer arc upwards then inner arc downwards (or the centre)
+        theta = pSTheta + pDTheta / self.nstack * _np.arange(self.nstack + 1)
+        sinTheta = _np.sin(theta)
+        sinTheta[_np.isclose(theta, 0, atol=1e-12) | _np.isclose(theta, _np.pi, atol=1e-12)] = 0
+        cosTheta = _np.cos(theta)
+
+        r = [pRmax * sinTheta[::-1]]
+        z = [pRmax * cosTheta[::-1]]
+        if pRmin != 0:
+            r.append(pRmin * sinTheta)
+            z.append(pRmin * cosTheta)
+        else:
+            r.append([0.0])
+            z.append([0.0])
+
+        # phi caps as annular (or triangular) pieces between consecutive theta values
+        outer = self.nstack - _np.arange(self.nstack + 1)
+        inner = self.nstack + 1 + (_np.arange(self.nstack + 1) if pRmin != 0 else 0)
+        inner = _np.broadcast_to(inner, outer.shape)
+        caps = _np.stack([outer[:-1], outer[1:], inner[1:], inner[:-1]], axis=1)
+
+        return _revolutionMesh(
+            _np.concatenate(r), _np.concatenate(z), pSPhi, pDPhi, self.nslice, caps=caps
+        )
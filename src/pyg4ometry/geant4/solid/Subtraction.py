@@ -1,5 +1,6 @@
 from ... import config as _config
 from .SolidBase import SolidBase as _SolidBase
+from .MeshCache import cachedMesh as _cachedMesh
 from ... import exceptions
 from ...transformation import *
 
@@ -49,6 +50,7 @@ class Subtraction(_SolidBase):
     def __str__(self):
         return f"Intersection {self.name} {self.obj1.name!s} {self.obj2.name!s}"
 
+    @_cachedMesh
     def mesh(self):
         _log.debug("subtraction.pycsgmesh>")
 
@@ -88,6 +90,9 @@ class Subtraction(_SolidBase):
     def rotation(self):
         return self.tra2[0].eval()
 
+    def _meshCacheOperands(self):
+        return [self.object1(), self.object2()]
+
     def object1(self):
         from ... import geant4 as _g4
 
@@ -1,13 +1,14 @@
 from ... import config as _config
 
 from .SolidBase import SolidBase as _SolidBase
+from .MeshCache import cachedMesh as _cachedMesh
 
 if _config.meshing == _config.meshingType.pycsg:
     from ...pycsg.core import CSG as _CSG
     from ...pycsg.geom import Vector as _Vector
     from ...pycsg.geom import Vertex as _Vertex
     from ...pycsg.geom import Polygon as _Polygon
-elif _config.meshing == _config.meshingType.cgal_sm:
+elif _config.meshing in (_config.meshingType.cgal_sm, _config.meshingType.cgal_sm_fast):
     from ...pycgal.core import CSG as _CSG
     from ...pycgal.geom import Vector as _Vector
     from ...pycgal.geom import Vertex as _Vertex
@@ -119,6 +120,17 @@ class TessellatedSolid(_SolidBase):
         # print(meshtess0)
         # print(meshtess1)
 
+    def _meshCacheKeyData(self):
+        if self.meshtype == self.MeshType.Gdml:
+            # vertices are defines so use their values
+            return [
+                self.type,
+                self.meshtype,
+                [[self.registry.defineDict[v].eval() for v in f] for f in self.meshtess],
+            ]
+        return [self.type, self.meshtype, self.meshtess]
+
+    @_cachedMesh
     def mesh(self):
         #############################################
         # render GDML mesh
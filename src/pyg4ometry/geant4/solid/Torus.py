@@ -1,17 +1,8 @@
 from ... import config as _config
 
 from .SolidBase import SolidBase as _SolidBase
-
-if _config.meshing == _config.meshingType.pycsg:
-    from ...pycsg.core import CSG as _CSG
-    from ...pycsg.geom import Vector as _Vector
-    from ...pycsg.geom import Vertex as _Vertex
-    from ...pycsg.geom import Polygon as _Polygon
-elif _config.meshing == _config.meshingType.cgal_sm:
-    from ...pycgal.core import CSG as _CSG
-    from ...pycgal.geom import Vector as _Vector
-    from ...pycgal.geom import Vertex as _Vertex
-    from ...pycgal.geom import Polygon as _Polygon
+from .MeshCache import cachedMesh as _cachedMesh
+from .RevolutionMesh import revolutionMesh as _revolutionMesh
 
 import numpy as _np
 import logging as _log
@@ -101,6 +92,7 @@ class Torus(_SolidBase):
     def __str__(self):
         return f"Torus : name={self.name} rmin={float(self.pRmin)} rmax={float(self.pRmax)} rtor={float(self.pRtor)} sphi={float(self.pSPhi)} dphi={float(self.pDPhi)}"
 
+    @_cachedMesh
     def mesh(self):
         _log.debug("torus.antlr>")
 
@@ -116,92 +108,28 @@ class Torus(_SolidBase):
         pDPhi = self.evaluateParameter(self.pDPhi) * auval
 
         _log.debug("torus.pycsgmesh>")
-        polygons = []
 
         nstack = self.nstack
         nslice = self.nslice
 
-        dTheta = 2 * _np.pi / nstack
-        dPhi = pDPhi / nslice
-
-        for j0 in range(nslice):
-            j1 = j0
-            j2 = j0 + 1
-
-            for i0 in range(nstack):
-                i1 = i0
-                i2 = i0 + 1
-
-                xRMaxP1T1 = (pRtor + (pRmax * _np.cos(dTheta * i1))) * _np.cos(pSPhi + dPhi * j1)
-                yRMaxP1T1 = (pRtor + (pRmax * _np.cos(dTheta * i1))) * _np.sin(pSPhi + dPhi * j1)
-                zRMaxP1T1 = pRmax * _np.sin(dTheta * i1)
-
-                xRMaxP1T2 = (pRtor + (pRmax * _np.cos(dTheta * i2))) * _np.cos(pSPhi + dPhi * j1)
-                yRMaxP1T2 = (pRtor + (pRmax * _np.cos(dTheta * i2))) * _np.sin(pSPhi + dPhi * j1)
-                zRMaxP1T2 = pRmax * _np.sin(dTheta * i2)
-
-                xRMaxP2T2 = (pRtor + (pRmax * _np.cos(dTheta * i2))) * _np.cos(pSPhi + dPhi * j2)
-                yRMaxP2T2 = (pRtor + (pRmax * _np.cos(dTheta * i2))) * _np.sin(pSPhi + dPhi * j2)
-                zRMaxP2T2 = pRmax * _np.sin(dTheta * i2)
-
-                xRMaxP2T1 = (pRtor + (pRmax * _np.cos(dTheta * i1))) * _np.cos(pSPhi + dPhi * j2)
-                yRMaxP2T1 = (pRtor + (pRmax * _np.cos(dTheta * i1))) * _np.sin(pSPhi + dPhi * j2)
-                zRMaxP2T1 = pRmax * _np.sin(dTheta * i1)
-
-                vertices_outer = []
-                vertices_outer.append(_Vertex([xRMaxP1T1, yRMaxP1T1, zRMaxP1T1]))
-                vertices_outer.append(_Vertex([xRMaxP1T2, yRMaxP1T2, zRMaxP1T2]))
-                vertices_outer.append(_Vertex([xRMaxP2T2, yRMaxP2T2, zRMaxP2T2]))
-                vertices_outer.append(_Vertex([xRMaxP2T1, yRMaxP2T1, zRMaxP2T1]))
-                vertices_outer.reverse()
-                polygons.append(_Polygon(vertices_outer))
-
-                xRMinP1T1 = (pRtor + (pRmin * _np.cos(dTheta * i1))) * _np.cos(pSPhi + dPhi * j1)
-                yRMinP1T1 = (pRtor + (pRmin * _np.cos(dTheta * i1))) * _np.sin(pSPhi + dPhi * j1)
-                zRMinP1T1 = pRmin * _np.sin(dTheta * i1)
-
-                xRMinP1T2 = (pRtor + (pRmin * _np.cos(dTheta * i2))) * _np.cos(pSPhi + dPhi * j1)
-                yRMinP1T2 = (pRtor + (pRmin * _np.cos(dTheta * i2))) * _np.sin(pSPhi + dPhi * j1)
-                zRMinP1T2 = pRmin * _np.sin(dTheta * i2)
-
-                xRMinP2T2 = (pRtor + (pRmin * _np.cos(dTheta * i2))) * _np.cos(pSPhi + dPhi * j2)
-                yRMinP2T2 = (pRtor + (pRmin * _np.cos(dTheta * i2))) * _np.sin(pSPhi + dPhi * j2)
-                zRMinP2T2 = pRmin * _np.sin(dTheta * i2)
-
-                xRMinP2T1 = (pRtor + (pRmin * _np.cos(dTheta * i1))) * _np.cos(pSPhi + dPhi * j2)
-                yRMinP2T1 = (pRtor + (pRmin * _np.cos(dTheta * i1))) * _np.sin(pSPhi + dPhi * j2)
-                zRMinP2T1 = pRmin * _np.sin(dTheta * i1)
-
-                if 0 < pRmin < pRmax:
-                    vertices_inner = []
-                    vertices_inner.append(_Vertex([xRMinP1T1, yRMinP1T1, zRMinP1T1]))
-                    vertices_inner.append(_Vertex([xRMinP1T2, yRMinP1T2, zRMinP1T2]))
-                    vertices_inner.append(_Vertex([xRMinP2T2, yRMinP2T2, zRMinP2T2]))
-                    vertices_inner.append(_Vertex([xRMinP2T1, yRMinP2T1, zRMinP2T1]))
-                    # vertices_inner.reverse()
-                    polygons.append(_Polygon(vertices_inner))
-
-                if pDPhi != 2 * _np.pi:
-                    if j1 == 0:
-                        end = []
-                        if pRmin != 0:
-                            end.append(_Vertex([xRMinP1T1, yRMinP1T1, zRMinP1T1]))
-                        end.append(_Vertex([xRMinP1T2, yRMinP1T2, zRMinP1T2]))
-                        end.append(_Vertex([xRMaxP1T2, yRMaxP1T2, zRMaxP1T2]))
-                        end.append(_Vertex([xRMaxP1T1, yRMaxP1T1, zRMaxP1T1]))
-                        end.reverse()
-                        polygons.append(_Polygon(end))
-
-                    if j1 == nslice - 1:
-                        end = []
-                        if pRmin != 0:
-                            end.append(_Vertex([xRMinP2T1, yRMinP2T1, zRMinP2T1]))
-                        end.append(_Vertex([xRMinP2T2, yRMinP2T2, zRMinP2T2]))
-                        end.append(_Vertex([xRMaxP2T2, yRMaxP2T2, zRMaxP2T2]))
-                        end.append(_Vertex([xRMaxP2T1, yRMaxP2T1, zRMaxP2T1]))
-                        # end.reverse()
-                        polygons.append(_Polygon(end))
-
-        mesh = _CSG.fromPolygons(polygons)
-
-        return mesh
+        # (r, z) profile: outer circle counterclockwise and inner circle clockwise
+        theta = 2 * _np.pi / nstack * _np.arange(nstack)
+        r = [pRtor + pRmax * _np.cos(theta)]
+        z = [pRmax * _np.sin(theta)]
+        loops = [nstack]
+
+        if 0 < pRmin < pRmax:
+            r.append(pRtor + pRmin * _np.cos(-theta))
+            z.append(pRmin * _np.sin(-theta))
+            loops.append(nstack)
+
+            # phi caps as annular pieces between consecutive theta values
+            outer = _np.arange(nstack)
+            inner = nstack + (-outer) % nstack
+            caps = _np.stack([outer, _np.roll(outer, -1), _np.roll(inner, -1), inner], axis=1)
+        else:
+            caps = [_np.arange(nstack)]
+
+        return _revolutionMesh(
+            _np.concatenate(r), _np.concatenate(z), pSPhi, pDPhi, nslice, loops=loops, caps=caps
+        )
@@ -1,6 +1,7 @@
 from ... import config as _config
 
 from .SolidBase import SolidBase as _SolidBase
+from .MeshCache import cachedMesh as _cachedMesh
 from .Box import cubeNet as _cubeNet
 
 if _config.meshing == _config.meshingType.pycsg:
@@ -8,7 +9,7 @@ if _config.meshing == _config.meshingType.pycsg:
     from ...pycsg.geom import Vector as _Vector
     from ...pycsg.geom import Vertex as _Vertex
     from ...pycsg.geom import Polygon as _Polygon
-elif _config.meshing == _config.meshingType.cgal_sm:
+elif _config.meshing in (_config.meshingType.cgal_sm, _config.meshingType.cgal_sm_fast):
     from ...pycgal.core import CSG as _CSG
     from ...pycgal.geom import Vector as _Vector
     from ...pycgal.geom import Vertex as _Vertex
@@ -124,6 +125,7 @@ class Trap(_SolidBase):
     def __str__(self):
         return f"Trap : name={self.name} dz={self.pDz} theta={self.pTheta} dphi={self.pDPhi} dy1={self.pDy1} {self.pDx1} {self.pDx2} {self.pAlp1} {self.pDy2} {self.pDx3} {self.pDx4} {self.pAlp2}"
 
+    @_cachedMesh
     def mesh(self):
         _log.debug("trap.antlr>")
         from ...gdml import Units as _Units
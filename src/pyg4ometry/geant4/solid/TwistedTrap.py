@@ -1,6 +1,7 @@
 from ... import config as _config
 
 from .SolidBase import SolidBase as _SolidBase
+from .MeshCache import cachedMesh as _cachedMesh
 from .TwistedSolid import TwistedSolid as _TwistedSolid
 from .TwoVector import TwoVector as _TwoVector
 from .Layer import Layer as _Layer
@@ -171,6 +172,7 @@ class TwistedTrap(_SolidBase, _TwistedSolid):
         return layers
 
     # @_profile
+    @_cachedMesh
     def mesh(self):
         _log.debug("twistedtrap.pycsgmesh> antlr")
 
@@ -1,6 +1,7 @@
 from ... import config as _config
 
 from .SolidBase import SolidBase as _SolidBase
+from .MeshCache import cachedMesh as _cachedMesh
 from .TwoVector import TwoVector as _TwoVector
 from .Layer import Layer as _Layer
 from .TwistedSolid import TwistedSolid as _TwistedSolid
@@ -116,6 +117,7 @@ class TwistedTrd(_SolidBase, _TwistedSolid):
 
         return layers
 
+    @_cachedMesh
     def mesh(self):
         _log.debug("twistedtrd.pycsgmesh> antlr")
 
@@ -1,4 +1,5 @@
 from .SolidBase import SolidBase as _SolidBase
+from .MeshCache import cachedMesh as _cachedMesh
 from ... import exceptions
 from ...transformation import *
 
@@ -51,6 +52,7 @@ class Union(_SolidBase):
     def __str__(self):
         return f"Union {self.name} {self.obj1.name} {self.obj2.name}"
 
+    @_cachedMesh
     def mesh(self):
         _log.debug("union.pycsgmesh>")
 
@@ -86,6 +88,9 @@ class Union(_SolidBase):
     def rotation(self):
         return self.tra2[0].eval()
 
+    def _meshCacheOperands(self):
+        return [self.object1(), self.object2()]
+
     def object1(self):
         from ... import geant4 as _g4
 
@@ -35,6 +35,7 @@ typedef CGAL::Aff_transformation_3<Kernel_ECER> Aff_transformation_3_ECER;
 #include <CGAL/Polygon_mesh_processing/border.h>
 #include <CGAL/Polygon_mesh_processing/corefinement.h>
 #include <CGAL/Polygon_mesh_processing/distance.h>
+#include <CGAL/Polygon_mesh_processing/intersection.h>
 #include <CGAL/Polygon_mesh_processing/orientation.h>
 // #include <CGAL/Polygon_mesh_processing/remesh.h>
 #include <CGAL/Polygon_mesh_processing/transform.h>
@@ -157,6 +158,26 @@ PYBIND11_MODULE(Polygon_mesh_processing, m) {
   m.def("do_intersect", [](Surface_mesh_EPECK &pm1, Surface_mesh_EPECK &pm2) {
     return CGAL::Polygon_mesh_processing::do_intersect(pm1, pm2);
   });
+  m.def("intersecting_meshes", [](py::list &meshes) {
+    // pairs of meshes with intersecting faces (or one inside the other), found
+    // with a box intersection broad phase over all meshes in one pass
+    std::vector<Surface_mesh_EPECK> sms;
+    sms.reserve(meshes.size());
+    for (auto mesh : meshes) {
+      sms.push_back(mesh.cast<Surface_mesh_EPECK &>());
+    }
+
+    std::vector<std::pair<std::size_t, std::size_t>> pairs;
+    CGAL::Polygon_mesh_processing::intersecting_meshes(
+        sms, std::back_inserter(pairs),
+        CGAL::parameters::do_overlap_test_of_bounded_sides(true));
+
+    py::list result;
+    for (auto &p : pairs) {
+      result.append(py::make_tuple(p.first, p.second));
+    }
+    return result;
+  });
   m.def("area", [](Surface_mesh_EPECK &pm1) {
     return CGAL::to_double(CGAL::Polygon_mesh_processing::area(pm1));
   });
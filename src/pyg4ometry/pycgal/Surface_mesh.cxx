@@ -1,5 +1,10 @@
+#include <cstdint>
+#include <cstring>
+#include <stdexcept>
+#include <string>
 #include <vector>
 
+#include <pybind11/numpy.h>
 #include <pybind11/pybind11.h>
 #include <pybind11/pytypes.h>
 #include <pybind11/stl.h>
@@ -101,6 +106,103 @@ template <> struct hash<Surface_mesh_ECER> {
 
 } // namespace std
 
+/**********************************************************************
+numpy arrays (all kernels)
+**********************************************************************/
+
+typedef py::array_t<double, py::array::c_style | py::array::forcecast>
+    DoubleArray;
+typedef py::array_t<std::int32_t, py::array::c_style | py::array::forcecast>
+    Int32Array;
+
+// vertices (float64 [nvertex,3]), polygon connectivity (int32) and polygon
+// offsets (int32 [npolygon+1]) into the connectivity, filled in one pass
+template <class SurfaceMesh> py::tuple toNumpy(SurfaceMesh &sm) {
+  DoubleArray vertices({(py::ssize_t)sm.number_of_vertices(), (py::ssize_t)3});
+  auto v = vertices.template mutable_unchecked<2>();
+
+  py::ssize_t i = 0;
+  for (typename SurfaceMesh::Vertex_index vd : sm.vertices()) {
+    const typename SurfaceMesh::Point &p = sm.point(vd);
+    v(i, 0) = CGAL::to_double(p.x());
+    v(i, 1) = CGAL::to_double(p.y());
+    v(i, 2) = CGAL::to_double(p.z());
+    ++i;
+  }
+
+  Int32Array offsets((py::ssize_t)sm.number_of_faces() + 1);
+  auto o = offsets.template mutable_unchecked<1>();
+  std::vector<std::int32_t> connectivity;
+  connectivity.reserve(3 * sm.number_of_faces());
+
+  o(0) = 0;
+  i = 0;
+  for (typename SurfaceMesh::Face_index fd : sm.faces()) {
+    for (typename SurfaceMesh::Halfedge_index hd :
+         CGAL::halfedges_around_face(sm.halfedge(fd), sm)) {
+      connectivity.push_back((std::int32_t)sm.source(hd));
+    }
+    o(++i) = (std::int32_t)connectivity.size();
+  }
+
+  Int32Array conn((py::ssize_t)connectivity.size());
+  if (!connectivity.empty()) {
+    std::memcpy(conn.mutable_data(), connectivity.data(),
+                connectivity.size() * sizeof(std::int32_t));
+  }
+
+  return py::make_tuple(vertices, conn, offsets);
+}
+
+template <class SurfaceMesh>
+void fromNumpy(SurfaceMesh &sm, const DoubleArray &vertices,
+               const Int32Array &connectivity, const Int32Array &offsets) {
+  if (vertices.ndim() != 2 || vertices.shape(1) != 3) {
+    throw std::invalid_argument("vertices must have shape (n, 3)");
+  }
+  if (connectivity.ndim() != 1 || offsets.ndim() != 1) {
+    throw std::invalid_argument("connectivity and offsets must be 1D");
+  }
+  auto v = vertices.template unchecked<2>();
+  auto c = connectivity.template unchecked<1>();
+  auto o = offsets.template unchecked<1>();
+
+  // check everything before changing the mesh, the arrays may come from a file
+  if (o.shape(0) > 0 && (o(0) < 0 || o(o.shape(0) - 1) > c.shape(0))) {
+    throw std::invalid_argument("offsets out of range of connectivity");
+  }
+  for (py::ssize_t f = 0; f + 1 < o.shape(0); ++f) {
+    if (o(f + 1) - o(f) < 3) {
+      throw std::invalid_argument("offsets must increase by at least 3 (polygon " +
+                                  std::to_string(f) + ")");
+    }
+    for (std::int32_t k = o(f); k < o(f + 1); ++k) {
+      if (c(k) < 0 || c(k) >= v.shape(0)) {
+        throw std::invalid_argument("vertex index out of range (polygon " +
+                                    std::to_string(f) + ")");
+      }
+    }
+  }
+
+  sm.reserve(sm.number_of_vertices() + v.shape(0), 0, 0);
+  typename SurfaceMesh::size_type first = sm.number_of_vertices();
+  for (py::ssize_t i = 0; i < v.shape(0); ++i) {
+    sm.add_vertex(typename SurfaceMesh::Point(v(i, 0), v(i, 1), v(i, 2)));
+  }
+
+  std::vector<typename SurfaceMesh::Vertex_index> face;
+  for (py::ssize_t f = 0; f + 1 < o.shape(0); ++f) {
+    face.clear();
+    for (std::int32_t k = o(f); k < o(f + 1); ++k) {
+      face.push_back(typename SurfaceMesh::Vertex_index(first + c(k)));
+    }
+    if (sm.add_face(face) == SurfaceMesh::null_face()) {
+      throw std::invalid_argument("polygon " + std::to_string(f) +
+                                  " cannot be added (non-manifold or repeated vertex)");
+    }
+  }
+}
+
 /**********************************************************************
 EPICK
 **********************************************************************/
@@ -507,6 +609,12 @@ PYBIND11_MODULE(Surface_mesh, m) {
   });
   m.def("toVerticesAndPolygons",
         [](Surface_mesh_EPICK &sm) { return toVerticesAndPolygons(sm); });
+  m.def("toNumpy", [](Surface_mesh_EPICK &sm) { return toNumpy(sm); });
+  m.def("fromNumpy",
+        [](Surface_mesh_EPICK &sm, DoubleArray vertices,
+           Int32Array connectivity, Int32Array offsets) {
+          fromNumpy(sm, vertices, connectivity, offsets);
+        });
 
   /**********************************************************************
   EPECK
@@ -680,6 +788,12 @@ PYBIND11_MODULE(Surface_mesh, m) {
   });
   m.def("toVerticesAndPolygons",
         [](Surface_mesh_EPECK &sm) { return toVerticesAndPolygons(sm); });
+  m.def("toNumpy", [](Surface_mesh_EPECK &sm) { return toNumpy(sm); });
+  m.def("fromNumpy",
+        [](Surface_mesh_EPECK &sm, DoubleArray vertices,
+           Int32Array connectivity, Int32Array offsets) {
+          fromNumpy(sm, vertices, connectivity, offsets);
+        });
 
   /**********************************************************************
   ECER
@@ -12,19 +12,62 @@ from . import Polyhedron_3
 from . import Triangle_3
 from . import Vector_3
 from . import CGAL
+from . import Point_3
 from . import pythonHelpers
+from .. import config as _config
 
+from collections import defaultdict as _defaultdict
+import itertools as _itertools
 import numpy as _np
 
 
+def _exactByDefault():
+    return _config.meshing != _config.meshingType.cgal_sm_fast
+
+
+def _toExact(sm):
+    """
+    Surface mesh with the exact kernel (EPECK). Meshes using the inexact kernel are
+    converted, which is lossless as their coordinates are doubles.
+    """
+    if isinstance(sm, Surface_mesh.Surface_mesh_EPECK):
+        return sm
+
+    out = Surface_mesh.Surface_mesh_EPECK()
+    Surface_mesh.fromNumpy(out, *Surface_mesh.toNumpy(sm))
+    return out
+
+
 class CSG:
-    def __init__(self):
-        self.sm = Surface_mesh.Surface_mesh_EPECK()
+    """
+    Mesh stored as a CGAL surface mesh. By default the exact kernel (EPECK) is used.
+    With pyg4ometry.config.meshing = meshingType.cgal_sm_fast meshes created from
+    polygons or arrays use the inexact kernel (EPICK), which is much faster to create
+    and transform. Boolean operations always use (and return) the exact kernel.
+
+    :param exact: use the exact kernel
+    :type exact: bool
+    """
+
+    def __init__(self, exact=True):
+        if exact:
+            self.sm = Surface_mesh.Surface_mesh_EPECK()
+        else:
+            self.sm = Surface_mesh.Surface_mesh_EPICK()
+
+    def isExact(self):
+        return isinstance(self.sm, Surface_mesh.Surface_mesh_EPECK)
+
+    def _kernel(self):
+        return "EPECK" if self.isExact() else "EPICK"
+
+    def _affineTransformation(self, *args):
+        kernel = self._kernel()
+        return getattr(Aff_transformation_3, "Aff_transformation_3_" + kernel)(*args)
 
     @classmethod
-    def fromPolygons(cls, polygons, **kwargs):
-        csg = CSG()
-        csg.sm = Surface_mesh.Surface_mesh_EPECK()
+    def fromPolygons(cls, polygons, exact=None, **kwargs):
+        csg = CSG(_exactByDefault() if exact is None else exact)
         Surface_mesh.toCGALSurfaceMesh(csg.sm, polygons)
         Polygon_mesh_processing.triangulate_faces(csg.sm)
         return csg
@@ -32,11 +75,51 @@ class CSG:
     def toVerticesAndPolygons(self):
         return Surface_mesh.toVerticesAndPolygons(self.sm)
 
+    def toNumpy(self):
+        """
+        Return the mesh as numpy arrays: vertices (float64 [nvertex,3]), polygon
+        connectivity (int32) and polygon offsets (int32 [npolygon+1]) into the
+        connectivity. The arrays are filled directly from the surface mesh.
+        """
+        return Surface_mesh.toNumpy(self.sm)
+
+    @classmethod
+    def fromNumpy(cls, vertices, connectivity, offsets=None, exact=None):
+        """
+        Create a mesh from numpy arrays as returned by toNumpy. If offsets is None
+        connectivity is a 2D array (npolygon, nvertex per polygon), e.g. triangles.
+        """
+        if offsets is None:
+            polygons = _np.asarray(connectivity, dtype=_np.int32)
+            offsets = _np.arange(0, polygons.size + 1, max(polygons.shape[-1], 1))
+            connectivity = polygons.reshape(-1)
+
+        csg = CSG(_exactByDefault() if exact is None else exact)
+        Surface_mesh.fromNumpy(
+            csg.sm,
+            _np.ascontiguousarray(vertices, dtype=_np.float64).reshape(-1, 3),
+            _np.ascontiguousarray(connectivity, dtype=_np.int32),
+            _np.ascontiguousarray(offsets, dtype=_np.int32),
+        )
+        Polygon_mesh_processing.triangulate_faces(csg.sm)
+        return csg
+
     def clone(self):
-        csg = CSG()
+        csg = CSG(self.isExact())
         csg.sm = self.sm.clone()
         return csg
 
+    def toExact(self):
+        """
+        Return a mesh using the exact kernel (self if it already does).
+        """
+        if self.isExact():
+            return self
+
+        csg = CSG()
+        csg.sm = _toExact(self.sm)
+        return csg
+
     def rotate(self, axisIn, angleDeg):
         rot = _np.zeros((3, 3))
 
@@ -64,7 +147,7 @@ class CSG:
         rot[2][1] = (verSin * z * y) + (x * sinAngle)
         rot[2][2] = (verSin * z * z) + cosAngle
 
-        rotn = Aff_transformation_3.Aff_transformation_3_EPECK(
+        rotn = self._affineTransformation(
             rot[0][0],
             rot[0][1],
             rot[0][2],
@@ -81,8 +164,8 @@ class CSG:
     def translate(self, disp):
         vIn = geom.Vector(disp)
         # TODO tidy vector usage (i.e conversion in geom?)
-        v = Vector_3.Vector_3_EPECK(vIn[0], vIn[1], vIn[2])
-        transl = Aff_transformation_3.Aff_transformation_3_EPECK(CGAL.Translation(), v)
+        v = getattr(Vector_3, "Vector_3_" + self._kernel())(vIn[0], vIn[1], vIn[2])
+        transl = self._affineTransformation(CGAL.Translation(), v)
         Polygon_mesh_processing.transform(transl, self.sm)
 
     # TODO need to finish and check signatures
@@ -104,7 +187,7 @@ class CSG:
             x = 1
             y = 1
             z = 1
-        scal = Aff_transformation_3.Aff_transformation_3_EPECK(x, 0, 0, 0, y, 0, 0, 0, z, 1)
+        scal = self._affineTransformation(x, 0, 0, 0, y, 0, 0, 0, z, 1)
         Polygon_mesh_processing.transform(scal, self.sm)
 
     def getNumberVertices(self):
@@ -121,21 +204,27 @@ class CSG:
 
     def intersect(self, csg2):
         out = Surface_mesh.Surface_mesh_EPECK()
-        Polygon_mesh_processing.corefine_and_compute_intersection(self.sm, csg2.sm, out)
+        Polygon_mesh_processing.corefine_and_compute_intersection(
+            _toExact(self.sm), _toExact(csg2.sm), out
+        )
         csg = CSG()
         csg.sm = out
         return csg
 
     def union(self, csg2):
         out = Surface_mesh.Surface_mesh_EPECK()
-        Polygon_mesh_processing.corefine_and_compute_union(self.sm, csg2.sm, out)
+        Polygon_mesh_processing.corefine_and_compute_union(
+            _toExact(self.sm), _toExact(csg2.sm), out
+        )
         csg = CSG()
         csg.sm = out
         return csg
 
     def subtract(self, csg2):
         out = Surface_mesh.Surface_mesh_EPECK()
-        Polygon_mesh_processing.corefine_and_compute_difference(self.sm, csg2.sm, out)
+        Polygon_mesh_processing.corefine_and_compute_difference(
+            _toExact(self.sm), _toExact(csg2.sm), out
+        )
         csg = CSG()
         csg.sm = out
         return csg
@@ -144,175 +233,36 @@ class CSG:
         CGAL.reverse_face_orientations(self.sm)
         return self
 
-    # TODO finish coplanar intersection
-    def coplanarIntersection(self, csg):
-        """
-        Compute the coplanar surfaces between self and csg
-
+    def coplanarIntersection(self, csg, tolerance=None):
         """
+        Compute the coplanar surfaces between self and csg. Returns a mesh of the
+        triangles of both meshes that lie in a common plane (facing either way) and
+        overlap with a triangle of the other mesh.
 
-        sm1 = self.sm
-        sm2 = csg.sm
-
-        #######################################
-        # triangle planes
-        #######################################
-
-        def makePlaneList(sm):
-            # triangle plane list
-            tplanel = []
-
-            # loop over sm1 faces and make planes
-            for f in sm.faces():
-                he = Surface_mesh.Halfedge_index()
-                sm.halfedge(f, he)
+        The triangles are bucketed by their quantised plane (normal and distance from
+        the origin) so only triangles in the same or a neighbouring bucket are compared
+        and the 2D overlap tests of the remaining pairs are done in one go with numpy.
 
-                tpl = []
-
-                for he1 in CGAL.halfedges_around_face(he, sm):
-                    vi = sm.source(he1)
-                    p = sm.point(vi)
-                    tpl.append(p)
-
-                t = Triangle_3.Triangle_3_EPECK(tpl[0], tpl[1], tpl[2])
-                if t.is_degenerate():
-                    print("degenerate triangle")
-
-                pl = t.supporting_plane()
-                tplanel.append([pl, t])
-
-            return tplanel
-
-        #######################################
-        # Are two planes close?
-        #######################################
-        def close(p1, p2):
-            p1dir = p1[0].orthogonal_direction()
-            p1poi = p1[0].point()
-
-            p2dir = p2[0].orthogonal_direction()
-            p2poi = p2[0].point()
+        :param tolerance: distance (and difference of unit normals) below which planes are the same, default pyg4ometry.config.coplanarTolerance
+        :type tolerance: float
+        """
+        if tolerance is None:
+            tolerance = _config.coplanarTolerance
 
-            # print(p1dir,p2dir,p1poi,p2poi)
-            pd0 = Vector_3.Vector_3_EPECK(p2poi, p1poi)
-            dd0 = p2dir.vector() - p1dir.vector()
-            dd1 = p2dir.vector() + p1dir.vector()
+        v1, t1 = _triangleArrays(self.sm)
+        v2, t2 = _triangleArrays(csg.sm)
 
-            if CGAL.to_double(pd0.squared_length()) < 0.0001 and (
-                CGAL.to_double(dd0.squared_length()) < 0.0001
-                or CGAL.to_double(dd1.squared_length()) < 0.0001
-            ):
-                return True
-            else:
-                return False
+        planes1 = _planes(v1, t1)
+        planes2 = _planes(v2, t2)
 
-        tpl1 = makePlaneList(sm1)
-        tpl2 = makePlaneList(sm2)
+        i1, i2 = _coplanarTrianglePairs(planes1, planes2, tolerance)
+        overlap = _trianglesOverlap2d(v1[t1[i1]], v2[t2[i2]], planes1[0][i1])
+        i1 = i1[overlap]
+        i2 = i2[overlap]
 
-        # return surface mesh
         c = CSG()
-        out = c.sm
-
-        # close planes
-        for tpl1i in tpl1:
-            for tpl2i in tpl2:
-                # check if planes are close
-                bClose = close(tpl1i, tpl2i)
-
-                # if close compute 2d intersection
-                if bClose:
-                    t1td0 = tpl1i[0].to_2d(tpl1i[1][0])
-                    t1td1 = tpl1i[0].to_2d(tpl1i[1][1])
-                    t1td2 = tpl1i[0].to_2d(tpl1i[1][2])
-
-                    t2td0 = tpl1i[0].to_2d(tpl2i[1][0])
-                    t2td1 = tpl1i[0].to_2d(tpl2i[1][1])
-                    t2td2 = tpl1i[0].to_2d(tpl2i[1][2])
-
-                    pgon1 = Polygon_2.Polygon_2_EPECK()
-                    pgon1.push_back(t1td0)
-                    pgon1.push_back(t1td1)
-                    pgon1.push_back(t1td2)
-
-                    pgon2 = Polygon_2.Polygon_2_EPECK()
-                    pgon2.push_back(t2td0)
-                    pgon2.push_back(t2td1)
-                    pgon2.push_back(t2td2)
-
-                    pgon3 = Polygon_with_holes_2.List_Polygon_with_holes_2_EPECK()
-                    CGAL.intersection(pgon1, pgon2, pgon3)
-
-                    if len(pgon3) != 0:
-                        v10 = out.add_vertex(tpl1i[1][0])
-                        v11 = out.add_vertex(tpl1i[1][1])
-                        v12 = out.add_vertex(tpl1i[1][2])
-
-                        v20 = out.add_vertex(tpl2i[1][0])
-                        v21 = out.add_vertex(tpl2i[1][1])
-                        v22 = out.add_vertex(tpl2i[1][2])
-
-                        out.add_face(v10, v11, v12)
-                        out.add_face(v20, v21, v22)
-
-                    """
-                    for pwh in pgon3 :
-                        if pwh.outer_boundary().size() == 3 :
-                            obp = pwh.outer_boundary()
-
-                            # convert back to 3d
-                            v0 = tpl1i[0].to_3d(obp.vertex(0))
-                            v1 = tpl1i[0].to_3d(obp.vertex(1))
-                            v2 = tpl1i[0].to_3d(obp.vertex(2))
-
-                            v0i = out.add_vertex(v0)
-                            v1i = out.add_vertex(v1)
-                            v2i = out.add_vertex(v2)
-
-                            out.add_face(v0i,v1i,v2i)
-                        elif pwh.outer_boundary().size() == 4 :
-                            obp = pwh.outer_boundary()
-
-                            # convert back to 3d
-                            v0 = tpl1i[0].to_3d(obp.vertex(0))
-                            v1 = tpl1i[0].to_3d(obp.vertex(1))
-                            v2 = tpl1i[0].to_3d(obp.vertex(2))
-                            v3 = tpl1i[0].to_3d(obp.vertex(3))
-
-                            v0i = out.add_vertex(v0)
-                            v1i = out.add_vertex(v1)
-                            v2i = out.add_vertex(v2)
-                            v3i = out.add_vertex(v3)
-
-                            out.add_face(v0i,v1i,v2i)
-                            out.add_face(v0i,v2i,v3i)
-                        elif pwh.outer_boundary().size() == 6 :
-                            obp = pwh.outer_boundary()
-
-                            # convert back to 3d
-                            v0 = tpl1i[0].to_3d(obp.vertex(0))
-                            v1 = tpl1i[0].to_3d(obp.vertex(1))
-                            v2 = tpl1i[0].to_3d(obp.vertex(2))
-                            v3 = tpl1i[0].to_3d(obp.vertex(3))
-                            v4 = tpl1i[0].to_3d(obp.vertex(4))
-                            v5 = tpl1i[0].to_3d(obp.vertex(5))
-
-
-                            v0i = out.add_vertex(v0)
-                            v1i = out.add_vertex(v1)
-                            v2i = out.add_vertex(v2)
-                            v3i = out.add_vertex(v3)
-                            v4i = out.add_vertex(v4)
-                            v5i = out.add_vertex(v5)
-
-                            out.add_face(v0i,v1i,v2i)
-                            out.add_face(v0i,v2i,v3i)
-                            out.add_face(v0i,v3i,v4i)
-                            out.add_face(v0i,v4i,v5i)
-
-                        else :
-                            print(pwh.outer_boundary().size())
-                    """
-
+        _addTriangles(c.sm, v1, t1[_np.unique(i1)])
+        _addTriangles(c.sm, v2, t2[_np.unique(i2)])
         return c
 
     @classmethod
@@ -448,13 +398,150 @@ class CSG:
         self.sm.writeOff(fileName)
 
 
+def _triangleArrays(sm):
+    """
+    Vertices (n,3) and triangles (m,3) of a surface mesh as numpy arrays. Faces with
+    more than three vertices are split into fans of triangles.
+    """
+    vertices, connectivity, offsets = Surface_mesh.toNumpy(sm)
+    sizes = _np.diff(offsets)
+    if _np.all(sizes == 3):
+        return vertices, connectivity.reshape(-1, 3)
+
+    triangles = []
+    for i in range(len(sizes)):
+        p = connectivity[offsets[i] : offsets[i + 1]]
+        for k in range(1, len(p) - 1):
+            triangles.append([p[0], p[k], p[k + 1]])
+    return vertices, _np.array(triangles, dtype=int).reshape(-1, 3)
+
+
+def _planes(vertices, triangles):
+    """
+    Unit normals, distances from the origin and validity (not degenerate) of the planes of
+    the triangles.
+    """
+    p = vertices[triangles]
+    normals = _np.cross(p[:, 1] - p[:, 0], p[:, 2] - p[:, 0])
+    length = _np.linalg.norm(normals, axis=1)
+    valid = length > 0
+    normals[valid] /= length[valid, None]
+    distances = _np.einsum("ij,ij->i", normals, p[:, 0])
+    return normals, distances, valid
+
+
+def _coplanarTrianglePairs(planes1, planes2, tolerance):
+    """
+    Index arrays (i1, i2) of the pairs of triangles whose planes (see _planes) are the same
+    within tolerance, facing either way.
+    """
+    n1, d1, valid1 = planes1
+    n2, d2, valid2 = planes2
+
+    # planes within tolerance of each other are at most a quarter of a cell apart so are in
+    # the same cell or the neighbouring one closest to them in each coordinate
+    cell = 4.0 * tolerance
+    q1 = _np.column_stack([n1, d1]) / cell
+    q2 = _np.column_stack([n2, d2]) / cell
+    keys1 = _np.floor(q1 + 0.5).astype(_np.int64)
+
+    buckets = _defaultdict(list)
+    for i in _np.flatnonzero(valid1):
+        buckets[tuple(keys1[i])].append(i)
+
+    i1 = []
+    i2 = []
+    signs = []
+    for j in _np.flatnonzero(valid2):
+        for sign in (1, -1):
+            q = sign * q2[j]
+            r = _np.floor(q + 0.5)
+            f = q - r
+            options = [
+                (int(rk), int(rk + _np.sign(fk))) if abs(fk) > 0.25 else (int(rk),)
+                for rk, fk in zip(r, f)
+            ]
+            for key in _itertools.product(*options):
+                for i in buckets.get(key, ()):
+                    i1.append(i)
+                    i2.append(j)
+                    signs.append(sign)
+
+    i1 = _np.array(i1, dtype=int)
+    i2 = _np.array(i2, dtype=int)
+    signs = _np.array(signs, dtype=float)
+
+    same = _np.linalg.norm(n1[i1] - signs[:, None] * n2[i2], axis=1) < tolerance
+    same &= _np.abs(d1[i1] - signs * d2[i2]) < tolerance
+    return i1[same], i2[same]
+
+
+def _trianglesOverlap2d(tri1, tri2, normals):
+    """
+    For arrays (n,3,3) of pairs of (nearly) coplanar triangles return a boolean array which
+    is True where the triangles overlap with a non-zero area. The triangles are projected
+    onto the coordinate plane closest to their plane and tested for a separating axis.
+    """
+    if len(tri1) == 0:
+        return _np.zeros(0, dtype=bool)
+
+    # drop the coordinate along the largest component of the normal
+    keep = _np.array([[1, 2], [0, 2], [0, 1]])[_np.argmax(_np.abs(normals), axis=1)]
+    a = _np.take_along_axis(tri1, keep[:, None, :], axis=2)
+    b = _np.take_along_axis(tri2, keep[:, None, :], axis=2)
+
+    # candidate separating axes are the normals of the 6 edges
+    edges = _np.concatenate([_np.roll(a, -1, axis=1) - a, _np.roll(b, -1, axis=1) - b], axis=1)
+    axes = _np.stack([-edges[..., 1], edges[..., 0]], axis=2)
+    length = _np.linalg.norm(axes, axis=2)
+    length[length == 0] = 1
+    axes /= length[..., None]
+
+    pa = _np.einsum("nkc,npc->nkp", axes, a)
+    pb = _np.einsum("nkc,npc->nkp", axes, b)
+
+    # triangles only touching along an edge or at a vertex do not overlap
+    eps = 1e-9 * max(1.0, float(_np.abs(a).max()), float(_np.abs(b).max()))
+    separated = (pa.max(axis=2) <= pb.min(axis=2) + eps) | (pb.max(axis=2) <= pa.min(axis=2) + eps)
+    return ~separated.any(axis=1)
+
+
+def _addTriangles(sm, vertices, triangles):
+    """
+    Add triangles (indices into vertices) to a surface mesh, each vertex only once.
+    """
+    if len(triangles) == 0:
+        return
+
+    used, inverse = _np.unique(triangles, return_inverse=True)
+    indices = [sm.add_vertex(Point_3.Point_3_EPECK(*(float(x) for x in vertices[u]))) for u in used]
+    for t in inverse.reshape(-1, 3):
+        sm.add_face(indices[t[0]], indices[t[1]], indices[t[2]])
+
+
 def do_intersect(csg1, csg2):
-    return Polygon_mesh_processing.do_intersect(csg1.sm, csg2.sm)
+    if csg1.isExact() == csg2.isExact():
+        return Polygon_mesh_processing.do_intersect(csg1.sm, csg2.sm)
+    return Polygon_mesh_processing.do_intersect(_toExact(csg1.sm), _toExact(csg2.sm))
 
 
 def intersecting_meshes(csgList):
-    smList = [c.sm for c in csgList]
-    print(smList)
+    """
+    Find all pairs of meshes in csgList that intersect (or where one is inside the
+    other) in a single pass, using a box intersection broad phase over the faces of all
+    the meshes rather than calling do_intersect for every pair.
+
+    :param csgList: meshes to test
+    :type csgList: list of CSG
+    :return: sorted list of index pairs (i, j) with i < j
+    """
+    # empty meshes cannot intersect anything
+    indices = [i for i, c in enumerate(csgList) if not c.isNull()]
+    smList = [_toExact(csgList[i].sm) for i in indices]
+
+    pairs = Polygon_mesh_processing.intersecting_meshes(smList)
+
+    return sorted((min(indices[i], indices[j]), max(indices[i], indices[j])) for i, j in pairs)
 
 
 class PolygonProcessing:
@@ -232,6 +232,60 @@ class CSG(object):
             verts.append(tuple(p))
         return verts, polys, count
 
+    def toNumpy(self):
+        """
+        Return numpy arrays of the vertices (float64 [nvertex,3]), polygon
+        connectivity (int32) and polygon offsets (int32 [npolygon+1]) into
+        the connectivity. Vertices are merged and ordered as in
+        toVerticesAndPolygons.
+        """
+        offset = 1.234567890 # same offset as toVerticesAndPolygons
+        sizes = [len(poly.vertices) for poly in self.polygons]
+        offsets = _np.zeros(len(sizes) + 1, dtype=_np.int32)
+        offsets[1:] = _np.cumsum(sizes)
+        if len(sizes) == 0:
+            return _np.zeros((0, 3)), _np.zeros(0, dtype=_np.int32), offsets
+
+        positions = _np.array([(v.pos.x, v.pos.y, v.pos.z)
+                               for poly in self.polygons
+                               for v in poly.vertices], dtype=_np.float64)
+        positions += offset
+
+        # round to 11 significant digits like the '%.10e' keys
+        exponent = _np.zeros_like(positions)
+        _np.log10(_np.abs(positions), out=exponent, where=positions != 0)
+        scale = 10.0 ** (10 - _np.floor(exponent))
+        keys = _np.round(positions * scale) / scale
+
+        # number vertices in order of first use
+        unique, first, inverse = _np.unique(keys, axis=0, return_index=True,
+                                            return_inverse=True)
+        order = _np.argsort(first)
+        rank = _np.empty(len(order), dtype=_np.int32)
+        rank[order] = _np.arange(len(order), dtype=_np.int32)
+
+        vertices = unique[order] - offset
+        connectivity = rank[inverse.reshape(-1)]
+        return vertices, connectivity, offsets
+
+    @classmethod
+    def fromNumpy(cls, vertices, connectivity, offsets=None):
+        """
+        Create a CSG from numpy arrays as returned by toNumpy. If offsets is
+        None connectivity is a 2D array (npolygon, nvertex per polygon).
+        """
+        vertices = _np.asarray(vertices, dtype=_np.float64).reshape(-1, 3).tolist()
+        if offsets is None:
+            polygons = _np.asarray(connectivity).tolist()
+        else:
+            connectivity = _np.asarray(connectivity).tolist()
+            offsets = _np.asarray(offsets).tolist()
+            polygons = [connectivity[offsets[i]:offsets[i + 1]]
+                        for i in range(len(offsets) - 1)]
+
+        return CSG.fromPolygons([Polygon([Vertex(vertices[i]) for i in p])
+                                 for p in polygons])
+
     def saveVTK(self, filename):
         """
         Save polygons in VTK file.
@@ -1,4 +1,5 @@
 import vtk as _vtk
+from vtk.util import numpy_support as _numpy_support
 import copy as _copy
 import numpy as _np
 
@@ -16,33 +17,56 @@ def pycsgMeshToVtkPolyData(mesh):
     # refine mesh
     # mesh.refine()
 
-    verts, cells, count = mesh.toVerticesAndPolygons()
+    return numpyToVtkPolyData(*mesh.toNumpy())
+
+
+def numpyToVtkPolyData(vertices, connectivity, offsets):
+    """
+    Make vtkPolyData from numpy arrays of vertices [nvertex,3], polygon connectivity and
+    polygon offsets [npolygon+1] into the connectivity (see CSG.toNumpy). The arrays are
+    copied into the vtk arrays in one go.
+    """
     meshPolyData = _vtk.vtkPolyData()
-    points = _vtk.vtkPoints()
-    polys = _vtk.vtkCellArray()
-    scalars = _vtk.vtkFloatArray()
 
-    for v in verts:
-        points.InsertNextPoint(v)
+    points = _vtk.vtkPoints()
+    points.SetData(
+        _numpy_support.numpy_to_vtk(
+            _np.ascontiguousarray(vertices, dtype=_np.float64).reshape(-1, 3), deep=True
+        )
+    )
 
-    for p in cells:
-        polys.InsertNextCell(mkVtkIdList(p))
+    polys = _vtk.vtkCellArray()
+    polys.SetData(
+        _numpy_support.numpy_to_vtkIdTypeArray(
+            _np.ascontiguousarray(offsets, dtype=_numpy_support.ID_TYPE_CODE), deep=True
+        ),
+        _numpy_support.numpy_to_vtkIdTypeArray(
+            _np.ascontiguousarray(connectivity, dtype=_numpy_support.ID_TYPE_CODE), deep=True
+        ),
+    )
 
-    for i in range(count):
-        scalars.InsertTuple1(i, 1)
+    scalars = _numpy_support.numpy_to_vtk(_np.ones(len(connectivity), dtype=_np.float32), deep=True)
 
     meshPolyData.SetPoints(points)
     meshPolyData.SetPolys(polys)
     meshPolyData.GetPointData().SetScalars(scalars)
 
-    del points
-    del polys
-    del scalars
-
     return meshPolyData
 
 
+def _vtkCellArrayToNumpy(cellArray):
+    offsets = _numpy_support.vtk_to_numpy(cellArray.GetOffsetsArray())
+    connectivity = _numpy_support.vtk_to_numpy(cellArray.GetConnectivityArray())
+    return connectivity, offsets
+
+
 def vtkPolyDataToNumpy(data):
+    """
+    Points of each connected region of polydata (or a polydata file), e.g. the lines
+    from a cutter, as a list of numpy arrays [npoint,3]. The points are in the order
+    given by following the cells from the first point of the first cell of the region
+    to their second points.
+    """
     conFlt = _vtk.vtkConnectivityFilter()
     if type(data) is str:
         r = _vtk.vtkPolyDataReader()
@@ -56,39 +80,41 @@ def vtkPolyDataToNumpy(data):
     conFlt.ColorRegionsOn()
     conFlt.Update()
 
-    # print(conFlt.GetNumberOfExtractedRegions())
+    pd = conFlt.GetOutput()
+    nRegions = conFlt.GetNumberOfExtractedRegions()
+    if pd.GetNumberOfPoints() == 0:
+        return []
+
+    points = _numpy_support.vtk_to_numpy(pd.GetPoints().GetData())
+    pointRegion = _numpy_support.vtk_to_numpy(pd.GetPointData().GetArray("RegionId"))
+    cellRegion = _numpy_support.vtk_to_numpy(pd.GetCellData().GetArray("RegionId"))
+    nCells = _np.bincount(cellRegion, minlength=nRegions)
+
+    # first and second point of each cell with at least two points (lines then polygons)
+    starts = []
+    ends = []
+    for cellArray in [pd.GetLines(), pd.GetPolys()]:
+        connectivity, offsets = _vtkCellArrayToNumpy(cellArray)
+        first = offsets[:-1][_np.diff(offsets) >= 2]
+        starts.append(connectivity[first])
+        ends.append(connectivity[first + 1])
+    starts = _np.concatenate(starts)
+    ends = _np.concatenate(ends)
+
+    # the point following each point (the second point of the last cell starting there)
+    following = _np.full(len(points), -1)
+    following[starts] = ends
+
+    # first point of the first cell in each region
+    startRegion = pointRegion[starts]
+    regions, firstCell = _np.unique(startRegion, return_index=True)
 
     retnSortedPnts = []
-    for i in range(conFlt.GetNumberOfExtractedRegions()):
-        conFlt.SetExtractionModeToSpecifiedRegions()
-        conFlt.InitializeSpecifiedRegionList()
-        conFlt.AddSpecifiedRegion(i)
-        conFlt.Update()
-        pd = conFlt.GetOutput()
-        # print(pd.GetNumberOfPoints(),pd.GetNumberOfCells())
-
-        firstCell = pd.GetCell(0)
-        firstPointId = firstCell.GetPointId(0)
-
-        def pntsInOrder(pointId, nlim=10000, ids=[]):
-            ids.append(pointId)
-            vidl = _vtk.vtkIdList()
-            pd.GetPointCells(pointId, vidl)
-            for ci in range(vidl.GetNumberOfIds()):
-                c = pd.GetCell(vidl.GetId(ci))
-                if c.GetPointId(0) == pointId and len(ids) < nlim:
-                    # print(nlim,len(ids))
-                    pntsInOrder(c.GetPointId(1), nlim, ids)
-
-        sortedIds = []
-        pntsInOrder(firstPointId, pd.GetNumberOfCells() + 1, sortedIds)
-        # print(sortedIds)
-
-        sortedPnts = []
-        for sid in sortedIds:
-            sortedPnts.append(list(pd.GetPoint(sid)))
-
-        retnSortedPnts.append(_np.array(sortedPnts))
+    for region, pointId in zip(regions, starts[firstCell]):
+        sortedIds = [pointId]
+        while len(sortedIds) < nCells[region] + 1 and following[sortedIds[-1]] >= 0:
+            sortedIds.append(following[sortedIds[-1]])
+        retnSortedPnts.append(points[sortedIds])
 
     return retnSortedPnts
 
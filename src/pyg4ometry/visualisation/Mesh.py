@@ -5,7 +5,7 @@ from .. import exceptions
 
 if _config.meshing == _config.meshingType.pycsg:
     from ..pycsg.core import CSG as _CSG
-elif _config.meshing == _config.meshingType.cgal_sm:
+elif _config.meshing in (_config.meshingType.cgal_sm, _config.meshingType.cgal_sm_fast):
     from ..pycgal.core import CSG as _CSG
 
 
@@ -22,15 +22,15 @@ class OverlapType:
 
 
 class Mesh:
-    def __init__(self, solid):
+    def __init__(self, solid, localmesh=None):
         parameters = []
         values = {}
 
         # solid which contains the mesh
         self.solid = solid
 
-        # mesh in local coordinates
-        self.localmesh = self.solid.mesh()
+        # mesh in local coordinates (if not given, e.g. meshed elsewhere)
+        self.localmesh = self.solid.mesh() if localmesh is None else localmesh
 
         # bounding mesh in local coordinates
         self.localboundingmesh = self.getBoundingBoxMesh()
@@ -48,6 +48,46 @@ class Mesh:
         # recreate bounding mesh
         self.localboundingmesh = self.getBoundingBoxMesh()
 
+    @property
+    def localmesh(self):
+        return self._localmesh
+
+    @localmesh.setter
+    def localmesh(self, mesh):
+        self._localmesh = mesh
+
+        # cached volume, area and bounding box of the mesh (see volume, area and getBoundingBox)
+        self._volume = None
+        self._area = None
+        self._boundingBox = None
+
+    def volume(self):
+        """
+        Volume of the local mesh. Computed once and cached until the mesh is replaced.
+        """
+        if self._volume is None:
+            self._volume = self.localmesh.volume()
+        return self._volume
+
+    def area(self):
+        """
+        Surface area of the local mesh. Computed once and cached until the mesh is replaced.
+        """
+        if self._area is None:
+            self._area = self.localmesh.area()
+        return self._area
+
+    def _cacheMeasures(self, boundingBox=None, volume=None, area=None):
+        """
+        Store measures of the local mesh computed elsewhere, e.g. in another process.
+        """
+        if boundingBox is not None:
+            self._boundingBox = boundingBox
+        if volume is not None:
+            self._volume = volume
+        if area is not None:
+            self._area = area
+
     def addOverlapMesh(self, mesh):
         self.overlapmeshes.append(mesh)
 
@@ -57,9 +97,15 @@ class Mesh:
     def getBoundingBox(self, rotationMatrix=None, translation=None):
         """
         Axes aligned bounding box. Can also provide a rotation and
-        a translation (applied in that order) to the vertices.
+        a translation (applied in that order) to the vertices. Without these the
+        box is cached until the mesh is replaced.
         """
-        return _getBoundingBox(self.localmesh, rotationMatrix, translation, self.solid)
+        if rotationMatrix is not None or translation is not None:
+            return _getBoundingBox(self.localmesh, rotationMatrix, translation, self.solid)
+
+        if self._boundingBox is None:
+            self._boundingBox = _getBoundingBox(self.localmesh, nameForError=self.solid)
+        return [list(self._boundingBox[0]), list(self._boundingBox[1])]
 
     def getBoundingBoxMesh(self):
         bb = self.getBoundingBox()
@@ -71,14 +117,13 @@ def _getBoundingBox(aMesh, rotationMatrix=None, translation=None, nameForError="
     Axes aligned bounding box. Can also provide a rotation and
     a translation (applied in that order) to the vertices.
     """
-    vertices, _, _ = aMesh.toVerticesAndPolygons()
-    if not vertices:
+    vertices = aMesh.toNumpy()[0]
+    if len(vertices) == 0:
         _log.warning("getBoundingBox null mesh error : %s", nameForError)
         if _config.meshingNullException:
             raise exceptions.NullMeshError(nameForError)
         else:
             return [[-1e-9, -1e-9, -1e-9], [1e9, 1e9, 1e9]]
-    vertices = _np.vstack(vertices)
 
     if rotationMatrix is not None:
         vertices = rotationMatrix.dot(vertices.T).T
@@ -87,8 +132,8 @@ def _getBoundingBox(aMesh, rotationMatrix=None, translation=None, nameForError="
         vertices[..., 1] += translation[1]
         vertices[..., 2] += translation[2]
 
-    vMin = [min(vertices[..., 0]), min(vertices[..., 1]), min(vertices[..., 2])]
-    vMax = [max(vertices[..., 0]), max(vertices[..., 1]), max(vertices[..., 2])]
+    vMin = vertices.min(axis=0).tolist()
+    vMax = vertices.max(axis=0).tolist()
 
     _log.debug("visualisation.Mesh.getBoundingBox> %s %s", vMin, vMax)
 
@@ -113,3 +158,50 @@ def _getBoundingBoxMesh(boundingBox):
 
     mesh = _CSG.cube(center=[x0, y0, z0], radius=[pX, pY, pZ])
     return mesh
+
+
+def _meshToArrays(aMesh):
+    """
+    Compact representation of a mesh for storage or sending to another process.
+
+    :param aMesh: mesh to convert
+    :type aMesh: CSG
+    :return: vertices (float64 [nvertex,3]), polygon connectivity (int32) and polygon offsets
+             (int32 [npolygon+1]) into the connectivity
+    """
+    return aMesh.toNumpy()
+
+
+def _arraysToMesh(vertices, connectivity, offsets):
+    """
+    Create a mesh from the arrays returned by _meshToArrays.
+    """
+    return _CSG.fromNumpy(vertices, connectivity, offsets)
+
+
+def _concatenateMeshes(meshes):
+    """
+    Combine meshes into one mesh without a boolean operation. Only valid (as a union)
+    if the meshes do not overlap.
+    """
+    if len(meshes) == 1:
+        return meshes[0]
+
+    allVertices = []
+    allConnectivity = []
+    allOffsets = [_np.zeros(1, dtype=_np.int32)]
+    nVertices = 0
+    nConnectivity = 0
+    for m in meshes:
+        vertices, connectivity, offsets = _meshToArrays(m)
+        allVertices.append(vertices)
+        allConnectivity.append(connectivity + nVertices)
+        allOffsets.append(offsets[1:] + nConnectivity)
+        nVertices += len(vertices)
+        nConnectivity += len(connectivity)
+
+    return _arraysToMesh(
+        _np.concatenate(allVertices),
+        _np.concatenate(allConnectivity),
+        _np.concatenate(allOffsets),
+    )
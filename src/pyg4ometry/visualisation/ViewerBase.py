@@ -459,12 +459,10 @@ class ViewerBase:
 
             inf = csg.info()
 
-            vAndPs = csg.toVerticesAndPolygons()
-            verts = vAndPs[0]
-            tris = vAndPs[1]
+            verts, tris, _ = csg.toNumpy()
 
-            verts = _np.array(verts).astype(_np.float32)
-            tris = _np.array(tris).astype(_np.uint32)
+            verts = verts.astype(_np.float32)
+            tris = tris.astype(_np.uint32).reshape(-1, 3)
 
             verts_binary_blob = verts.flatten().tobytes()
             tris_binary_blob = tris.flatten().tobytes()
@@ -1,3 +1,4 @@
+import numpy as _np
 import vtk as _vtk
 
 from .. import transformation as _transformation
@@ -72,6 +73,11 @@ class VtkViewerNew(_ViewerBase):
         self.axes = []  # axes actors
 
         self.instanceNameDict = {}  # instance transformation to PV name
+        self.instanceActors = {}  # instanced actor : (mesh name, placement)
+        self.cutterTransforms = {}  # cutter of an instanced actor : transform filter
+        self.clipperPlanes = []  # clipping planes of instanced mappers
+        self.instanceCutActors = {}  # instanced actor : [cutter actors]
+        self.lod = None  # level of detail state (see buildPipelinesLOD)
 
         self.bBuiltPipelines = False
 
@@ -147,7 +153,7 @@ class VtkViewerNew(_ViewerBase):
         self.cuttersAppFlt = _vtk.vtkAppendPolyData()
 
         for c in self.cutters[name]:
-            self.cuttersAppFlt.AddInputConnection(c.GetOutputPort())
+            self.cuttersAppFlt.AddInputConnection(self._cutterOutputPort(c))
 
         w = _vtk.vtkPolyDataWriter()
         w.SetFileName(fileName)
@@ -158,12 +164,16 @@ class VtkViewerNew(_ViewerBase):
         self.cuttersAppFlt = _vtk.vtkAppendPolyData()
 
         for c in self.cutters[name]:
-            self.cuttersAppFlt.AddInputConnection(c.GetOutputPort())
+            self.cuttersAppFlt.AddInputConnection(self._cutterOutputPort(c))
 
         self.cuttersAppFlt.Update()
 
         return self.cuttersAppFlt.GetOutput()
 
+    def _cutterOutputPort(self, cutter):
+        # cutters of instanced actors work in the local coordinates of the mesh
+        return self.cutterTransforms.get(cutter, cutter).GetOutputPort()
+
     def exportOBJScene(self, fileName="scene"):
         rw = _vtk.vtkRenderWindow()
         rw.AddRenderer(self.renWin.GetRenderers().GetFirstRenderer())
@@ -221,6 +231,10 @@ class VtkViewerNew(_ViewerBase):
             p.SetOrigin(*origin)
             p.SetNormal(*normal)
 
+        for p in self.clipperPlanes:
+            p.SetOrigin(*origin)
+            p.SetNormal(*normal)
+
         if self.bClipperCutter:
             self.setCutter("clipperCutter", origin, normal)
 
@@ -503,6 +517,229 @@ class VtkViewerNew(_ViewerBase):
 
         self.bBuiltPipelines = True
 
+    def buildPipelinesInstanced(self):
+        """
+        Build pipelines with one triangulated polydata per distinct mesh. It is shared
+        (through one mapper per set of visualisation options) by an actor for each
+        placement, which is positioned by the actor transformation. Memory and build time
+        scale with the number of distinct meshes rather than the number of placements.
+        The cut faces of a clipper are not closed in this mode.
+        """
+        # loop over meshes and create triangulated polydata
+        for k in self.localmeshes:
+            triFlt = _vtk.vtkTriangleFilter()  # (tri)angle (F)i(lt)er
+            triFlt.AddInputData(_Convert.pycsgMeshToVtkPolyData(self.localmeshes[k]))
+            triFlt.Update()
+            self.polydata[k] = triFlt.GetOutput()
+
+        if self.clipperNormal is not None:
+            clipPlane = _vtk.vtkPlane()
+            clipPlane.SetOrigin(*self.clipperOrigin)
+            clipPlane.SetNormal(*self.clipperNormal)
+            self.clipperPlanes.append(clipPlane)
+
+        # loop over placements and create an actor sharing the polydata for each
+        for k in self.instancePlacements:
+            ips = self.instancePlacements[k]  # (i)nstance (p)placement(s)
+            vos = self.instanceVisOptions[k]  # (v)isualisation (o)ption(s)
+            pd = self.polydata[k]
+
+            mappers = {}  # str(visualisation options) : mapper
+            for i, (ip, visOpt) in enumerate(zip(ips, vos)):
+                if str(visOpt) not in mappers:
+                    map = _vtk.vtkPolyDataMapper()  # vtkPolyData(Map)per
+                    map.ScalarVisibilityOff()
+                    map.SetResolveCoincidentTopologyToPolygonOffset()
+                    map.SetRelativeCoincidentTopologyPolygonOffsetParameters(0, 3 * visOpt.depth)
+                    map.SetInputData(pd)
+                    if self.clipperNormal is not None:
+                        map.AddClippingPlane(clipPlane)
+                    mappers[str(visOpt)] = map
+
+                vtrans = _Convert.pyg42VtkTransformation(ip["transformation"], ip["translation"])
+
+                actor = _vtk.vtkActor()  # vtk(Actor)
+                actor.SetMapper(mappers[str(visOpt)])
+                actor.SetUserMatrix(vtrans)
+
+                if visOpt.representation == "wireframe":
+                    actor.GetProperty().SetRepresentationToWireframe()
+
+                actor.GetProperty().SetOpacity(visOpt.alpha)
+                actor.GetProperty().SetColor(*visOpt.colour)
+
+                self.actors[k + "_" + str(i)] = actor
+                self.instanceActors[actor] = (k, ip)
+                self.instanceCutActors[actor] = []
+                self.ren.AddActor(actor)
+
+                # Add cutters, cutting the local mesh with the plane in local coordinates
+                for ck in self.cutterOrigins:
+                    vtransCut = _vtk.vtkTransform()
+                    vtransCut.SetMatrix(vtrans)
+
+                    plane = _vtk.vtkPlane()
+                    plane.SetOrigin(*self.cutterOrigins[ck])
+                    plane.SetNormal(*self.cutterNormals[ck])
+                    plane.SetTransform(vtransCut)
+
+                    cutFlt = _vtk.vtkCutter()
+                    cutFlt.SetCutFunction(plane)
+                    cutFlt.SetInputData(pd)
+
+                    cutTransFlt = _vtk.vtkTransformPolyDataFilter()
+                    cutTransFlt.SetTransform(vtransCut)
+                    cutTransFlt.SetInputConnection(cutFlt.GetOutputPort())
+                    self.cutterTransforms[cutFlt] = cutTransFlt
+
+                    try:
+                        self.cutters[ck].append(cutFlt)
+                    except KeyError:
+                        self.cutters[ck] = []
+                        self.cutters[ck].append(cutFlt)
+
+                    cutMap = _vtk.vtkPolyDataMapper()
+                    cutMap.ScalarVisibilityOff()
+                    cutMap.SetInputConnection(cutFlt.GetOutputPort())
+
+                    cutActor = _vtk.vtkActor()  # vtk(Actor)
+                    cutActor.SetMapper(cutMap)
+                    cutActor.SetUserMatrix(vtrans)
+                    cutActor.GetProperty().SetLineWidth(2)
+                    cutActor.GetProperty().SetColor(*self.cutterColors[ck])
+                    cutActor.GetProperty().SetRepresentationToSurface()
+                    self.actors[k + "_" + str(i) + "_" + ck] = cutActor
+                    self.instanceCutActors[actor].append(cutActor)
+                    self.ren.AddActor(cutActor)
+
+        self.bBuiltPipelines = True
+
+    def buildPipelinesLOD(
+        self,
+        reductions=(0.75, 0.95),
+        pixelSizes=(200, 50),
+        minimumTriangles=1000,
+        minimumPixelSize=2,
+    ):
+        """
+        Build instanced pipelines (see buildPipelinesInstanced) with levels of detail for
+        very large geometries. Meshes with more than minimumTriangles triangles get
+        decimated variants with the fractions of triangles in reductions removed. Before
+        each render the size of the bounding box of each placement on the screen (in
+        pixels) selects the level: full resolution above pixelSizes[0], the first
+        decimated variant above pixelSizes[1] and so on. Placements outside the view or
+        smaller than minimumPixelSize are not drawn.
+
+        :param reductions: fraction of triangles removed for each decimated level
+        :type reductions: list of float
+        :param pixelSizes: screen size below which the next level is used, decreasing
+        :type pixelSizes: list of float
+        :param minimumTriangles: meshes with fewer triangles are not decimated
+        :type minimumTriangles: int
+        :param minimumPixelSize: placements smaller than this on the screen are culled
+        :type minimumPixelSize: float
+        """
+        self.buildPipelinesInstanced()
+
+        # decimated variants of the meshes with many triangles
+        levelPolydata = {}
+        for k, pd in self.polydata.items():
+            levelPolydata[k] = [pd]
+            if pd.GetNumberOfPolys() <= minimumTriangles:
+                continue
+            for reduction in reductions:
+                decFlt = _vtk.vtkQuadricDecimation()  # (dec)imation (F)i(lt)er
+                decFlt.SetInputData(pd)
+                decFlt.SetTargetReduction(reduction)
+                decFlt.Update()
+                levelPolydata[k].append(decFlt.GetOutput())
+
+        actors = list(self.instanceActors)
+        levelMappers = {}  # full resolution mapper : mappers for each level
+        mappers = []
+        centres = _np.empty((len(actors), 3))
+        radii = _np.empty(len(actors))
+
+        for i, actor in enumerate(actors):
+            k, ip = self.instanceActors[actor]
+            map = actor.GetMapper()
+            if map not in levelMappers:
+                levelMappers[map] = [map]
+                for pd in levelPolydata[k][1:]:
+                    levelMap = _vtk.vtkPolyDataMapper()
+                    levelMap.ShallowCopy(map)
+                    levelMap.SetInputData(pd)
+                    levelMappers[map].append(levelMap)
+            mappers.append(levelMappers[map])
+
+            # bounding sphere of the placed local bounding box
+            b = self.polydata[k].GetBounds()
+            corners = _np.array(
+                [[x, y, z] for x in b[0:2] for y in b[2:4] for z in b[4:6]], dtype=float
+            )
+            corners = corners @ _np.asarray(ip["transformation"], dtype=float).T
+            corners += _np.asarray(ip["translation"], dtype=float)
+            lower, upper = corners.min(axis=0), corners.max(axis=0)
+            centres[i] = (lower + upper) / 2
+            radii[i] = _np.linalg.norm(upper - lower) / 2
+
+        self.lod = {
+            "actors": actors,
+            "mappers": mappers,
+            "nLevels": _np.array([len(m) for m in mappers], dtype=int),
+            "centres": centres,
+            "radii": radii,
+            "pixelSizes": _np.asarray(pixelSizes, dtype=float),
+            "minimumPixelSize": minimumPixelSize,
+            "levels": _np.zeros(len(actors), dtype=int),
+            "visible": _np.ones(len(actors), dtype=bool),
+        }
+
+        self.ren.AddObserver("StartEvent", self._updateLOD)
+
+    def _updateLOD(self, obj=None, event=None):
+        """
+        Choose the level of detail of each placement and cull the placements outside the
+        view (see buildPipelinesLOD). Called before each render.
+        """
+        lod = self.lod
+        if lod is None or len(lod["actors"]) == 0:
+            return
+
+        camera = self.ren.GetActiveCamera()
+        height = max(self.ren.GetSize()[1], 1)
+
+        # frustum culling of the bounding spheres, the plane normals point inwards
+        planes = [0.0] * 24
+        camera.GetFrustumPlanes(self.ren.GetTiledAspectRatio(), planes)
+        planes = _np.reshape(planes, (6, 4))
+        distances = lod["centres"] @ planes[:, :3].T + planes[:, 3]
+        visible = (distances > -lod["radii"][:, None]).all(axis=1)
+
+        # size on the screen in pixels
+        if camera.GetParallelProjection():
+            pixels = lod["radii"] / camera.GetParallelScale() * height
+        else:
+            d = _np.linalg.norm(lod["centres"] - _np.array(camera.GetPosition()), axis=1)
+            tanHalfAngle = _np.tan(_np.radians(camera.GetViewAngle()) / 2)
+            pixels = lod["radii"] / (_np.maximum(d, 1e-9) * tanHalfAngle) * height
+        visible &= pixels >= lod["minimumPixelSize"]
+
+        levels = (pixels[:, None] < lod["pixelSizes"][None, :]).sum(axis=1)
+        levels = _np.minimum(levels, lod["nLevels"] - 1)
+
+        for i in _np.flatnonzero(visible != lod["visible"]):
+            actor = lod["actors"][i]
+            actor.SetVisibility(bool(visible[i]))
+            for cutActor in self.instanceCutActors[actor]:
+                cutActor.SetVisibility(bool(visible[i]))
+
+        for i in _np.flatnonzero(levels != lod["levels"]):
+            lod["actors"][i].SetMapper(lod["mappers"][i][levels[i]])
+
+        lod["visible"] = visible
+        lod["levels"] = levels
+
     def buildPipelinesTransformed(self):
         pass
 
@@ -667,6 +904,55 @@ class MouseInteractorNamePhysicalVolume(_vtk.vtkInteractorStyleTrackballCamera):
             self.ren.RemoveActor(self.highLightTextActor)
             self.ren.GetRenderWindow().Render()
 
+    def highLightInstance(self, actor):
+        """
+        Highlight and describe a placement of an instanced pipeline (see
+        VtkViewerNew.buildPipelinesInstanced).
+        """
+        lvName, ip = self.vtkviewer.instanceActors[actor]
+        mtra = ip["transformation"]
+        tra = ip["translation"]
+        tba = _transformation.matrix2tbxyz(mtra)
+        localExtent = self.vtkviewer.polydata[lvName].GetBounds()
+        globalExtent = actor.GetBounds()
+
+        self.highLightActor = _vtk.vtkActor()
+        self.highLightActor.SetMapper(actor.GetMapper())
+        self.highLightActor.SetUserMatrix(actor.GetUserMatrix())
+        self.highLightActor.GetProperty().SetColor(0, 1, 0)
+        self.highLightActor.GetProperty().SetOpacity(0.5)
+        self.ren.AddActor(self.highLightActor)
+
+        if self.highLightTextActor:
+            self.ren.RemoveActor(self.highLightTextActor)
+
+        self.highLightTextActor = _vtk.vtkTextActor()
+        self.highLightTextActor.GetTextProperty().SetFontSize(30)
+        self.highLightTextActor.GetTextProperty().SetColor(0, 0, 0)
+        self.highLightTextActor.SetInput(
+            "lv   : "
+            + lvName
+            + "\n"
+            + "pv   : "
+            + ip["name"]
+            + "\n"
+            + "tbr  :"
+            + str([f"{v:5.2f}" for v in tba]).strip("'")
+            + "\n"
+            + "tra  :"
+            + str([f"{v:5.2f}" for v in tra]).strip("'")
+            + "\n"
+            + "local aabb :"
+            + str([f"{v:5.2f}" for v in localExtent]).strip("'")
+            + "\n"
+            + "global aabb :"
+            + str([f"{v:5.2f}" for v in globalExtent]).strip("'")
+        )
+        self.highLightTextActor.SetDisplayPosition(20, 30)
+        self.ren.AddActor(self.highLightTextActor)
+
+        self.ren.GetRenderWindow().Render()
+
     def rightButtonPressEvent(self, obj, event):
         if self.highLightActor:
             self.ren.RemoveActor(self.highLightActor)
@@ -691,6 +977,10 @@ class MouseInteractorNamePhysicalVolume(_vtk.vtkInteractorStyleTrackballCamera):
         if actor is None:
             return
 
+        if actor in self.vtkviewer.instanceActors:
+            self.highLightInstance(actor)
+            return
+
         map = actor.GetMapper()
         self.inalgo = map.GetInputAlgorithm()
 
@@ -0,0 +1,53 @@
+import pyg4ometry
+import pyg4ometry.geant4 as _g4
+
+
+def _makeGeometry(size=10):
+    reg = _g4.Registry()
+    galactic = _g4.MaterialPredefined("G4_Galactic", reg)
+
+    ws = _g4.solid.Box("ws", 1000, 1000, 1000, reg)
+    wl = _g4.LogicalVolume(ws, galactic, "wl", reg)
+    for i in range(4):
+        bs = _g4.solid.Box("bs" + str(i), 10, 10, size if i == 3 else 10, reg)
+        bl = _g4.LogicalVolume(bs, galactic, "bl" + str(i), reg)
+        _g4.PhysicalVolume([0, 0, 0], [50 * i, 0, 0], bl, "b_pv" + str(i), wl, reg)
+    return wl
+
+
+def Test(printOut=False):
+    # volume, area and bounding box are cached on the mesh until it is remeshed
+    reg = _g4.Registry()
+    galactic = _g4.MaterialPredefined("G4_Galactic", reg)
+    bs = _g4.solid.Box("bs", 10, 20, 30, reg)
+    bl = _g4.LogicalVolume(bs, galactic, "bl", reg)
+    mesh = bl.mesh
+    assert abs(mesh.volume() - 6000) < 1e-6
+    assert abs(mesh.area() - 2200) < 1e-6
+    assert mesh.getBoundingBox() == [[-5, -10, -15], [5, 10, 15]]
+    bs.pX = 20
+    assert abs(mesh.volume() - 6000) < 1e-6
+    mesh.remesh()
+    assert abs(mesh.volume() - 12000) < 1e-6
+    assert mesh.getBoundingBox() == [[-10, -10, -15], [10, 10, 15]]
+
+    # the mesh tests in worker processes give the same result
+    tests = pyg4ometry.compare.Tests()
+    wl1 = _makeGeometry()
+    wl2 = _makeGeometry(size=20)
+    comp1 = pyg4ometry.compare.geometry(wl1, wl2, tests)
+    wl1 = _makeGeometry()
+    wl2 = _makeGeometry(size=20)
+    comp2 = pyg4ometry.compare.geometry(wl1, wl2, tests, nProcesses=2)
+    if printOut:
+        comp1.print()
+        comp2.print()
+    assert len(comp1.test["shapeVolume"]) == 1
+    assert comp1.result == comp2.result
+    assert sorted(comp1.testNames()) == sorted(comp2.testNames())
+    for name in comp1.testNames():
+        assert sorted(str(r) for r in comp1[name]) == sorted(str(r) for r in comp2[name])
+
+
+if __name__ == "__main__":
+    Test()
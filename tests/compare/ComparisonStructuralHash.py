@@ -0,0 +1,64 @@
+import pyg4ometry
+import pyg4ometry.geant4 as _g4
+
+
+def _makeGeometry(shift=0):
+    reg = _g4.Registry()
+    copper = _g4.MaterialPredefined("G4_Cu", reg)
+    galactic = _g4.MaterialPredefined("G4_Galactic", reg)
+
+    ws = _g4.solid.Box("ws", 1000, 1000, 1000, reg)
+    wl = _g4.LogicalVolume(ws, galactic, "wl", reg)
+    cs = _g4.solid.Box("cs", 500, 500, 500, reg)
+    cl = _g4.LogicalVolume(cs, galactic, "cl", reg)
+    bs = _g4.solid.Box("bs", 10, 10, 10, reg)
+    bl = _g4.LogicalVolume(bs, copper, "bl", reg)
+
+    for i in range(10):
+        _g4.PhysicalVolume([0, 0, 0], [20 * i - 100, 0, 0], bl, "b_pv" + str(i), cl, reg)
+    _g4.PhysicalVolume([0, 0, 0], [-250, 0, 0], cl, "c_pv1", wl, reg)
+    _g4.PhysicalVolume([0, 0, 0], [250, 0, shift], cl, "c_pv2", wl, reg)
+    return wl, cl, bl
+
+
+def Test(printOut=False):
+    wl1, cl1, bl1 = _makeGeometry()
+    wl2, cl2, bl2 = _makeGeometry()
+    wl3, cl3, bl3 = _makeGeometry(shift=10)
+
+    # same geometry in different registries
+    hashes = {}
+    h1 = pyg4ometry.compare.structuralHash(wl1, hashes)
+    assert h1 is not None
+    assert h1 == pyg4ometry.compare.structuralHash(wl2, hashes)
+
+    # each object is only hashed once, also the daughter lv that is placed 10 times
+    nHashed = len(hashes)
+    pyg4ometry.compare.structuralHash(wl1, hashes)
+    assert len(hashes) == nHashed
+
+    # a different placement changes the hash of the tree but not of unchanged subtrees
+    assert pyg4ometry.compare.structuralHash(wl3) != h1
+    assert pyg4ometry.compare.structuralHash(cl3) == pyg4ometry.compare.structuralHash(cl1)
+    assert pyg4ometry.compare.structuralHash(bl3) == pyg4ometry.compare.structuralHash(bl1)
+
+    tests = pyg4ometry.compare.Tests()
+    comp1 = pyg4ometry.compare.geometry(wl1, wl2, tests)
+    if printOut:
+        comp1.print()
+    assert len(comp1) == 0
+    assert comp1.result == pyg4ometry.compare.TestResult.Passed
+
+    comp2 = pyg4ometry.compare.geometry(wl1, wl3, tests)
+    if printOut:
+        comp2.print()
+    assert len(comp2.test["position"]) == 1
+
+    # detailed tests are still done when all results are requested
+    comp3 = pyg4ometry.compare.geometry(wl1, wl2, tests, includeAllTestResults=True)
+    assert len(comp3) > 0
+    assert comp3.result == pyg4ometry.compare.TestResult.Passed
+
+
+if __name__ == "__main__":
+    Test()
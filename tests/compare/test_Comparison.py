@@ -1,5 +1,7 @@
 import ComparisonLogicalVolume
 import ComparisonAssemblyVolume
+import ComparisonMeshes
+import ComparisonStructuralHash
 
 
 def test_ComparisonAssemblyVolume():
@@ -8,3 +10,11 @@ def test_ComparisonAssemblyVolume():
 
 def test_ComparisonLogicalVolume():
     ComparisonLogicalVolume.Test()
+
+
+def test_ComparisonStructuralHash():
+    ComparisonStructuralHash.Test()
+
+
+def test_ComparisonMeshes():
+    ComparisonMeshes.Test()
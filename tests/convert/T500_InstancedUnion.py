@@ -0,0 +1,114 @@
+import copy as _copy
+import pathlib as _pl
+import numpy as _np
+
+import pyg4ometry.gdml as _gd
+import pyg4ometry.geant4 as _g4
+import pyg4ometry.convert as _convert
+import pyg4ometry.fluka as _fluka
+
+
+def Test(vis=False, interactive=False, fluka=True, outputPath=None, refFilePath=None):
+    if not outputPath:
+        outputPath = _pl.Path(__file__).parent
+
+    reg = _g4.Registry()
+
+    # defines
+    wx = _gd.Constant("wx", "1000", reg, True)
+    wy = _gd.Constant("wy", "1000", reg, True)
+    wz = _gd.Constant("wz", "1000", reg, True)
+
+    bx = _gd.Constant("bx", "20", reg, True)
+    by = _gd.Constant("by", "20", reg, True)
+    bz = _gd.Constant("bz", "20", reg, True)
+
+    # materials
+    wm = _g4.MaterialPredefined("G4_Galactic")
+    bm = _g4.MaterialPredefined("G4_Au")
+
+    # solids
+    ws = _g4.solid.Box("ws", wx, wy, wz, reg, "mm")
+    bs = _g4.solid.Box("bs", bx, by, bz, reg, "mm")
+    us = _g4.solid.Union("us", bs, bs, [[0.1, 0.2, 0.3], [0, 0, 15]], reg)
+    vs = _g4.solid.Union("vs", bs, bs, [[0.1, 0.2, 0.3], [0, 0, 15]], reg)
+
+    # structure
+    wl = _g4.LogicalVolume(ws, wm, "wl", reg)
+    ul = _g4.LogicalVolume(us, bm, "ul", reg)
+    vl = _g4.LogicalVolume(vs, bm, "vl", reg)
+
+    nPlacements = 0
+    for i in range(3):
+        for j in range(3):
+            for k in range(3):
+                _g4.PhysicalVolume(
+                    [0.3 * i, 0.2 * j, 0.1 * k],
+                    [100 * (i - 1), 100 * (j - 1), 100 * (k - 1)],
+                    ul,
+                    "u_pv_" + str(i) + "_" + str(j) + "_" + str(k),
+                    wl,
+                    reg,
+                )
+                nPlacements += 1
+
+    # same shape as us under another name
+    _g4.PhysicalVolume([0, 0, 0], [0, 0, 400], vl, "v_pv", wl, reg)
+    nPlacements += 1
+
+    # set world volume
+    reg.setWorld(wl.name)
+
+    if fluka:
+        freg = _convert.geant4Reg2FlukaReg(reg)
+
+        # each solid is converted once, also when another solid has the same shape
+        assert len(freg.solidPrototypes) == 2
+
+        # and gives the same bodies as converting it at every placement
+        fregDirect = _fluka.FlukaRegistry()
+        fregDirect.solidPrototypes = None
+        fregDirect = _convert.geant4MaterialDict2Fluka(reg.materialDict, fregDirect)
+        fregDirect = _convert.geant4Logical2Fluka(wl, fregDirect)
+
+        assert list(freg.bodyDict.keys()) == list(fregDirect.bodyDict.keys())
+        for name in freg.bodyDict.keys():
+            body = freg.bodyDict[name]
+            direct = fregDirect.bodyDict[name]
+            assert body.hash() == direct.hash()
+            assert body.comment == direct.comment
+            assert _np.allclose(body.transform.to4DMatrix(), direct.transform.to4DMatrix())
+
+        for name, region in freg.regionDict.items():
+            assert region.flukaFreeString() == fregDirect.regionDict[name].flukaFreeString()
+
+        # instances do not share their geometry with the prototypes
+        prototypeArrays = {
+            id(value)
+            for prototype in freg.solidPrototypes.values()
+            if prototype is not None
+            for body in prototype[0].bodies()
+            for value in vars(body).values()
+            if isinstance(value, _np.ndarray)
+        }
+        for body in freg.bodyDict.values():
+            for value in vars(body).values():
+                assert not isinstance(value, _np.ndarray) or id(value) not in prototypeArrays
+
+        # identical bodies are only added once
+        body = next(iter(freg.bodyDict.values()))
+        duplicate = _copy.copy(body)
+        duplicate.name = "BDUPLI"
+        assert freg.getDegenerateBody(duplicate) is body
+        assert "BDUPLI" not in freg.bodyDict
+
+        outputFile = outputPath / "T500_InstancedUnion.inp"
+        w = _fluka.Writer()
+        w.addDetector(freg)
+        w.write(outputFile)
+
+    return {"nPlacements": nPlacements}
+
+
+if __name__ == "__main__":
+    Test()
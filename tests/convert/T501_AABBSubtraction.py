@@ -0,0 +1,96 @@
+import pathlib as _pl
+import numpy as _np
+
+import pyg4ometry.gdml as _gd
+import pyg4ometry.geant4 as _g4
+import pyg4ometry.convert as _convert
+import pyg4ometry.fluka as _fluka
+
+
+def Test(vis=False, interactive=False, fluka=True, outputPath=None, refFilePath=None):
+    if not outputPath:
+        outputPath = _pl.Path(__file__).parent
+
+    reg = _g4.Registry()
+
+    # defines
+    wx = _gd.Constant("wx", "2000", reg, True)
+    wy = _gd.Constant("wy", "2000", reg, True)
+    wz = _gd.Constant("wz", "2000", reg, True)
+
+    mx = _gd.Constant("mx", "100", reg, True)
+    my = _gd.Constant("my", "100", reg, True)
+    mz = _gd.Constant("mz", "100", reg, True)
+
+    dx = _gd.Constant("dx", "20", reg, True)
+    dy = _gd.Constant("dy", "20", reg, True)
+    dz = _gd.Constant("dz", "20", reg, True)
+
+    trmax = _gd.Constant("trmax", "40", reg, True)
+    tz = _gd.Constant("tz", "20", reg, True)
+    tdphi = _gd.Constant("tdphi", "2*pi", reg, True)
+
+    # materials
+    wm = _g4.MaterialPredefined("G4_Galactic")
+    mm = _g4.MaterialPredefined("G4_AIR")
+    dm = _g4.MaterialPredefined("G4_Au")
+
+    # solids, the mother is two boxes apart (i.e. two zones)
+    ws = _g4.solid.Box("ws", wx, wy, wz, reg, "mm")
+    bs = _g4.solid.Box("bs", mx, my, mz, reg, "mm")
+    ms = _g4.solid.Union("ms", bs, bs, [[0, 0, 0], [500, 0, 0]], reg)
+    ds = _g4.solid.Box("ds", dx, dy, dz, reg, "mm")
+
+    # a second mother of two touching boxes with a coarse cylinder close to the
+    # boundary between them. The cylinder reaches past the boundary but its mesh,
+    # rotated so no vertex is on the x axis, stops 3.4 mm before it
+    ns = _g4.solid.Union("ns", bs, bs, [[0, 0, 0], [100, 0, 0]], reg)
+    ts = _g4.solid.Tubs("ts", 0, trmax, tz, 0, tdphi, reg, "mm", "rad", nslice=6)
+
+    # structure, one daughter in each box of the mother
+    wl = _g4.LogicalVolume(ws, wm, "wl", reg)
+    ml = _g4.LogicalVolume(ms, mm, "ml", reg)
+    dl = _g4.LogicalVolume(ds, dm, "dl", reg)
+    nl = _g4.LogicalVolume(ns, mm, "nl", reg)
+    tl = _g4.LogicalVolume(ts, dm, "tl", reg)
+
+    _g4.PhysicalVolume([0, 0, 0], [0, 0, 0], ml, "m_pv", wl, reg)
+    _g4.PhysicalVolume([0, 0, 0], [0, 0, 0], dl, "d_pv1", ml, reg)
+    _g4.PhysicalVolume([0, 0, 0], [500, 0, 0], dl, "d_pv2", ml, reg)
+
+    _g4.PhysicalVolume([0, 0, 0], [0, 500, 0], nl, "n_pv", wl, reg)
+    _g4.PhysicalVolume([0, 0, _np.pi / 6], [12, 0, 0], tl, "t_pv", nl, reg)
+
+    reg.setWorld(wl.name)
+
+    if fluka:
+        nSubtractions = {}
+        nSubtractionsCurved = {}
+        for aabbSubtraction in [False, True]:
+            freg = _convert.geant4Reg2FlukaReg(reg, aabbSubtraction=aabbSubtraction)
+            mother = freg.regionDict[freg.PhysVolToRegionMap["m_pv"]]
+
+            assert len(mother.zones) == 2
+            nSubtractions[aabbSubtraction] = [len(z.subtractions) for z in mother.zones]
+
+            curved = freg.regionDict[freg.PhysVolToRegionMap["n_pv"]]
+            assert len(curved.zones) == 2
+            nSubtractionsCurved[aabbSubtraction] = [len(z.subtractions) for z in curved.zones]
+
+            termCounts = _convert.regionTermCounts(freg)
+            assert set(termCounts) == set(freg.regionDict)
+
+        # each daughter is only subtracted from the zone it is in
+        assert [n - 2 for n in nSubtractions[False]] == [n - 1 for n in nSubtractions[True]]
+
+        # the cylinder is subtracted from both boxes, the one its mesh does not reach too
+        assert nSubtractionsCurved[True] == nSubtractionsCurved[False]
+
+        outputFile = outputPath / "T501_AABBSubtraction.inp"
+        w = _fluka.Writer()
+        w.addDetector(freg)
+        w.write(outputFile)
+
+
+if __name__ == "__main__":
+    Test()
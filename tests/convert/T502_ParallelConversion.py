@@ -0,0 +1,68 @@
+import pathlib as _pl
+
+import pyg4ometry.gdml as _gd
+import pyg4ometry.geant4 as _g4
+import pyg4ometry.convert as _convert
+import pyg4ometry.fluka as _fluka
+
+
+def Test(vis=False, interactive=False, fluka=True, outputPath=None, refFilePath=None):
+    if not outputPath:
+        outputPath = _pl.Path(__file__).parent
+
+    reg = _g4.Registry()
+
+    # defines
+    wx = _gd.Constant("wx", "2000", reg, True)
+    wy = _gd.Constant("wy", "2000", reg, True)
+    wz = _gd.Constant("wz", "2000", reg, True)
+
+    # materials
+    wm = _g4.MaterialPredefined("G4_Galactic")
+    bm = _g4.MaterialPredefined("G4_Au")
+
+    # solids
+    ws = _g4.solid.Box("ws", wx, wy, wz, reg, "mm")
+    bs = _g4.solid.Box("bs", 40, 40, 40, reg, "mm")
+    ts = _g4.solid.Tubs("ts", 10, 20, 40, 0, "2*pi", reg, "mm", "rad")
+    ss = _g4.solid.Sphere("ss", 0, 20, 0, "2*pi", 0, "pi", reg, "mm", "rad")
+    us = _g4.solid.Union("us", bs, ts, [[0, 0.5, 0], [0, 0, 30]], reg)
+
+    # structure
+    wl = _g4.LogicalVolume(ws, wm, "wl", reg)
+    lvs = [_g4.LogicalVolume(s, bm, s.name + "_lv", reg) for s in [bs, ts, ss, us]]
+
+    for i in range(5):
+        for j, lv in enumerate(lvs):
+            _g4.PhysicalVolume(
+                [0.1 * i, 0.2 * j, 0],
+                [150 * (i - 2), 150 * (j - 2), 0],
+                lv,
+                lv.name + "_pv" + str(i),
+                wl,
+                reg,
+            )
+
+    reg.setWorld(wl.name)
+
+    if fluka:
+        freg = _convert.geant4Reg2FlukaReg(reg)
+        fregParallel = _convert.geant4Reg2FlukaReg(reg, nProcesses=2)
+
+        # the same names and bodies whether converted in parallel or not
+        assert list(fregParallel.bodyDict.keys()) == list(freg.bodyDict.keys())
+        for name in freg.bodyDict.keys():
+            assert fregParallel.bodyDict[name].hash() == freg.bodyDict[name].hash()
+
+        assert list(fregParallel.regionDict) == list(freg.regionDict)
+        for name, region in freg.regionDict.items():
+            assert fregParallel.regionDict[name].flukaFreeString() == region.flukaFreeString()
+
+        outputFile = outputPath / "T502_ParallelConversion.inp"
+        w = _fluka.Writer()
+        w.addDetector(fregParallel)
+        w.write(outputFile)
+
+
+if __name__ == "__main__":
+    Test()
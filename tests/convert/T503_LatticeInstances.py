@@ -0,0 +1,114 @@
+import pathlib as _pl
+
+import pyg4ometry.gdml as _gd
+import pyg4ometry.geant4 as _g4
+import pyg4ometry.convert as _convert
+import pyg4ometry.fluka as _fluka
+
+
+def _makeRegistry(nContainers, nDaughters):
+    reg = _g4.Registry()
+
+    # defines
+    wx = _gd.Constant("wx", "5000", reg, True)
+    wy = _gd.Constant("wy", "5000", reg, True)
+    wz = _gd.Constant("wz", "5000", reg, True)
+
+    cx = _gd.Constant("cx", "100", reg, True)
+    cy = _gd.Constant("cy", "100", reg, True)
+    cz = _gd.Constant("cz", "100", reg, True)
+
+    dx = _gd.Constant("dx", "5", reg, True)
+    dy = _gd.Constant("dy", "5", reg, True)
+    dz = _gd.Constant("dz", "5", reg, True)
+
+    # materials
+    wm = _g4.MaterialPredefined("G4_Galactic")
+    cm = _g4.MaterialPredefined("G4_AIR")
+    dm = _g4.MaterialPredefined("G4_Au")
+
+    # solids
+    ws = _g4.solid.Box("ws", wx, wy, wz, reg, "mm")
+    cs = _g4.solid.Box("cs", cx, cy, cz, reg, "mm")
+    ds = _g4.solid.Box("ds", dx, dy, dz, reg, "mm")
+
+    # structure
+    wl = _g4.LogicalVolume(ws, wm, "wl", reg)
+    cl = _g4.LogicalVolume(cs, cm, "cl", reg)
+    dl = _g4.LogicalVolume(ds, dm, "dl", reg)
+
+    for i in range(nDaughters):
+        _g4.PhysicalVolume([0, 0, 0], [8 * (i - nDaughters // 2), 0, 0], dl, f"d_pv_{i}", cl, reg)
+
+    for i in range(nContainers):
+        _g4.PhysicalVolume([0, 0, 0.3 * i], [200 * i, 0, 0], cl, f"c_pv_{i}", wl, reg)
+
+    # set world volume
+    reg.setWorld(wl.name)
+
+    return reg
+
+
+def _geometryCards(fileName):
+    """
+    Body cards and LATTICE cards in the geometry of a FLUKA input file.
+    """
+    with open(fileName) as f:
+        lines = f.read().splitlines()
+
+    start = lines.index("    0    0") + 1
+    bodiesEnd = lines.index("END", start)
+    regionsEnd = lines.index("END", bodiesEnd + 1)
+    geometryEnd = lines.index("GEOEND", regionsEnd)
+
+    # comments, transform directives and continuation lines start with *, $ and a space
+    bodies = [line for line in lines[start:bodiesEnd] if line and line[0] not in "*$ "]
+    lattices = [line for line in lines[regionsEnd:geometryEnd] if line.startswith("LATTICE")]
+    return bodies, lattices
+
+
+def Test(vis=False, interactive=False, fluka=True, outputPath=None, refFilePath=None):
+    if not outputPath:
+        outputPath = _pl.Path(__file__).parent
+
+    nDaughters = 10
+
+    if fluka:
+        nBodies = {}
+        for lattice in [True, False]:
+            for nContainers in [2, 6]:
+                reg = _makeRegistry(nContainers, nDaughters)
+                freg = _convert.geant4Reg2FlukaReg(reg, lattice=lattice)
+
+                outputFile = outputPath / f"T503_LatticeInstances_{lattice}_{nContainers}.inp"
+                w = _fluka.Writer()
+                w.addDetector(freg)
+                w.write(outputFile)
+
+                bodies, lattices = _geometryCards(outputFile)
+                nBodies[lattice, nContainers] = len(bodies)
+
+                if lattice:
+                    # all but the first placement are LATTICE cells of it
+                    assert len(freg.latticeDict) == nContainers - 1
+                    assert len(lattices) == nContainers - 1
+                    nCellBodies = {
+                        len(cell.cellRegion.bodies()) for cell in freg.latticeDict.values()
+                    }
+                    assert len(nCellBodies) == 1
+                    nCellBodies = nCellBodies.pop()
+                else:
+                    assert len(freg.latticeDict) == 0
+                    assert len(lattices) == 0
+
+        # with LATTICE cells the daughters are written once, only the bodies of the
+        # cells are added for more placements
+        assert nBodies[True, 6] - nBodies[True, 2] == 4 * nCellBodies
+        assert nBodies[False, 6] - nBodies[False, 2] > 4 * nCellBodies
+        assert nBodies[True, 2] < nBodies[False, 2]
+
+    return {"nBodies": nBodies}
+
+
+if __name__ == "__main__":
+    Test()
@@ -53,6 +53,11 @@ from . import T400_extruder
 from . import T401_flukaRun
 from . import T402_flukaLoad
 
+from . import T500_InstancedUnion
+from . import T501_AABBSubtraction
+from . import T502_ParallelConversion
+from . import T503_LatticeInstances
+
 
 def test_Geant42FlukaConversion_T001_Box(tmptestdir, testdata):
     T001_geant4Box2Fluka.Test(
@@ -867,3 +872,19 @@ def test_PythonFluka_T401(tmptestdir, testdata):
     print(tmptestdir)
     T401_flukaRun.Test(False, False, True, outputPath=tmptestdir)
     T402_flukaLoad.Test(testdata)
+
+
+def test_Geant42FlukaConversion_T500_InstancedUnion(tmptestdir):
+    T500_InstancedUnion.Test(vis=False, interactive=False, fluka=True, outputPath=tmptestdir)
+
+
+def test_Geant42FlukaConversion_T501_AABBSubtraction(tmptestdir):
+    T501_AABBSubtraction.Test(vis=False, interactive=False, fluka=True, outputPath=tmptestdir)
+
+
+def test_Geant42FlukaConversion_T502_ParallelConversion(tmptestdir):
+    T502_ParallelConversion.Test(vis=False, interactive=False, fluka=True, outputPath=tmptestdir)
+
+
+def test_Geant42FlukaConversion_T503_LatticeInstances(tmptestdir):
+    T503_LatticeInstances.Test(vis=False, interactive=False, fluka=True, outputPath=tmptestdir)
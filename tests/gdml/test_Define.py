@@ -160,6 +160,50 @@ def test_GdmlDefine_FuncAbs():
     assert xc.eval() == 1.0
 
 
+def test_GdmlDefine_CompiledExpression():
+    r = pyg4ometry.geant4.Registry()
+    pyg4ometry.gdml.Constant("a", "2", r)
+    pyg4ometry.gdml.Constant("b", "a*3+1", r)
+    parser = r.getExpressionParser()
+
+    for e in ["-a^2/b", "(a+b)*2-b/a", "sin(pi/a)+max(a,b)", "-(-a)*mm", "pow(b,2)-abs(-a)"]:
+        compiled = parser.compile(e)
+        assert compiled(r.defineDict) == parser.evaluate(parser.parse(e), r.defineDict)
+        # parsed once
+        assert parser.compile(e) is compiled
+
+    assert parser.compile("a*b+a").variables == ["a", "b", "a"]
+
+    # compiled expressions pick up changed defines
+    c = pyg4ometry.gdml.Constant("c", "b*2", r)
+    assert c.eval() == 14
+    r.defineDict["a"].setExpression("3")
+    assert c.eval() == 20
+
+
+def test_GdmlDefine_DefineGraph():
+    r = pyg4ometry.geant4.Registry()
+    a = pyg4ometry.gdml.Constant("a", "10", r)
+    b = pyg4ometry.gdml.Constant("b", "2*a", r)
+    pyg4ometry.gdml.Constant("c", "5", r)
+    p = pyg4ometry.gdml.Position("p", "b", "0", "c", "mm", r)
+    s1 = pyg4ometry.geant4.solid.Box("s1", b, "a", 10, r)
+    s2 = pyg4ometry.geant4.solid.Box("s2", "c", "c", "c", r)
+    u = pyg4ometry.geant4.solid.Union("u", s1, s2, [[0, 0, 0], p], r)
+
+    assert b.eval() == 20
+    defines, solids = r.getDefineGraph().dependents("a")
+    assert sorted(defines) == ["b", "p"]
+    assert sorted(solids) == ["s1", "u"]
+
+    # memoised values are updated downstream of the changed define only
+    defines, solids, lvs = r.updateDefine("a", "20")
+    assert sorted(solids) == ["s1", "u"]
+    assert b.eval() == 40
+    assert p.eval() == [40, 0, 5]
+    assert "s2" not in r.editedSolids
+
+
 # #############################
 # Constants
 # #############################
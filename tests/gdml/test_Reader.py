@@ -944,3 +944,58 @@ def test_GdmlLoad_BDSIM_colour_force_visible(testdata):
     reader = pyg4ometry.gdml.Reader(filepath, makeAllVisible=True)
     wlv = reader.getRegistry().getWorldVolume()
     assert wlv.daughterVolumes[0].logicalVolume.visOptions.visible
+
+
+def test_GdmlLoad_StreamingSameAsMinidom(testdata):
+    for f in ["gdml/G01/solids.gdml", "gdml/303_matrix.gdml", "gdml/202_auxiliary.gdml"]:
+        r1 = pyg4ometry.gdml.Reader(testdata[f], streaming=True).getRegistry()
+        r2 = pyg4ometry.gdml.Reader(testdata[f], streaming=False).getRegistry()
+
+        assert list(r1.defineDict) == list(r2.defineDict)
+        assert list(r1.materialDict) == list(r2.materialDict)
+        assert list(r1.solidDict) == list(r2.solidDict)
+        assert list(r1.logicalVolumeDict) == list(r2.logicalVolumeDict)
+        assert list(r1.physicalVolumeDict) == list(r2.physicalVolumeDict)
+        assert r1.getWorldVolume().name == r2.getWorldVolume().name
+        assert len(r1.userInfo) == len(r2.userInfo)
+
+        for name, d in r1.defineDict.items():
+            assert str(d) == str(r2.defineDict[name])
+        for name, s in r1.solidDict.items():
+            assert str(s) == str(r2.solidDict[name])
+
+
+def test_GdmlLoad_StreamingEntity(testdata, tmp_path):
+    import shutil
+
+    shutil.copy(testdata["gdml/203_materials.xml"], tmp_path / "203_materials.xml")
+    shutil.copy(testdata["gdml/203_entity.gdml"], tmp_path / "203_entity.gdml")
+
+    r = pyg4ometry.gdml.Reader(str(tmp_path / "203_entity.gdml"), streaming=True)
+    assert r.getRegistry().getWorldVolume() is not None
+
+
+def test_GdmlWrite_SameAsMinidom(testdata, tmp_path):
+    from xml.dom import getDOMImplementation
+
+    reg = pyg4ometry.gdml.Reader(testdata["gdml/G01/solids.gdml"]).getRegistry()
+    writer = pyg4ometry.gdml.Writer()
+    writer.addDetector(reg)
+    writer.write(tmp_path / "out.gdml")
+
+    # rebuild the same document with minidom
+    doc = getDOMImplementation().createDocument(None, "gdml", None)
+
+    def copy(node, target):
+        for name, value in node.attributes.items():
+            target.setAttribute(name, value)
+        for child in node.childNodes:
+            if hasattr(child, "tagName"):
+                copy(child, target.appendChild(doc.createElement(child.tagName)))
+            else:
+                target.appendChild(doc.createTextNode(child.data))
+
+    copy(writer.doc.documentElement, doc.documentElement)
+
+    with open(tmp_path / "out.gdml") as f:
+        assert f.read() == doc.toprettyxml()
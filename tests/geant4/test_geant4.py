@@ -203,6 +203,70 @@ def test_Python_FreeCadImportFail():
 # #############################
 # Mesh
 # #############################
+def test_Python_AABBIndexPairs():
+    from pyg4ometry.geant4.AABBIndex import AABBIndex
+
+    extents = [
+        [[0, 0, 0], [1, 1, 1]],
+        [[0.5, 0.5, 0.5], [2, 2, 2]],
+        [[1, 0, 0], [2, 1, 1]],  # touching box 0
+        [[10, 10, 10], [11, 11, 11]],
+    ]
+    index = AABBIndex(extents, 1e-9)
+    assert index.pairs() == [(0, 1), (0, 2), (1, 2)]
+    assert index.query([9, 9, 9], [10.5, 10.5, 10.5]) == [3]
+    assert list(index.containedIn([-1, -1, -1], [3, 3, 3])) == [True, True, True, False]
+
+
+def test_Python_AABBIndexOverlapCheck():
+    import pyg4ometry
+
+    reg = pyg4ometry.geant4.Registry()
+    ws = pyg4ometry.geant4.solid.Box("ws", 100, 100, 100, reg, "mm")
+    bs = pyg4ometry.geant4.solid.Box("bs", 10, 10, 10, reg, "mm")
+    wl = pyg4ometry.geant4.LogicalVolume(ws, "G4_Galactic", "wl", reg)
+    bl = pyg4ometry.geant4.LogicalVolume(bs, "G4_Fe", "bl", reg)
+    pyg4ometry.geant4.PhysicalVolume([0, 0, 0], [0, 0, 0], bl, "b_pv1", wl, reg)
+    pyg4ometry.geant4.PhysicalVolume([0, 0, 0], [5, 0, 0], bl, "b_pv2", wl, reg)
+    pyg4ometry.geant4.PhysicalVolume([0, 0, 0], [30, 0, 0], bl, "b_pv3", wl, reg)
+    pyg4ometry.geant4.PhysicalVolume([0, 0, 0], [48, 0, 0], bl, "b_pv4", wl, reg)
+
+    wl.checkOverlaps(nOverlapsDetected=[0])
+    overlapTypes = [m[1] for m in wl.mesh.overlapmeshes]
+    assert overlapTypes.count(pyg4ometry.visualisation.OverlapType.overlap) == 1
+    assert overlapTypes.count(pyg4ometry.visualisation.OverlapType.protrusion) == 1
+
+
+def test_Python_CheckOverlapsParallel():
+    import pyg4ometry
+
+    def makeGeometry():
+        reg = pyg4ometry.geant4.Registry()
+        ws = pyg4ometry.geant4.solid.Box("ws", 100, 100, 100, reg, "mm")
+        rs = pyg4ometry.geant4.solid.Box("rs", 40, 40, 40, reg, "mm")
+        bs = pyg4ometry.geant4.solid.Box("bs", 10, 10, 10, reg, "mm")
+        wl = pyg4ometry.geant4.LogicalVolume(ws, "G4_Galactic", "wl", reg)
+        rl = pyg4ometry.geant4.LogicalVolume(rs, "G4_Galactic", "rl", reg)
+        bl = pyg4ometry.geant4.LogicalVolume(bs, "G4_Fe", "bl", reg)
+        pyg4ometry.geant4.PhysicalVolume([0, 0, 0], [0, 0, 0], bl, "b_pv1", rl, reg)
+        pyg4ometry.geant4.PhysicalVolume([0, 0, 0], [5, 0, 0], bl, "b_pv2", rl, reg)
+        pyg4ometry.geant4.PhysicalVolume([0, 0, 0], [18, 0, 0], bl, "b_pv3", rl, reg)
+        pyg4ometry.geant4.PhysicalVolume([0, 0, 0], [-25, 0, 0], rl, "r_pv1", wl, reg)
+        pyg4ometry.geant4.PhysicalVolume([0, 0, 0], [10, 0, 0], rl, "r_pv2", wl, reg)
+        return wl, rl
+
+    wl, rl = makeGeometry()
+    nSerial = [0]
+    wl.checkOverlaps(recursive=True, nOverlapsDetected=nSerial)
+
+    wlp, rlp = makeGeometry()
+    nParallel = [0]
+    wlp.checkOverlaps(recursive=True, nOverlapsDetected=nParallel, nProcesses=2)
+
+    assert nSerial[0] == nParallel[0] == 3
+    assert [m[1] for m in wl.mesh.overlapmeshes] == [m[1] for m in wlp.mesh.overlapmeshes]
+    assert [m[1] for m in rl.mesh.overlapmeshes] == [m[1] for m in rlp.mesh.overlapmeshes]
+    assert rlp.overlapChecked
 
 
 # #############################
@@ -228,6 +292,265 @@ def test_Python_Remesh():
     l1.mesh.remesh()
 
 
+def test_Python_MeshCache():
+    import pyg4ometry
+    from pyg4ometry.geant4.solid.MeshCache import meshCache
+
+    def xmax(m):
+        return max(v[0] for v in m.toVerticesAndPolygons()[0])
+
+    enabled = pyg4ometry.config.meshCache
+    pyg4ometry.config.meshCache = True
+
+    try:
+        meshCache.clear()
+
+        reg = pyg4ometry.geant4.Registry()
+        s1 = pyg4ometry.geant4.solid.Box("s1", 10, 10, 10, reg, "mm")
+        s2 = pyg4ometry.geant4.solid.Box("s2", 10, 10, 10, reg, "mm")
+        s3 = pyg4ometry.geant4.solid.Box("s3", 1, 1, 1, reg, "cm")
+        assert s1.meshCacheKey() == s2.meshCacheKey()
+        assert s1.meshCacheKey() != s3.meshCacheKey()
+
+        m1 = s1.mesh()
+        m2 = s2.mesh()
+        assert meshCache.hits == 1
+        assert m1 is not m2
+
+        # meshes returned from the cache are independent copies
+        m2.translate([100, 0, 0])
+        assert xmax(s2.mesh()) == xmax(m1)
+
+        u = pyg4ometry.geant4.solid.Union("u", s1, s2, [[0, 0, 0], [5, 0, 0]], reg)
+        uKey = u.meshCacheKey()
+        u.mesh()
+
+        # editing a solid changes its key and those of the solids built from it
+        s1.pX = 20
+        assert s1.meshCacheKey() != s2.meshCacheKey()
+        assert u.meshCacheKey() != uKey
+        assert xmax(s1.mesh()) > xmax(s2.mesh())
+    finally:
+        pyg4ometry.config.meshCache = enabled
+        meshCache.clear()
+
+
+def test_Python_MeshCacheDir(tmp_path):
+    import pyg4ometry
+    from pyg4ometry.geant4.solid.MeshCache import meshCache
+
+    enabled = pyg4ometry.config.meshCache
+    meshCacheDir = pyg4ometry.config.meshCacheDir
+    pyg4ometry.config.meshCache = True
+    pyg4ometry.config.meshCacheDir = str(tmp_path)
+
+    try:
+        meshCache.clear()
+        reg = pyg4ometry.geant4.Registry()
+        s1 = pyg4ometry.geant4.solid.Tubs("s1", 0, 10, 20, 0, "2*pi", reg, "mm", "rad")
+        m1 = s1.mesh()
+        assert meshCache.misses == 1
+        assert len(list(tmp_path.rglob("*.npy"))) == 3
+
+        # new session: memory cache empty but mesh read back from disk
+        meshCache.clear()
+        m2 = s1.mesh()
+        assert meshCache.misses == 0
+        assert meshCache.diskHits == 1
+        assert m2.polygonCount() == m1.polygonCount()
+        assert m2.vertexCount() == m1.vertexCount()
+    finally:
+        pyg4ometry.config.meshCache = enabled
+        pyg4ometry.config.meshCacheDir = meshCacheDir
+        meshCache.clear()
+
+
+def test_Python_MeshingPass():
+    import pyg4ometry
+    from pyg4ometry.geant4.solid.MeshCache import meshCache
+
+    enabled = pyg4ometry.config.meshCache
+    pyg4ometry.config.meshCache = False
+
+    try:
+        meshCache.clear()
+        reg = pyg4ometry.geant4.Registry()
+        b = pyg4ometry.geant4.solid.Box("b", 10, 10, 10, reg)
+        u1 = pyg4ometry.geant4.solid.Union("u1", b, b, [[0, 0, 0], [5, 0, 0]], reg)
+        u2 = pyg4ometry.geant4.solid.Union("u2", b, b, [[0, 0, 0], [5, 0, 0]], reg)
+
+        # the shared subtree (b) and the identical union are only meshed once
+        u = pyg4ometry.geant4.solid.Union("u", u1, u2, [[0, 0, 0], [0, 5, 0]], reg)
+        with meshCache.meshingPass():
+            u.mesh()
+            assert meshCache.hits == 2
+            assert not pyg4ometry.config.meshCache
+            assert len(meshCache) == 3
+
+        # entries made in the pass are dropped when caching is disabled
+        assert len(meshCache) == 0
+        stats = {s["name"]: s for s in meshCache.statistics()}
+        assert stats["b"]["calls"] == 2
+        assert stats["b"]["hits"] == 1
+        assert stats["u"]["exclusiveTime"] <= stats["u"]["time"]
+    finally:
+        pyg4ometry.config.meshCache = enabled
+        meshCache.clear()
+
+
+def test_Python_MeshKeyPass():
+    import pyg4ometry
+    from pyg4ometry.geant4.solid.MeshCache import meshCache
+    from pyg4ometry.geant4.solid.SolidBase import SolidBase
+
+    meshCacheKey = SolidBase.meshCacheKey
+    calls = []
+
+    def countedMeshCacheKey(solid):
+        calls.append(solid.name)
+        return meshCacheKey(solid)
+
+    SolidBase.meshCacheKey = countedMeshCacheKey
+    try:
+        meshCache.clear()
+        reg = pyg4ometry.geant4.Registry()
+        s = pyg4ometry.geant4.solid.Box("b", 10, 10, 10, reg)
+        for i in range(5):
+            s = pyg4ometry.geant4.solid.Union(f"u{i}", s, s, [[0, 0, 0], [i, 0, 0]], reg)
+
+        # the key of each solid in the chain is only computed once per mesh call
+        s.mesh()
+        assert sorted(calls) == sorted(set(calls))
+        assert len(calls) == 6
+    finally:
+        SolidBase.meshCacheKey = meshCacheKey
+        meshCache.clear()
+
+
+def test_Python_RevolutionMesh():
+    import pyg4ometry
+
+    reg = pyg4ometry.geant4.Registry()
+    solids = [
+        (pyg4ometry.geant4.solid.Tubs("t1", 0, 10, 20, 0, 2 * _np.pi, reg, nslice=64), 130, None),
+        (pyg4ometry.geant4.solid.Tubs("t2", 5, 10, 20, 0, _np.pi, reg, nslice=64), 4 * 65, None),
+        (
+            pyg4ometry.geant4.solid.Cons("c1", 0, 5, 0, 10, 20, 0, 2 * _np.pi, reg, nslice=64),
+            130,
+            None,
+        ),
+        (
+            pyg4ometry.geant4.solid.Sphere(
+                "s1", 0, 10, 0, 2 * _np.pi, 0, _np.pi, reg, nslice=64, nstack=64
+            ),
+            63 * 64 + 2,
+            4 / 3 * _np.pi * 1000,
+        ),
+        (
+            pyg4ometry.geant4.solid.Sphere(
+                "s2", 5, 10, 0, _np.pi, 0, _np.pi / 2, reg, nslice=64, nstack=64
+            ),
+            None,
+            1 / 3 * _np.pi * (1000 - 125),
+        ),
+        (pyg4ometry.geant4.solid.Orb("o1", 10, reg, nslice=64, nstack=64), 63 * 64 + 2, None),
+        (
+            pyg4ometry.geant4.solid.Torus("to1", 2, 5, 20, 0, _np.pi, reg, nslice=64, nstack=64),
+            2 * 64 * 65,
+            _np.pi**2 * 20 * (25 - 4),
+        ),
+    ]
+
+    for solid, nVertex, volume in solids:
+        m = solid.mesh()
+        assert m.isClosed(), solid.name
+        assert m.isOutwardOriented(), solid.name
+        if nVertex is not None:
+            assert m.vertexCount() == nVertex, solid.name
+        if volume is not None:
+            assert abs(m.volume() / volume - 1) < 0.01, solid.name
+
+
+def test_Python_LazyMesh():
+    import pyg4ometry
+
+    reg = pyg4ometry.geant4.Registry()
+    ws = pyg4ometry.geant4.solid.Box("ws", 100, 100, 100, reg)
+    bs = pyg4ometry.geant4.solid.Box("bs", 10, 10, 10, reg)
+    wl = pyg4ometry.geant4.LogicalVolume(ws, "G4_Galactic", "wl", reg)
+    bl = pyg4ometry.geant4.LogicalVolume(bs, "G4_Fe", "bl", reg)
+    pyg4ometry.geant4.PhysicalVolume([0, 0, 0], [0, 0, 0], bl, "b_pv1", wl, reg)
+
+    # nothing is meshed until a mesh is used
+    assert not wl.meshed
+    assert not bl.meshed
+    assert wl.extent() == [[-5, -5, -5], [5, 5, 5]]
+    assert bl.meshed
+    assert not wl.meshed
+
+    # changing the solid discards the mesh
+    bl.setSolid(pyg4ometry.geant4.solid.Box("bs2", 20, 20, 20, reg))
+    assert not bl.meshed
+    assert bl.mesh.getBoundingBox()[1] == [10, 10, 10]
+
+    reg.meshAll()
+    assert wl.meshed
+    assert bl.meshed
+
+
+def test_Python_MeshAllParallel():
+    import pyg4ometry
+
+    reg = pyg4ometry.geant4.Registry()
+    ws = pyg4ometry.geant4.solid.Box("ws", 100, 100, 100, reg)
+    b1 = pyg4ometry.geant4.solid.Box("b1", 10, 10, 10, reg)
+    b2 = pyg4ometry.geant4.solid.Box("b2", 10, 10, 10, reg)
+    ts = pyg4ometry.geant4.solid.Tubs("ts", 0, 10, 20, 0, 2 * _np.pi, reg)
+    lvs = [
+        pyg4ometry.geant4.LogicalVolume(ws, "G4_Galactic", "wl", reg),
+        pyg4ometry.geant4.LogicalVolume(b1, "G4_Fe", "bl1", reg),
+        pyg4ometry.geant4.LogicalVolume(b2, "G4_Fe", "bl2", reg),
+        pyg4ometry.geant4.LogicalVolume(ts, "G4_Fe", "tl", reg),
+    ]
+
+    reg.meshAll(nProcesses=2)
+    assert all(lv.meshed for lv in lvs)
+
+    # identical solids share one mesh but not the same object
+    assert lvs[1].mesh.localmesh is not lvs[2].mesh.localmesh
+    assert lvs[1].mesh.getBoundingBox() == lvs[2].mesh.getBoundingBox() == [[-5] * 3, [5] * 3]
+    assert lvs[3].mesh.localmesh.vertexCount() == ts.mesh().vertexCount()
+
+
+def test_Python_MultiUnionBalanced():
+    import pyg4ometry
+    from pyg4ometry.geant4.solid.MultiUnion import unionMeshes
+    from pyg4ometry.visualisation import _getBoundingBox
+
+    reg = pyg4ometry.geant4.Registry()
+    b = pyg4ometry.geant4.solid.Box("b", 10, 10, 10, reg)
+
+    # a chain of overlapping boxes and two separate ones
+    positions = [[7 * i, 0, 0] for i in range(7)] + [[0, 100, 0], [0, -100, 0]]
+    mu = pyg4ometry.geant4.solid.MultiUnion(
+        "mu", [b] * len(positions), [[[0, 0, 0], p] for p in positions], reg
+    )
+    m = mu.mesh()
+
+    sequential = None
+    for p in positions:
+        bm = b.mesh()
+        bm.translate(p)
+        sequential = bm if sequential is None else sequential.union(bm)
+
+    assert _getBoundingBox(m) == _getBoundingBox(sequential)
+    assert m.polygonCount() > 0
+
+    # a single mesh is returned unchanged
+    single = b.mesh()
+    assert unionMeshes([single]) is single
+
+
 def test_Python_ExceptionNullMeshErrorIntersection():
     import pyg4ometry
 
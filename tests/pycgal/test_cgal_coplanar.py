@@ -0,0 +1,39 @@
+import pyg4ometry.pycgal as _cgal
+
+
+def test_cgal_coplanar_touching():
+    # boxes sharing the x = 1 face
+    c1 = _cgal.CSG.cube([0, 0, 0], [1, 1, 1])
+    c2 = _cgal.CSG.cube([2, 0, 0], [1, 1, 1])
+
+    c = c1.coplanarIntersection(c2)
+
+    # the two triangles of each of the shared faces
+    assert c.polygonCount() == 4
+    for v in c.toVerticesAndPolygons()[0]:
+        assert abs(v[0] - 1) < 1e-9
+
+
+def test_cgal_coplanar_separated():
+    c1 = _cgal.CSG.cube([0, 0, 0], [1, 1, 1])
+    c2 = _cgal.CSG.cube([2.5, 0, 0], [1, 1, 1])
+    assert c1.coplanarIntersection(c2).polygonCount() == 0
+
+
+def test_cgal_coplanar_edge_only():
+    # boxes only touching along an edge have no coplanar overlap
+    c1 = _cgal.CSG.cube([0, 0, 0], [1, 1, 1])
+    c2 = _cgal.CSG.cube([2, 2, 0], [1, 1, 1])
+    assert c1.coplanarIntersection(c2).polygonCount() == 0
+
+
+def test_cgal_coplanar_inside_face():
+    # small box sitting on the top face of a large box (same orientation as
+    # the daughter-mother check)
+    c1 = _cgal.CSG.cube([0, 0, 0], [10, 10, 10])
+    c2 = _cgal.CSG.cube([0, 0, 9], [1, 1, 1])
+
+    c = c1.coplanarIntersection(c2)
+    assert c.polygonCount() > 0
+    for v in c.toVerticesAndPolygons()[0]:
+        assert abs(v[2] - 10) < 1e-9
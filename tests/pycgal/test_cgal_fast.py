@@ -0,0 +1,30 @@
+import pyg4ometry
+import pyg4ometry.pycgal as _cgal
+
+
+def test_cgal_fast_kernel():
+    meshing = pyg4ometry.config.meshing
+    pyg4ometry.config.meshing = pyg4ometry.config.meshingType.cgal_sm_fast
+
+    try:
+        c1 = _cgal.CSG.cube([0, 0, 0], [1, 1, 1])
+        c2 = _cgal.CSG.cube([0, 0, 0], [1, 1, 1])
+        assert not c1.isExact()
+
+        # transforms stay in the inexact kernel
+        c2.translate([1, 0, 0])
+        c2.rotate([0, 0, 1], 90)
+        c2.scale([1, 1, 1])
+        assert not c2.isExact()
+        assert not c2.clone().isExact()
+
+        # booleans are computed with the exact kernel
+        u = c1.union(c2)
+        assert u.isExact()
+        assert abs(u.volume() - 12) < 1e-9
+        assert _cgal.core.do_intersect(c1, u)
+        assert c1.toExact().isExact()
+    finally:
+        pyg4ometry.config.meshing = meshing
+
+    assert _cgal.CSG.cube([0, 0, 0], [1, 1, 1]).isExact()
@@ -0,0 +1,11 @@
+import pyg4ometry.pycgal as _cgal
+
+
+def test_cgal_intersecting_meshes():
+    cubes = [
+        _cgal.CSG.cube([0, 0, 0], [1, 1, 1]),
+        _cgal.CSG.cube([1.5, 0, 0], [1, 1, 1]),  # overlaps 0
+        _cgal.CSG.cube([10, 0, 0], [1, 1, 1]),  # far from 0 and 1
+        _cgal.CSG.cube([10, 0, 0], [0.5, 0.5, 0.5]),  # inside 2
+    ]
+    assert _cgal.core.intersecting_meshes(cubes) == [(0, 1), (2, 3)]
@@ -0,0 +1,66 @@
+import numpy as _np
+import pytest
+
+import pyg4ometry.pycgal as _cgal
+from pyg4ometry.pycsg.core import CSG as _pycsgCSG
+
+
+def test_cgal_numpy_roundtrip():
+    c = _cgal.CSG.cube([1, 2, 3], [1, 2, 3])
+
+    vertices, connectivity, offsets = c.toNumpy()
+    assert vertices.dtype == _np.float64
+    assert vertices.shape == (8, 3)
+    assert connectivity.dtype == _np.int32
+    assert len(offsets) == c.polygonCount() + 1
+
+    verts, polys, _ = c.toVerticesAndPolygons()
+    assert _np.array_equal(vertices, _np.array(verts))
+    assert connectivity.tolist() == [i for p in polys for i in p]
+
+    c2 = _cgal.CSG.fromNumpy(vertices, connectivity, offsets)
+    assert c2.polygonCount() == c.polygonCount()
+    assert abs(c2.volume() - c.volume()) < 1e-9
+
+    # triangles as a 2D array
+    c3 = _cgal.CSG.fromNumpy(vertices, connectivity.reshape(-1, 3))
+    assert c3.polygonCount() == c.polygonCount()
+
+
+def test_cgal_numpy_invalid():
+    vertices, connectivity, offsets = _cgal.CSG.cube([1, 2, 3], [1, 2, 3]).toNumpy()
+
+    # vertex index out of range
+    bad = connectivity.copy()
+    bad[0] = len(vertices)
+    with pytest.raises(ValueError, match="vertex index out of range"):
+        _cgal.CSG.fromNumpy(vertices, bad, offsets)
+
+    # offsets beyond the connectivity
+    bad = offsets.copy()
+    bad[-1] += 3
+    with pytest.raises(ValueError, match="offsets out of range"):
+        _cgal.CSG.fromNumpy(vertices, connectivity, bad)
+
+    # the same polygon twice is non-manifold
+    n = offsets[1] - offsets[0]
+    with pytest.raises(ValueError, match="cannot be added"):
+        _cgal.CSG.fromNumpy(
+            vertices,
+            _np.concatenate([connectivity, connectivity[:n]]),
+            _np.append(offsets, offsets[-1] + n),
+        )
+
+
+def test_pycsg_numpy_roundtrip():
+    c = _pycsgCSG.cube([1, 2, 3], [1, 2, 3])
+
+    vertices, connectivity, offsets = c.toNumpy()
+    verts, polys, _ = c.toVerticesAndPolygons()
+    assert _np.allclose(vertices, _np.array(verts))
+    assert connectivity.tolist() == [i for p in polys for i in p]
+    assert offsets.tolist() == [4 * i for i in range(7)]
+
+    c2 = _pycsgCSG.fromNumpy(vertices, connectivity, offsets)
+    assert c2.polygonCount() == c.polygonCount()
+    assert c2.vertexCount() == c.vertexCount()
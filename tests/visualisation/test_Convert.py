@@ -57,3 +57,28 @@ def test_Convert_vtkTransformation2PyG4(testdata, tmptestdir):
     vt = _vtk.vtkTransform()
 
     [rot, tra] = _pyg4.visualisation.vtkTransformation2PyG4(vt)
+
+
+def test_Convert_numpyToVtkPolyData():
+    reg = _g4.Registry()
+    bs = _g4.solid.Box("bs", 10, 10, 10, reg, "mm")
+    vertices, connectivity, offsets = bs.mesh().toNumpy()
+
+    pd = _vis.numpyToVtkPolyData(vertices, connectivity, offsets)
+    assert pd.GetNumberOfPoints() == len(vertices)
+    assert pd.GetNumberOfCells() == len(offsets) - 1
+    assert list(pd.GetBounds()) == [-5, 5, -5, 5, -5, 5]
+
+    # cut the box and get the ordered points of the contour
+    plane = _vtk.vtkPlane()
+    plane.SetOrigin(0, 0, 0)
+    plane.SetNormal(0, 0, 1)
+    cutter = _vtk.vtkCutter()
+    cutter.SetCutFunction(plane)
+    cutter.SetInputData(pd)
+    cutter.Update()
+
+    contours = _vis.vtkPolyDataToNumpy(cutter.GetOutput())
+    assert len(contours) == 1
+    assert _np.allclose(contours[0][:, 2], 0)
+    assert _np.allclose(_np.abs(contours[0][:, :2]).max(axis=1), 5)
@@ -150,6 +150,64 @@ def test_VtkViewerNewAppend(testdata, tmptestdir):
     v.exportGLTFScene(tmptestdir / "test.gltf")
 
 
+def test_VtkViewerNewInstanced(testdata, tmptestdir):
+    r = _pyg4.gdml.Reader(testdata["gdml/T106_replica_x.gdml"])
+    v = _pyg4.visualisation.VtkViewerNew()
+    v.addLogicalVolume(r.getRegistry().getWorldVolume())
+
+    v.addCutter("c1", [0, 0, 0], [0, 0, 1])
+    v.addClipper([0, 0, 0], [1, 0, 0])
+
+    v.buildPipelinesInstanced()
+
+    # one polydata per distinct mesh shared by the actors of its placements
+    nPlacements = sum(len(ips) for ips in v.instancePlacements.values())
+    assert len(v.instanceActors) == nPlacements
+    assert len(v.polydata) == len(v.localmeshes) < nPlacements
+
+    v.setCutter("c1", [0, 0, 0], [0, 0, 1])
+    v.setClipper([0, 0, 0], [0, 1, 0])
+    v.exportCutter("c1", tmptestdir / "cutter.vtp")
+    v.getCutterPolydata("c1")
+
+
+def test_VtkViewerNewLOD():
+    reg = _pyg4.geant4.Registry()
+    ws = _pyg4.geant4.solid.Box("ws", 1e6, 1e6, 1e6, reg)
+    ts = _pyg4.geant4.solid.Tubs("ts", 0, 10, 20, 0, 2 * 3.141592653589793, reg, nslice=64)
+    wl = _pyg4.geant4.LogicalVolume(ws, "G4_Galactic", "wl", reg)
+    tl = _pyg4.geant4.LogicalVolume(ts, "G4_Fe", "tl", reg)
+    _pyg4.geant4.PhysicalVolume([0, 0, 0], [0, 0, 0], tl, "t1", wl, reg)
+    _pyg4.geant4.PhysicalVolume([0, 0, 0], [4e5, 0, 0], tl, "t2", wl, reg)
+    reg.setWorld(wl)
+
+    v = _pyg4.visualisation.VtkViewerNew(defaultCutters=False, axisCubeWidget=False)
+    v.addLogicalVolume(wl)
+    v.buildPipelinesLOD(minimumTriangles=100)
+
+    def state():
+        names = [v.instanceActors[a][1]["name"] for a in v.lod["actors"]]
+        return dict(zip(names, zip(v.lod["visible"], v.lod["levels"])))
+
+    camera = v.ren.GetActiveCamera()
+    camera.SetFocalPoint(0, 0, 0)
+
+    # close to t1: full resolution, t2 is outside the view
+    camera.SetPosition(0, 0, 100)
+    v._updateLOD()
+    assert state()["t1"] == (True, 0)
+    assert not state()["t2"][0]
+
+    # further away the most decimated level is used and then t1 is culled
+    camera.SetPosition(0, 0, 2000)
+    v._updateLOD()
+    assert state()["t1"] == (True, 2)
+
+    camera.SetPosition(0, 0, 1e5)
+    v._updateLOD()
+    assert not state()["t1"][0]
+
+
 def test_VtkViewerColouredNewAppend(testdata, tmptestdir):
     r = _pyg4.gdml.Reader(testdata["gdml/T001_Box.gdml"])
     v = _pyg4.visualisation.VtkViewerColouredNew()